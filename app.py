@@ -7,16 +7,21 @@ import sys
 # Adicionar o diretório raiz ao path para importar módulos
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database.connection import init_db, get_project_statistics, get_all_projects, get_unread_notifications
+from database.connection import ensure_db_initialized
+from database.cache import get_project_statistics, get_all_projects
 from utils.helpers import format_status
 from utils.ui import apply_custom_styles, render_sidebar
 
 # Carregar variáveis de ambiente
 load_dotenv()
 
-# Inicializar o banco de dados na inicialização
+# Inicializar o banco de dados uma vez por processo (não a cada interação); as rotinas de
+# manutenção devidas rodam em segundo plano, com no máximo uma verificação a cada
+# DUE_CHECK_INTERVAL_SECONDS, para que um servidor de longa duração continue executando-as
 try:
-    init_db()
+    ensure_db_initialized()
+    from database.maintenance import start_due_maintenance
+    start_due_maintenance()
 except Exception as e:
     st.error(f"Erro ao inicializar o banco de dados: {e}")
 
@@ -2,64 +2,99 @@
 """
 Componente para exibir a linha do tempo de plataformas de um projeto
 """
-import streamlit as st
+from collections import OrderedDict
+from html import escape
 
-def render_project_timeline(platform_history):
+from database.connection import get_db_path, get_write_generation
+from database.cache import get_project_platforms_history
+
+# Quantidade de entradas exibidas antes de recolher o histórico
+MAX_VISIBLE_ENTRIES = 12
+# Entradas mais antigas que permanecem visíveis quando o histórico é recolhido
+HEAD_ENTRIES = 2
+# Número máximo de linhas do tempo renderizadas mantidas em cache
+_TIMELINE_CACHE_SIZE = 64
+
+_timeline_cache = OrderedDict()
+
+def _render_entry(position, platform):
+    """Gera o HTML de uma entrada da linha do tempo"""
+    description = platform.get('description') or '-'
+    return (
+        '<div class="timeline-event">'
+        f'<h5 style="color: #6B46C1; margin-bottom: 5px;">{position}. {escape(str(platform["platform_name"]))}</h5>'
+        f'<p style="margin: 5px 0;"><strong>Data:</strong> {escape(str(platform["assigned_date"]))}</p>'
+        f'<p style="margin: 5px 0;"><strong>Descrição:</strong> {escape(str(description))}</p>'
+        '</div>'
+    )
+
+def build_timeline_html(platform_history, max_visible=MAX_VISIBLE_ENTRIES):
+    """
+    Gera um único bloco HTML com a linha do tempo de plataformas
+
+    O histórico já chega ordenado por data (ORDER BY na consulta), então é percorrido uma
+    única vez. Históricos longos mantêm visíveis as primeiras e as últimas entradas e
+    recolhem as intermediárias em um elemento <details>.
+
+    Args:
+        platform_history: Lista de dicionários ordenada por data de atribuição
+        max_visible: Número máximo de entradas exibidas sem recolher (no mínimo
+            HEAD_ENTRIES + 1)
+
+    Returns:
+        String HTML da linha do tempo
+    """
+    max_visible = max(max_visible, HEAD_ENTRIES + 1)
+    total = len(platform_history)
+    collapse = total > max_visible
+    tail_start = total - (max_visible - HEAD_ENTRIES) if collapse else total
+
+    parts = ['<div class="project-timeline">']
+    for position, platform in enumerate(platform_history, start=1):
+        if collapse and position == HEAD_ENTRIES + 1:
+            parts.append(
+                '<details style="margin-bottom: 15px;">'
+                f'<summary>{tail_start - HEAD_ENTRIES} mudanças anteriores ocultas</summary>'
+            )
+        parts.append(_render_entry(position, platform))
+        if collapse and position == tail_start:
+            parts.append('</details>')
+    parts.append('</div>')
+    return ''.join(parts)
+
+def get_timeline_html(project_id):
+    """
+    Retorna o HTML da linha do tempo de um projeto, ou None se não houver plataformas
+
+    A renderização fica em cache por projeto e pela geração de escrita de project_platforms
+    e platforms: enquanto nenhuma das duas tabelas muda, a reexecução da página custa apenas
+    a leitura das gerações.
+    """
+    cache_key = (get_db_path(), project_id, get_write_generation('project_platforms', 'platforms'))
+    if cache_key in _timeline_cache:
+        _timeline_cache.move_to_end(cache_key)
+        return _timeline_cache[cache_key]
+
+    platform_history = get_project_platforms_history(project_id)
+    timeline_html = build_timeline_html(platform_history) if platform_history else None
+    _timeline_cache[cache_key] = timeline_html
+    if len(_timeline_cache) > _TIMELINE_CACHE_SIZE:
+        _timeline_cache.popitem(last=False)
+    return timeline_html
+
+def render_project_timeline(project_id):
     """
     Renderiza a linha do tempo de plataformas de um projeto
-    
+
     Args:
-        platform_history: Lista de dicionários com informações de plataforma
+        project_id: ID do projeto
     """
-    if not platform_history:
+    # Importado aqui para que o módulo possa ser usado sem o Streamlit
+    import streamlit as st
+
+    timeline_html = get_timeline_html(project_id)
+    if timeline_html is None:
         st.info("Nenhuma plataforma registrada para este projeto.")
         return
-    
-    # Ordenar por data de atribuição
-    sorted_history = sorted(platform_history, key=lambda x: x['assigned_date'])
-    
-    # Container para a linha do tempo
-    with st.container():
-        for i, platform in enumerate(sorted_history):
-            # Card para cada plataforma
-            with st.container():
-                col1, col2 = st.columns([1, 4])
-                
-                with col1:
-                    # Indicador de posição na linha do tempo
-                    st.markdown(
-                        f"""
-                        <div style="
-                            width: 30px;
-                            height: 30px;
-                            border-radius: 50%;
-                            background-color: #6B46C1;
-                            color: white;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            font-weight: bold;
-                            margin: 10px 0;
-                        ">
-                            {i+1}
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
-                
-                with col2:
-                    st.markdown(
-                        f"""
-                        <div style="
-                            border-left: 3px solid #6B46C1;
-                            padding-left: 20px;
-                            margin-left: 15px;
-                            padding-bottom: 15px;
-                        ">
-                            <h5 style="color: #6B46C1; margin-bottom: 5px;">{platform['platform_name']}</h5>
-                            <p style="margin: 5px 0;"><strong>Data:</strong> {platform['assigned_date']}</p>
-                            <p style="margin: 5px 0;"><strong>Descrição:</strong> {platform.get('description', '-')}</p>
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
\ No newline at end of file
+
+    st.markdown(timeline_html, unsafe_allow_html=True)
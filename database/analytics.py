@@ -0,0 +1,391 @@
+# database/analytics.py
+"""
+Análises e séries para relatórios do DevFlow Manager
+"""
+from datetime import date, timedelta
+
+from .connection import get_db_connection, get_db_path, get_write_generation
+
+# Número de projetos ativos simultâneos acima do qual uma pessoa é considerada sobrecarregada
+DEFAULT_CAPACITY_THRESHOLD = 3
+
+# Resultados em cache por análise, indexados por banco e geração de escrita das tabelas lidas
+_analytics_cache = {}
+
+def _cached(name, table_names, compute):
+    """Retorna o resultado em cache da análise ou o recalcula se as tabelas mudaram"""
+    cache_key = (get_db_path(), get_write_generation(*table_names))
+    cached = _analytics_cache.get(name)
+    if cached and cached[0] == cache_key:
+        return cached[1]
+    result = compute()
+    _analytics_cache[name] = (cache_key, result)
+    return result
+
+def _percentile(sorted_values, fraction):
+    """Percentil com interpolação linear sobre uma lista já ordenada"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def get_platform_migration_stats():
+    """
+    Retorna a matriz de transição entre plataformas e o tempo de permanência em cada uma
+
+    Registros consecutivos com a mesma plataforma em um projeto formam um único período.
+    A permanência só é contabilizada para períodos encerrados (seguidos de uma migração);
+    os períodos em aberto aparecem em 'current_projects'.
+    """
+    return _cached('platform_migration', ('project_platforms', 'platforms'), _compute_platform_migration_stats)
+
+def _compute_platform_migration_stats():
+    """Calcula as estatísticas de migração de plataformas a partir do histórico"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            WITH ordered AS (
+                SELECT project_id, platform_id, assigned_date, id,
+                       LAG(platform_id) OVER (PARTITION BY project_id ORDER BY assigned_date, id) AS previous_platform_id
+                FROM project_platforms
+            ),
+            stints AS (
+                SELECT platform_id, previous_platform_id, assigned_date,
+                       LEAD(assigned_date) OVER (PARTITION BY project_id ORDER BY assigned_date, id) AS next_date
+                FROM ordered
+                WHERE previous_platform_id IS NULL OR previous_platform_id != platform_id
+            )
+            SELECT cur.name AS platform_name, prev.name AS previous_platform_name,
+                   julianday(s.next_date) - julianday(s.assigned_date) AS dwell_days
+            FROM stints s
+            JOIN platforms cur ON cur.id = s.platform_id
+            LEFT JOIN platforms prev ON prev.id = s.previous_platform_id
+        """)
+        rows = cursor.fetchall()
+
+    transitions = {}
+    dwell_days = {}
+    current_projects = {}
+    for row in rows:
+        platform_name = row['platform_name']
+        if row['previous_platform_name'] is not None:
+            key = (row['previous_platform_name'], platform_name)
+            transitions[key] = transitions.get(key, 0) + 1
+        if row['dwell_days'] is None:
+            current_projects[platform_name] = current_projects.get(platform_name, 0) + 1
+        else:
+            dwell_days.setdefault(platform_name, []).append(row['dwell_days'])
+
+    platforms = sorted({name for pair in transitions for name in pair})
+    index = {name: i for i, name in enumerate(platforms)}
+    matrix = [[0] * len(platforms) for _ in platforms]
+    for (source, target), count in transitions.items():
+        matrix[index[source]][index[target]] = count
+
+    dwell_stats = []
+    for platform_name in sorted(set(dwell_days) | set(current_projects)):
+        values = sorted(dwell_days.get(platform_name, []))
+        dwell_stats.append({
+            'platform_name': platform_name,
+            'closed_stints': len(values),
+            'median_days': _percentile(values, 0.5),
+            'p90_days': _percentile(values, 0.9),
+            'current_projects': current_projects.get(platform_name, 0)
+        })
+
+    return {
+        'platforms': platforms,
+        'transition_matrix': matrix,
+        'transitions': [{'from': source, 'to': target, 'count': count}
+                        for (source, target), count in sorted(transitions.items(), key=lambda item: -item[1])],
+        'dwell_stats': dwell_stats
+    }
+
+def _month_range(first_month, last_month):
+    """Gera os meses (YYYY-MM) entre dois meses, inclusive"""
+    year, month = map(int, first_month.split('-'))
+    last_year, last = map(int, last_month.split('-'))
+    while (year, month) <= (last_year, last):
+        yield f"{year:04d}-{month:02d}"
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+def get_monthly_project_series(start_month=None, end_month=None, by_type=False):
+    """
+    Retorna séries mensais de projetos prontas para gráficos do Plotly
+
+    Lê a tabela de fatos project_monthly_stats (mantida por triggers), sem reagrupar a tabela
+    de projetos. 'active' é o saldo acumulado de projetos iniciados menos encerrados ao fim
+    de cada mês. Meses sem movimento são preenchidos com zero.
+
+    Args:
+        start_month: Primeiro mês (YYYY-MM) do resultado, opcional
+        end_month: Último mês (YYYY-MM) do resultado, opcional
+        by_type: Se True, retorna uma série por tipo de projeto (coluna 'project_type')
+
+    Returns:
+        Dicionário de listas com as colunas 'month', 'created', 'completed', 'cancelled',
+        'active' e, quando by_type=True, 'project_type'
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT f.month, COALESCE(pt.name, 'Sem tipo') AS type_name,
+                   SUM(f.created_count) AS created, SUM(f.completed_count) AS completed,
+                   SUM(f.cancelled_count) AS cancelled
+            FROM project_monthly_stats f
+            LEFT JOIN project_types pt ON pt.id = f.project_type_id
+            GROUP BY f.month, type_name
+            ORDER BY f.month
+        """)
+        rows = cursor.fetchall()
+
+    columns = ['month', 'created', 'completed', 'cancelled', 'active']
+    if by_type:
+        columns.append('project_type')
+    series = {column: [] for column in columns}
+    if not rows:
+        return series
+
+    buckets = {}
+    for row in rows:
+        group = row['type_name'] if by_type else None
+        counts = buckets.setdefault((row['month'], group), [0, 0, 0])
+        counts[0] += row['created']
+        counts[1] += row['completed']
+        counts[2] += row['cancelled']
+
+    groups = sorted({group for _, group in buckets}, key=lambda g: g or '')
+    last_month = max(rows[-1]['month'], end_month or rows[-1]['month'])
+    for group in groups:
+        active = 0
+        for month in _month_range(rows[0]['month'], last_month):
+            created, completed, cancelled = buckets.get((month, group), (0, 0, 0))
+            active += created - completed - cancelled
+            if (start_month and month < start_month) or (end_month and month > end_month):
+                continue
+            series['month'].append(month)
+            series['created'].append(created)
+            series['completed'].append(completed)
+            series['cancelled'].append(cancelled)
+            series['active'].append(active)
+            if by_type:
+                series['project_type'].append(group)
+    return series
+
+def get_status_cycle_metrics():
+    """
+    Retorna métricas de tempo por status e de ciclo por tipo de projeto
+
+    Calculadas em SQL sobre project_status_history:
+    - time_in_status: dias médios e totais em cada status (apenas períodos encerrados)
+    - cycle_times: por tipo, tempo médio de ciclo (primeira entrada em "Em Desenvolvimento"
+      até "Concluído") e de lead time (criação até "Concluído")
+    """
+    return _cached('status_cycle', ('projects', 'project_types'), _compute_status_cycle_metrics)
+
+def _compute_status_cycle_metrics():
+    """Calcula as métricas de tempo por status a partir do histórico de status"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            WITH periods AS (
+                SELECT project_id, new_status AS status,
+                       julianday(LEAD(changed_at) OVER (PARTITION BY project_id ORDER BY changed_at, id))
+                           - julianday(changed_at) AS days
+                FROM project_status_history
+            )
+            SELECT COALESCE(pt.name, 'Sem tipo') AS type_name, pr.status,
+                   COUNT(*) AS periods, AVG(pr.days) AS avg_days, SUM(pr.days) AS total_days
+            FROM periods pr
+            JOIN projects p ON p.id = pr.project_id
+            LEFT JOIN project_types pt ON pt.id = p.project_type_id
+            WHERE pr.days IS NOT NULL
+            GROUP BY type_name, pr.status
+            ORDER BY type_name, pr.status
+        """)
+        time_in_status = [{'project_type_name': row['type_name'], 'status': row['status'],
+                           'periods': row['periods'], 'avg_days': row['avg_days'],
+                           'total_days': row['total_days']}
+                          for row in cursor.fetchall()]
+
+        cursor.execute("""
+            WITH milestones AS (
+                SELECT project_id,
+                       MIN(changed_at) AS created_at,
+                       MIN(CASE WHEN new_status = 'Em Desenvolvimento' THEN changed_at END) AS started_at,
+                       MIN(CASE WHEN new_status = 'Concluído' THEN changed_at END) AS completed_at
+                FROM project_status_history
+                GROUP BY project_id
+            )
+            SELECT COALESCE(pt.name, 'Sem tipo') AS type_name,
+                   COUNT(*) AS completed_projects,
+                   AVG(CASE WHEN m.started_at <= m.completed_at
+                            THEN julianday(m.completed_at) - julianday(m.started_at) END) AS avg_cycle_days,
+                   AVG(julianday(m.completed_at) - julianday(m.created_at)) AS avg_lead_days
+            FROM milestones m
+            JOIN projects p ON p.id = m.project_id
+            LEFT JOIN project_types pt ON pt.id = p.project_type_id
+            WHERE m.completed_at IS NOT NULL
+            GROUP BY type_name
+            ORDER BY type_name
+        """)
+        cycle_times = [{'project_type_name': row['type_name'], 'completed_projects': row['completed_projects'],
+                        'avg_cycle_days': row['avg_cycle_days'], 'avg_lead_days': row['avg_lead_days']}
+                       for row in cursor.fetchall()]
+
+    return {'time_in_status': time_in_status, 'cycle_times': cycle_times}
+
+def _to_date(value):
+    """Converte 'YYYY-MM-DD' (ou datetime do SQLite) para date; date e None passam direto"""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def _compute_collaborator_events():
+    """
+    Monta, por pessoa, a lista ordenada de eventos de início (+1) e fim (-1) de projeto
+
+    O fim é contado no dia seguinte à data de término (o último dia ainda é ativo). Projetos
+    concluídos ou cancelados sem data de término terminam na última atualização; os demais
+    sem término ficam em aberto. A ordenação, O(n log n), é feita uma vez por geração de dados.
+    Linhas com datas fora do formato ISO (dados legados como '01/02/2024') são ignoradas e
+    contadas em um aviso no log.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT pe.id AS person_id, pe.name AS person_name, p.start_date,
+                   COALESCE(p.end_date,
+                            CASE WHEN p.status IN ('Concluído', 'Cancelado') THEN date(p.updated_at) END) AS end_date
+            FROM people pe
+            JOIN project_collaborators c ON c.person_id = pe.id
+            JOIN projects p ON p.id = c.project_id
+        """)
+        rows = cursor.fetchall()
+
+    people = {}
+    skipped = 0
+    for row in rows:
+        try:
+            start = _to_date(row['start_date'])
+            end = _to_date(row['end_date'])
+        except ValueError:
+            skipped += 1
+            continue
+        if start is None or (end is not None and end < start):
+            continue
+        person = people.setdefault(row['person_id'], {'name': row['person_name'], 'events': []})
+        person['events'].append((start, 1))
+        if end is not None:
+            person['events'].append((end + timedelta(days=1), -1))
+
+    if skipped:
+        import logging
+        logging.getLogger(__name__).warning(
+            "Capacidade de colaboradores: %d participação(ões) ignorada(s) por datas inválidas", skipped
+        )
+
+    for person in people.values():
+        person['events'].sort()
+    return people
+
+def _sweep(events, range_start, range_end):
+    """
+    Percorre os eventos ordenados e retorna a curva em degraus dentro do intervalo
+
+    Returns:
+        Lista de (data, projetos simultâneos) com um ponto no início do intervalo e um a cada
+        mudança de nível, sempre terminando em range_end
+    """
+    level = 0
+    index = 0
+    while index < len(events) and events[index][0] <= range_start:
+        level += events[index][1]
+        index += 1
+
+    points = [(range_start, level)]
+    while index < len(events) and events[index][0] <= range_end:
+        current = events[index][0]
+        while index < len(events) and events[index][0] == current:
+            level += events[index][1]
+            index += 1
+        if level != points[-1][1]:
+            points.append((current, level))
+    if points[-1][0] != range_end:
+        points.append((range_end, level))
+    return points
+
+def _overload_periods(points, threshold):
+    """Extrai da curva os períodos em que o nível passa do limite, com o pico de cada um"""
+    periods = []
+    current = None
+
+    def close(end):
+        periods.append({
+            'start': current['start'].isoformat(),
+            'end': end.isoformat(),
+            'days': (end - current['start']).days + 1,
+            'peak': current['peak']
+        })
+
+    for day, level in points:
+        if level > threshold:
+            if current is None:
+                current = {'start': day, 'peak': level}
+            current['peak'] = max(current['peak'], level)
+        elif current is not None:
+            close(day - timedelta(days=1))
+            current = None
+    if current is not None:
+        close(points[-1][0])
+    return periods
+
+def get_collaborator_capacity(start_date=None, end_date=None, threshold=DEFAULT_CAPACITY_THRESHOLD):
+    """
+    Retorna a curva de projetos ativos simultâneos de cada pessoa e seus períodos de sobrecarga
+
+    Os eventos de início/fim por pessoa ficam em cache até a próxima escrita em projetos ou
+    colaboradores; cada consulta é então uma varredura linear sobre eventos já ordenados.
+
+    Args:
+        start_date: Início do intervalo (YYYY-MM-DD); padrão: 180 dias atrás
+        end_date: Fim do intervalo (YYYY-MM-DD); padrão: daqui a 90 dias
+        threshold: Projetos simultâneos acima dos quais o período é de sobrecarga
+
+    Returns:
+        Dicionário com 'start_date', 'end_date', 'threshold' e 'people': lista (maior pico primeiro)
+        de dicionários com 'id', 'name', 'peak', 'curve' (colunas 'date' e 'concurrent', em
+        degraus) e 'overload_periods' (lista com 'start', 'end', 'days' e 'peak')
+    """
+    range_start = _to_date(start_date) or date.today() - timedelta(days=180)
+    range_end = _to_date(end_date) or date.today() + timedelta(days=90)
+    if range_end < range_start:
+        raise ValueError("A data final deve ser igual ou posterior à data inicial")
+
+    people = _cached('collaborator_events', ('people', 'project_collaborators', 'projects'),
+                     _compute_collaborator_events)
+
+    result = []
+    for person_id, person in people.items():
+        points = _sweep(person['events'], range_start, range_end)
+        result.append({
+            'id': person_id,
+            'name': person['name'],
+            'peak': max(level for _, level in points),
+            'curve': {
+                'date': [day.isoformat() for day, _ in points],
+                'concurrent': [level for _, level in points]
+            },
+            'overload_periods': _overload_periods(points, threshold)
+        })
+    result.sort(key=lambda person: (-person['peak'], person['name'].lower()))
+    return {
+        'start_date': range_start.isoformat(),
+        'end_date': range_end.isoformat(),
+        'threshold': threshold,
+        'people': result
+    }
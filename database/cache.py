@@ -0,0 +1,146 @@
+# database/cache.py
+"""
+Cache compartilhado das funções de leitura do DevFlow Manager
+
+Cada função de leitura é memorizada por tupla de argumentos em um cache do processo,
+compartilhado entre todas as sessões do Streamlit. As entradas são indexadas pela geração
+de escrita (tabela write_generations) das tabelas que a consulta lê: qualquer escrita em
+uma dessas tabelas, feita por esta aplicação ou por outro processo, invalida apenas as
+leituras que dependem dela.
+
+As gerações de escrita de todas as tabelas são lidas em uma única consulta e reutilizadas
+por até GENERATION_TTL segundos, de modo que um acerto não abre conexão com o banco. Escritas
+feitas por este processo descartam essa leitura na hora; escritas de outros processos
+aparecem em até GENERATION_TTL segundos.
+
+Um acerto devolve o mesmo objeto (lista, dicionário ou modelo) para todas as chamadas e
+sessões, sem cópia: alterar o resultado altera o que as próximas chamadas recebem. Quem
+precisar modificar um resultado deve copiá-lo antes (por exemplo, list(resultado)).
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+
+from . import connection
+
+# Número máximo de combinações de argumentos mantidas por função
+DEFAULT_MAXSIZE = 128
+# Segundos durante os quais as gerações de escrita lidas do banco são reutilizadas
+GENERATION_TTL = 2.0
+
+_lock = threading.Lock()
+_entries = {}
+_stats = {}
+# Por banco: (escritas locais, instante da leitura, {tabela: geração})
+_generations = {}
+
+def _get_generations(db_path, table_names):
+    """Gerações de escrita das tabelas, relidas só após GENERATION_TTL ou uma escrita local"""
+    write_count = connection.get_local_write_count()
+    now = time.monotonic()
+    with _lock:
+        snapshot = _generations.get(db_path)
+    if snapshot is None or snapshot[0] != write_count or now - snapshot[1] >= GENERATION_TTL:
+        # write_count foi lido antes da consulta: uma escrita concorrente força nova leitura
+        snapshot = (write_count, now, connection.get_all_write_generations())
+        with _lock:
+            _generations[db_path] = snapshot
+    return tuple(snapshot[2].get(name, 0) for name in table_names)
+
+def get_write_generations(*table_names):
+    """
+    Gerações de escrita das tabelas no banco atual, do mesmo instantâneo usado pelo cache
+
+    Não abre conexão enquanto o instantâneo for válido (ver GENERATION_TTL).
+    """
+    return _get_generations(connection.get_db_path(), table_names)
+
+def cached_query(table_names, maxsize=DEFAULT_MAXSIZE, depends_on_date=False):
+    """
+    Decorador que memoriza uma função de leitura até a próxima escrita nas tabelas informadas
+
+    Args:
+        table_names: Tabelas lidas pela função
+        maxsize: Número máximo de entradas (LRU) mantidas para a função
+        depends_on_date: Se True, o resultado também expira na virada do dia
+    """
+    def decorator(func):
+        name = func.__name__
+        _entries[name] = OrderedDict()
+        _stats[name] = {'hits': 0, 'misses': 0}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            db_path = connection.get_db_path()
+            key = (
+                db_path,
+                _get_generations(db_path, table_names),
+                date.today() if depends_on_date else None,
+                args,
+                tuple(sorted(kwargs.items()))
+            )
+            entries = _entries[name]
+            with _lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    _stats[name]['hits'] += 1
+                    return entries[key]
+                _stats[name]['misses'] += 1
+
+            result = func(*args, **kwargs)
+
+            with _lock:
+                entries[key] = result
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return result
+
+        return wrapper
+    return decorator
+
+def get_cache_stats():
+    """Retorna acertos, falhas e tamanho do cache por função"""
+    with _lock:
+        return {
+            name: {
+                'hits': stats['hits'],
+                'misses': stats['misses'],
+                'size': len(_entries[name])
+            }
+            for name, stats in _stats.items()
+        }
+
+def clear_cache():
+    """Descarta todas as entradas em cache e zera os contadores"""
+    with _lock:
+        _generations.clear()
+        for name in _entries:
+            _entries[name].clear()
+            _stats[name] = {'hits': 0, 'misses': 0}
+
+# Fachada de leitura: mesmas assinaturas das funções de database.connection
+get_all_project_types = cached_query(('project_types',))(connection.get_all_project_types)
+get_project_type_by_id = cached_query(('project_types',))(connection.get_project_type_by_id)
+get_all_platforms = cached_query(('platforms',))(connection.get_all_platforms)
+get_platform_by_id = cached_query(('platforms',))(connection.get_platform_by_id)
+get_project_type_usage_counts = cached_query(('project_types', 'projects'))(connection.get_project_type_usage_counts)
+get_platform_usage_counts = cached_query(('platforms', 'project_platforms'))(connection.get_platform_usage_counts)
+get_all_projects = cached_query(('projects', 'project_types'))(connection.get_all_projects)
+get_project_by_id = cached_query(('projects', 'project_types'))(connection.get_project_by_id)
+search_projects = cached_query(('projects', 'project_types'))(connection.search_projects)
+search_projects_faceted = cached_query(('projects', 'project_types', 'project_platforms'))(connection.search_projects_faceted)
+get_projects_page = cached_query(('projects', 'project_types'))(connection.get_projects_page)
+lookup_projects_by_name = cached_query(('projects',))(connection.lookup_projects_by_name)
+get_project_platforms_history = cached_query(('project_platforms', 'platforms'))(connection.get_project_platforms_history)
+get_project_status_history = cached_query(('projects',))(connection.get_project_status_history)
+get_project_collaborators = cached_query(('project_collaborators', 'people'))(connection.get_project_collaborators)
+get_all_people = cached_query(('people',))(connection.get_all_people)
+get_person_projects = cached_query(('project_collaborators', 'projects', 'project_types'))(connection.get_person_projects)
+get_people_workload = cached_query(('people', 'project_collaborators', 'projects'))(connection.get_people_workload)
+get_unread_notifications = cached_query(('notifications',))(connection.get_unread_notifications)
+get_recent_notifications = cached_query(('notifications',))(connection.get_recent_notifications)
+get_notifications_page = cached_query(('notifications',))(connection.get_notifications_page)
+get_project_statistics = cached_query(('projects', 'project_types'), depends_on_date=True)(connection.get_project_statistics)
+get_upcoming_project_deadlines = cached_query(('projects', 'project_types'), depends_on_date=True)(connection.get_upcoming_project_deadlines)
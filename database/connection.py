@@ -1,9 +1,11 @@
 # database/connection.py
 import sqlite3
 import os
+import base64
 from contextlib import contextmanager
-from datetime import datetime, timedelta
-import csv
+import re
+import threading
+from datetime import date, datetime, timedelta, timezone
 import json
 from .models import ProjectType, Platform, Project, ProjectPlatform
 
@@ -12,15 +14,46 @@ def get_db_path():
     db_name = os.environ.get('DB_NAME', 'devflow_manager.db')
     return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), db_name)
 
+# Número de conexões abertas pela camada de dados (uma por chamada de leitura/escrita),
+# usado para medir quantas consultas cada interação das páginas dispara
+_db_call_count = 0
+
+def get_db_call_count():
+    """Retorna quantas conexões ao banco foram abertas desde o início do processo"""
+    return _db_call_count
+
+# Número de escritas feitas por este processo (conexões que alteraram dados, init_db() e
+# restaurações); o cache de leitura relê as gerações de escrita quando ele muda
+_local_write_count = 0
+
+def get_local_write_count():
+    """Retorna quantas escritas este processo fez no banco desde o início"""
+    return _local_write_count
+
+def _note_local_write():
+    global _local_write_count
+    _local_write_count += 1
+
 @contextmanager
 def get_db_connection():
     """Obtém conexão com o banco de dados SQLite"""
+    global _db_call_count
+    _db_call_count += 1
     db_path = get_db_path()
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row  # Permite acessar colunas por nome
+    # O SQLite só aplica chaves estrangeiras (e o ON DELETE CASCADE) quando ativado por conexão
+    conn.execute("PRAGMA foreign_keys = ON")
     try:
         yield conn
     finally:
+        # Conexões que escreveram atualizam as estatísticas do planejador quando necessário
+        if conn.total_changes:
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            _note_local_write()
         conn.close()
 
 def init_db():
@@ -30,6 +63,8 @@ def init_db():
     
     # Conectar ao banco
     conn = sqlite3.connect(db_path)
+    # Só tem efeito em bancos novos; bancos existentes são migrados por database.maintenance
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
     
     # Ler e executar o script de criação
     with open(schema_path, 'r', encoding='utf-8') as f:
@@ -57,10 +92,275 @@ def init_db():
         added_at DATETIME DEFAULT CURRENT_TIMESTAMP,
         FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
     );
+    
+    INSERT OR IGNORE INTO write_generations (table_name) VALUES ('notifications'), ('project_collaborators');
+    
+    CREATE TRIGGER IF NOT EXISTS trg_notifications_generation_insert AFTER INSERT ON notifications
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'notifications';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_notifications_generation_update AFTER UPDATE ON notifications
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'notifications';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_notifications_generation_delete AFTER DELETE ON notifications
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'notifications';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_project_collaborators_generation_insert AFTER INSERT ON project_collaborators
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_collaborators';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_project_collaborators_generation_update AFTER UPDATE ON project_collaborators
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_collaborators';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_project_collaborators_generation_delete AFTER DELETE ON project_collaborators
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_collaborators';
+    END;
+    
+    -- Diretório de pessoas: um registro por e-mail (normalizado em minúsculas)
+    CREATE TABLE IF NOT EXISTS people (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    CREATE INDEX IF NOT EXISTS idx_people_name ON people(name COLLATE NOCASE);
+    
+    INSERT OR IGNORE INTO write_generations (table_name) VALUES ('people');
+    
+    CREATE TRIGGER IF NOT EXISTS trg_people_generation_insert AFTER INSERT ON people
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'people';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_people_generation_update AFTER UPDATE ON people
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'people';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_people_generation_delete AFTER DELETE ON people
+    BEGIN
+        UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'people';
+    END;
     """)
     
+    _migrate_collaborators_to_people(conn)
+    _migrate_unique_project_names(conn)
+    _migrate_notification_events(conn)
+    _migrate_monthly_stats(conn)
+    
     conn.commit()
     conn.close()
+    _note_local_write()
+
+def rebuild_monthly_stats(conn):
+    """
+    Recalcula project_monthly_stats a partir dos projetos e do histórico de status
+
+    Conclusões e cancelamentos vão para o mês da última entrada do projeto no status atual.
+    Só os projetos existentes são considerados: as contagens de projetos já excluídos, que os
+    triggers preservam, se perdem. Executa na conexão informada, sem commit.
+    """
+    conn.execute("DELETE FROM project_monthly_stats")
+    conn.execute("""
+    INSERT INTO project_monthly_stats (month, project_type_id, created_count, completed_count, cancelled_count)
+    SELECT month, project_type_id, SUM(created_count), SUM(completed_count), SUM(cancelled_count)
+    FROM (
+        SELECT strftime('%Y-%m', start_date) AS month, project_type_id,
+               1 AS created_count, 0 AS completed_count, 0 AS cancelled_count
+        FROM projects
+        UNION ALL
+        SELECT strftime('%Y-%m', (
+                   SELECT h.changed_at FROM project_status_history h
+                   WHERE h.project_id = p.id AND h.new_status = p.status
+                   ORDER BY h.id DESC LIMIT 1
+               )), p.project_type_id,
+               0, p.status = 'Concluído', p.status = 'Cancelado'
+        FROM projects p
+        WHERE p.status IN ('Concluído', 'Cancelado')
+    )
+    WHERE month IS NOT NULL
+    GROUP BY month, project_type_id
+    """)
+
+def _migrate_monthly_stats(conn):
+    """
+    Substitui os triggers antigos de project_monthly_stats e recalcula a tabela
+
+    Os triggers antigos usavam o mês de COALESCE(end_date, updated_at) para as conclusões (que
+    mudava a cada edição do projeto) e descontavam as exclusões. A tabela também é recalculada
+    quando está vazia com projetos cadastrados (bancos anteriores à tabela de fatos).
+    """
+    old_triggers = [row[0] for row in conn.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type = 'trigger'
+          AND name IN ('trg_projects_monthly_insert', 'trg_projects_monthly_update', 'trg_projects_monthly_delete')
+    """)]
+    if not old_triggers and (
+        conn.execute("SELECT 1 FROM project_monthly_stats LIMIT 1").fetchone()
+        or not conn.execute("SELECT 1 FROM projects LIMIT 1").fetchone()
+    ):
+        return
+    for name in old_triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+    rebuild_monthly_stats(conn)
+
+def _migrate_collaborators_to_people(conn):
+    """
+    Liga cada linha de project_collaborators a uma pessoa de people
+
+    Pessoas são deduplicadas pelo e-mail normalizado ou, sem e-mail, pelo nome. Linhas
+    repetidas da mesma pessoa no mesmo projeto são removidas (mantendo a mais antiga) antes
+    de criar o índice único (project_id, person_id). Depois que o índice existe, as funções
+    de colaboradores sempre gravam person_id e a migração não faz nenhuma varredura.
+    """
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(project_collaborators)")]
+    if 'person_id' not in columns:
+        conn.execute("ALTER TABLE project_collaborators ADD COLUMN person_id INTEGER REFERENCES people (id) ON DELETE CASCADE")
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_project_collaborators_project_person'"
+    ).fetchone():
+        return
+    
+    conn.executescript("""
+    -- Pessoas com e-mail: uma por e-mail, com o nome da linha mais recente (em SQLite, as
+    -- colunas sem agregação vêm da linha escolhida por MAX)
+    INSERT INTO people (name, email)
+    SELECT name, email FROM (
+        SELECT trim(user_name) AS name, lower(trim(user_email)) AS email, MAX(id)
+        FROM project_collaborators
+        WHERE person_id IS NULL AND trim(coalesce(user_email, '')) != ''
+        GROUP BY lower(trim(user_email))
+    )
+    WHERE 1
+    ON CONFLICT(email) DO NOTHING;
+    
+    -- Pessoas sem e-mail: uma por nome
+    INSERT INTO people (name)
+    SELECT trim(c.user_name)
+    FROM project_collaborators c
+    WHERE c.person_id IS NULL
+      AND trim(coalesce(c.user_email, '')) = ''
+      AND NOT EXISTS (
+          SELECT 1 FROM people p WHERE p.email IS NULL AND p.name = trim(c.user_name) COLLATE NOCASE
+      )
+    GROUP BY lower(trim(c.user_name));
+    
+    UPDATE project_collaborators SET person_id = COALESCE(
+        (SELECT p.id FROM people p WHERE p.email = lower(trim(project_collaborators.user_email))),
+        (SELECT MIN(p.id) FROM people p
+         WHERE p.email IS NULL AND p.name = trim(project_collaborators.user_name) COLLATE NOCASE)
+    )
+    WHERE person_id IS NULL;
+    
+    DELETE FROM project_collaborators
+    WHERE id NOT IN (SELECT MIN(id) FROM project_collaborators GROUP BY project_id, person_id);
+    
+    CREATE UNIQUE INDEX idx_project_collaborators_project_person ON project_collaborators(project_id, person_id);
+    CREATE INDEX IF NOT EXISTS idx_project_collaborators_person ON project_collaborators(person_id);
+    """)
+
+def _migrate_unique_project_names(conn):
+    """
+    Cria o índice único de nomes de projeto, usado pela importação com upsert
+
+    Bancos antigos podem ter nomes repetidos (a importação CSV não os verificava): as cópias
+    mais novas recebem o sufixo ' (#id)' antes da criação do índice, com uma notificação. Se
+    o nome com sufixo já pertencer a outro projeto, o sufixo vira ' (#id-2)', ' (#id-3)'...
+    """
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_projects_name_unique'").fetchone():
+        return
+    duplicates = conn.execute("""
+        SELECT id, name FROM projects
+        WHERE id NOT IN (SELECT MIN(id) FROM projects GROUP BY name)
+        ORDER BY id
+    """).fetchall()
+    renamed = len(duplicates)
+    if renamed:
+        taken = {row[0] for row in conn.execute("SELECT DISTINCT name FROM projects")}
+        new_names = []
+        for project_id, name in duplicates:
+            new_name = f"{name} (#{project_id})"
+            attempt = 2
+            while new_name in taken:
+                new_name = f"{name} (#{project_id}-{attempt})"
+                attempt += 1
+            taken.add(new_name)
+            new_names.append((new_name, project_id))
+        conn.executemany("UPDATE projects SET name = ? WHERE id = ?", new_names)
+        conn.execute(
+            "INSERT INTO notifications (title, message, type) VALUES (?, ?, ?)",
+            ("Projetos Renomeados",
+             f"{renamed} projeto(s) com nome repetido receberam o sufixo ' (#id)' para tornar os nomes únicos.",
+             "warning")
+        )
+    conn.execute("CREATE UNIQUE INDEX idx_projects_name_unique ON projects(name)")
+
+def _migrate_notification_events(conn):
+    """Adiciona a chave/contagem de eventos às notificações e a tabela de detalhes dos resumos"""
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(notifications)")]
+    if 'event_key' not in columns:
+        conn.execute("ALTER TABLE notifications ADD COLUMN event_key TEXT")
+    if 'event_count' not in columns:
+        conn.execute("ALTER TABLE notifications ADD COLUMN event_count INTEGER NOT NULL DEFAULT 1")
+    conn.executescript("""
+    -- Um registro por evento de um resumo, gravado só quando os detalhes são pedidos
+    CREATE TABLE IF NOT EXISTS notification_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        notification_id INTEGER NOT NULL,
+        subject TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (notification_id) REFERENCES notifications (id) ON DELETE CASCADE
+    );
+    
+    CREATE INDEX IF NOT EXISTS idx_notification_events_notification ON notification_events(notification_id);
+    
+    -- Feed de notificações: ordem (created_at, id), filtros por tipo e por não lidas
+    CREATE INDEX IF NOT EXISTS idx_notifications_created ON notifications(created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_notifications_type_created ON notifications(type, created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_notifications_unread_created ON notifications(created_at, id) WHERE is_read = 0;
+    CREATE INDEX IF NOT EXISTS idx_notifications_event_key ON notifications(event_key, id) WHERE event_key IS NOT NULL;
+    """)
+
+# Bancos já inicializados neste processo (o Streamlit reexecuta os scripts a cada interação)
+_initialized_db_paths = set()
+
+def ensure_db_initialized():
+    """Executa init_db() apenas na primeira chamada do processo para o banco atual; retorna True se executou"""
+    db_path = get_db_path()
+    if db_path in _initialized_db_paths:
+        return False
+    init_db()
+    _initialized_db_paths.add(db_path)
+    return True
+
+def get_write_generation(*table_names):
+    """Retorna a geração de escrita de cada tabela informada (muda a cada INSERT/UPDATE/DELETE)"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        placeholders = ', '.join('?' for _ in table_names)
+        cursor.execute(
+            f"SELECT table_name, generation FROM write_generations WHERE table_name IN ({placeholders})",
+            table_names
+        )
+        generations = {row['table_name']: row['generation'] for row in cursor.fetchall()}
+    return tuple(generations.get(name, 0) for name in table_names)
+
+def get_all_write_generations():
+    """Retorna {tabela: geração de escrita} de todas as tabelas com triggers de geração"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT table_name, generation FROM write_generations")
+        return {row['table_name']: row['generation'] for row in cursor.fetchall()}
 
 # Funções CRUD para Project Types (mantidas como antes)
 def create_project_type(name, description=None):
@@ -114,6 +414,10 @@ def delete_project_type(project_type_id):
         return cursor.rowcount > 0
 
 # Funções CRUD para Platforms (mantidas como antes)
+# Plataforma inicial de todo projeto novo (criada por database_setup.sql)
+DEFAULT_PLATFORM_NAME = 'Custom'
+DEFAULT_PLATFORM_DESCRIPTION = 'Solução desenvolvida sob medida'
+
 def create_platform(name, description=None):
     """Cria uma nova plataforma"""
     with get_db_connection() as conn:
@@ -157,34 +461,139 @@ def update_platform(platform_id, name, description=None):
         return cursor.rowcount > 0
 
 def delete_platform(platform_id):
-    """Exclui uma plataforma"""
+    """Exclui uma plataforma (a plataforma padrão dos projetos novos não pode ser excluída)"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        cursor.execute("SELECT name FROM platforms WHERE id = ?", (platform_id,))
+        row = cursor.fetchone()
+        if row and row['name'] == DEFAULT_PLATFORM_NAME:
+            raise ValueError(f"A plataforma padrão '{DEFAULT_PLATFORM_NAME}' não pode ser excluída")
         cursor.execute("DELETE FROM platforms WHERE id = ?", (platform_id,))
         conn.commit()
         return cursor.rowcount > 0
 
+def _get_default_platform_id(cursor):
+    """
+    Retorna o ID da plataforma padrão atribuída aos projetos novos, buscada pelo nome
+
+    Se ela não existir mais (renomeada em um banco antigo), é recriada no mesmo cursor, para
+    que o projeto e a plataforma inicial continuem sendo gravados na mesma transação.
+    """
+    cursor.execute("SELECT id FROM platforms WHERE name = ?", (DEFAULT_PLATFORM_NAME,))
+    row = cursor.fetchone()
+    if row:
+        return row[0]
+    cursor.execute(
+        "INSERT INTO platforms (name, description) VALUES (?, ?)",
+        (DEFAULT_PLATFORM_NAME, DEFAULT_PLATFORM_DESCRIPTION)
+    )
+    return cursor.lastrowid
+
+# Uso e mesclagem de Project Types e Platforms
+def get_project_type_usage_counts():
+    """Retorna {id do tipo: número de projetos} para todos os tipos, em uma única consulta agrupada"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT pt.id, COUNT(p.id) AS usage_count
+            FROM project_types pt
+            LEFT JOIN projects p ON p.project_type_id = pt.id
+            GROUP BY pt.id
+        """)
+        return {row['id']: row['usage_count'] for row in cursor.fetchall()}
+
+def get_platform_usage_counts():
+    """Retorna {id da plataforma: número de projetos com a plataforma no histórico}, em uma única consulta agrupada"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT pl.id, COUNT(DISTINCT pp.project_id) AS usage_count
+            FROM platforms pl
+            LEFT JOIN project_platforms pp ON pp.platform_id = pl.id
+            GROUP BY pl.id
+        """)
+        return {row['id']: row['usage_count'] for row in cursor.fetchall()}
+
+def _merge_reference(entity_table, reference_table, reference_column, source_id, target_id, title, message,
+                     protected_name=None):
+    """
+    Move todas as referências de source_id para target_id e exclui source_id
+
+    A reatribuição é uma única instrução UPDATE e, junto com a exclusão da origem e a
+    notificação de resumo, roda em uma única transação. Retorna quantas linhas foram movidas.
+    Um registro chamado protected_name não pode ser a origem da mesclagem.
+    """
+    if source_id == target_id:
+        raise ValueError("A origem e o destino da mesclagem devem ser diferentes")
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"SELECT id, name FROM {entity_table} WHERE id IN (?, ?)", (source_id, target_id))
+            names = {row['id']: row['name'] for row in cursor.fetchall()}
+            if source_id not in names or target_id not in names:
+                raise ValueError("Registro de origem ou de destino não encontrado")
+            if protected_name is not None and names[source_id] == protected_name:
+                raise ValueError(f"'{protected_name}' não pode ser mesclado em outro registro")
+
+            cursor.execute(
+                f"UPDATE {reference_table} SET {reference_column} = ? WHERE {reference_column} = ?",
+                (target_id, source_id)
+            )
+            moved = cursor.rowcount
+            cursor.execute(f"DELETE FROM {entity_table} WHERE id = ?", (source_id,))
+            cursor.execute(
+                "INSERT INTO notifications (title, message, type) VALUES (?, ?, ?)",
+                (title, message.format(count=moved, source=names[source_id], target=names[target_id]), "info")
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return moved
+
+def merge_project_types(source_id, target_id):
+    """Reatribui todos os projetos do tipo source_id para target_id e exclui source_id"""
+    return _merge_reference(
+        "project_types", "projects", "project_type_id", source_id, target_id,
+        "Tipos de Projeto Mesclados",
+        "'{source}' foi mesclado em '{target}': {count} projeto(s) reatribuído(s)."
+    )
+
+def merge_platforms(source_id, target_id):
+    """Reatribui todo o histórico de plataformas de source_id para target_id e exclui source_id"""
+    return _merge_reference(
+        "platforms", "project_platforms", "platform_id", source_id, target_id,
+        "Plataformas Mescladas",
+        "'{source}' foi mesclada em '{target}': {count} registro(s) de histórico reatribuído(s).",
+        protected_name=DEFAULT_PLATFORM_NAME
+    )
+
 # Funções CRUD para Projects (atualizadas)
+# Status aceitos para um projeto, na ordem do fluxo de trabalho
+PROJECT_STATUSES = ["Planejamento", "Em Desenvolvimento", "Testes", "Implantação", "Concluído", "Cancelado"]
+
 def create_project(name, description, project_type_id, start_date, end_date=None, status="Planejamento"):
-    """Cria um novo projeto"""
+    """Cria um novo projeto com a plataforma inicial padrão, na mesma transação"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO projects (name, description, project_type_id, start_date, end_date, status) VALUES (?, ?, ?, ?, ?, ?)",
-            (name, description, project_type_id, start_date, end_date, status)
-        )
-        conn.commit()
-        project_id = cursor.lastrowid
-        
-        # Adiciona a plataforma inicial automaticamente se não for custom
-        add_platform_to_project(project_id, 10, start_date, f"Plataforma inicial para o projeto {name}")
+        try:
+            cursor.execute(
+                "INSERT INTO projects (name, description, project_type_id, start_date, end_date, status) VALUES (?, ?, ?, ?, ?, ?)",
+                (name, description, project_type_id, start_date, end_date, status)
+            )
+            project_id = cursor.lastrowid
+            cursor.execute(
+                "INSERT INTO project_platforms (project_id, platform_id, assigned_date, description) VALUES (?, ?, ?, ?)",
+                (project_id, _get_default_platform_id(cursor), start_date, f"Plataforma inicial para o projeto {name}")
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
         
-        # Adiciona notificação de criação de projeto
-        add_notification(
-            f"Novo Projeto: {name}",
-            f"O projeto '{name}' foi criado com sucesso.",
-            "success"
-        )
+        # Adiciona notificação de criação de projeto (agrupada em resumo se houver várias)
+        record_notification_event('project_created', name)
         
         return project_id
 
@@ -261,11 +670,7 @@ def delete_project(project_id):
     """Exclui um projeto e todos os registros relacionados"""
     project = get_project_by_id(project_id)
     if project:
-        add_notification(
-            f"Projeto Excluído: {project.name}",
-            f"O projeto '{project.name}' foi excluído do sistema.",
-            "warning"
-        )
+        record_notification_event('project_deleted', project.name)
     
     with get_db_connection() as conn:
         cursor = conn.cursor()
@@ -318,6 +723,262 @@ def search_projects(query=None, status=None, project_type_id=None):
             projects.append(project)
         return projects
 
+def search_projects_faceted(query=None, status=None, project_type_id=None, platform_id=None, limit=50, offset=0):
+    """
+    Busca projetos e retorna uma página de resultados com contagens por faceta
+
+    As contagens de cada faceta aplicam todos os filtros ativos exceto o da própria faceta,
+    para que cada opção do filtro mostre quantos projetos teria se fosse selecionada.
+    A página e as contagens são lidas na mesma conexão e transação; as facetas vêm de uma
+    única consulta com agregações agrupadas.
+
+    Args:
+        query: Termo buscado no nome ou na descrição
+        status: Status do projeto
+        project_type_id: ID do tipo de projeto
+        platform_id: ID da plataforma atual (última do histórico)
+        limit: Tamanho da página (0 para retornar apenas as contagens)
+        offset: Deslocamento da página
+
+    Returns:
+        Dicionário com 'projects' (lista de Project), 'total' e 'facets' com as contagens
+        'status' (por status), 'project_type' (por ID de tipo) e 'platform' (por ID de plataforma)
+    """
+    base_query = """
+        WITH current_platforms AS (
+            SELECT project_id, platform_id FROM (
+                SELECT project_id, platform_id,
+                       ROW_NUMBER() OVER (PARTITION BY project_id ORDER BY assigned_date DESC, id DESC) AS position
+                FROM project_platforms
+            )
+            WHERE position = 1
+        ),
+        base AS (
+            SELECT p.*, pt.name AS project_type_name, cp.platform_id AS current_platform_id,
+                   (? IS NULL OR p.status = ?) AS status_match,
+                   (? IS NULL OR p.project_type_id = ?) AS type_match,
+                   (? IS NULL OR cp.platform_id = ?) AS platform_match
+            FROM projects p
+            LEFT JOIN project_types pt ON p.project_type_id = pt.id
+            LEFT JOIN current_platforms cp ON cp.project_id = p.id
+            WHERE (? IS NULL OR p.name LIKE ? OR p.description LIKE ?)
+        )
+    """
+    query = query or None
+    like = f'%{query}%' if query else None
+    params = [status, status, project_type_id, project_type_id, platform_id, platform_id, query, like, like]
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+
+        cursor.execute(base_query + """
+            SELECT 'status' AS facet, status AS value, COUNT(*) AS count
+            FROM base WHERE type_match AND platform_match GROUP BY status
+            UNION ALL
+            SELECT 'project_type', project_type_id, COUNT(*)
+            FROM base WHERE status_match AND platform_match GROUP BY project_type_id
+            UNION ALL
+            SELECT 'platform', current_platform_id, COUNT(*)
+            FROM base WHERE status_match AND type_match GROUP BY current_platform_id
+            UNION ALL
+            SELECT 'total', NULL, COUNT(*)
+            FROM base WHERE status_match AND type_match AND platform_match
+        """, params)
+        facets = {'status': {}, 'project_type': {}, 'platform': {}}
+        total = 0
+        for row in cursor.fetchall():
+            if row['facet'] == 'total':
+                total = row['count']
+            else:
+                facets[row['facet']][row['value']] = row['count']
+
+        projects = []
+        if limit:
+            cursor.execute(base_query + """
+                SELECT * FROM base
+                WHERE status_match AND type_match AND platform_match
+                ORDER BY created_at DESC, id DESC
+                LIMIT ? OFFSET ?
+            """, params + [limit, offset])
+            for row in cursor.fetchall():
+                project = Project(
+                    id=row['id'],
+                    name=row['name'],
+                    description=row['description'],
+                    project_type_id=row['project_type_id'],
+                    start_date=row['start_date'],
+                    end_date=row['end_date'],
+                    status=row['status'],
+                    created_at=row['created_at'],
+                    updated_at=row['updated_at']
+                )
+                project.project_type_name = row['project_type_name']
+                project.current_platform_id = row['current_platform_id']
+                projects.append(project)
+
+        conn.rollback()
+        return {'projects': projects, 'total': total, 'facets': facets}
+
+def lookup_projects_by_name(prefix=None, limit=20):
+    """
+    Retorna IDs e nomes dos projetos cujo nome começa com o prefixo (busca incremental)
+
+    A consulta usa o índice idx_projects_name (COLLATE NOCASE) e lê no máximo 'limit' linhas.
+    Sem prefixo, retorna os primeiros projetos em ordem alfabética.
+    """
+    pattern = (prefix or '').replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, name FROM projects
+            WHERE name LIKE ? ESCAPE '\\'
+            ORDER BY name COLLATE NOCASE, id
+            LIMIT ?
+        """, (pattern, limit))
+        return [{'id': row['id'], 'name': row['name']} for row in cursor.fetchall()]
+
+def get_projects_page(after_id=None, limit=50, status=None, project_type_id=None):
+    """
+    Retorna uma página de projetos por paginação de conjunto de chaves (keyset) sobre o ID
+    
+    Cada página parte do último ID da anterior (WHERE p.id > ?) em vez de um OFFSET, então
+    o custo é o mesmo em qualquer ponto da lista e inserções não deslocam as páginas.
+    
+    Returns:
+        Dicionário com 'projects' (objetos Project em ordem de ID) e 'next_after'
+        (ID a passar como after_id para a próxima página, ou None na última)
+    """
+    conditions = ["p.id > ?"]
+    params = [after_id or 0]
+    if status:
+        conditions.append("p.status = ?")
+        params.append(status)
+    if project_type_id:
+        conditions.append("p.project_type_id = ?")
+        params.append(project_type_id)
+    params.append(limit + 1)
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT p.*, pt.name as project_type_name
+            FROM projects p
+            LEFT JOIN project_types pt ON p.project_type_id = pt.id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY p.id
+            LIMIT ?
+        """, params)
+        rows = cursor.fetchall()
+        projects = []
+        for row in rows[:limit]:
+            project = Project(
+                id=row['id'],
+                name=row['name'],
+                description=row['description'],
+                project_type_id=row['project_type_id'],
+                start_date=row['start_date'],
+                end_date=row['end_date'],
+                status=row['status'],
+                created_at=row['created_at'],
+                updated_at=row['updated_at']
+            )
+            project.project_type_name = row['project_type_name']
+            projects.append(project)
+        return {
+            'projects': projects,
+            'next_after': projects[-1].id if len(rows) > limit else None
+        }
+
+# Operações em massa para Projects
+def _bulk_project_condition(project_ids=None, filters=None):
+    """
+    Monta a condição WHERE de uma operação em massa
+
+    Aceita um conjunto de IDs (enviado como um único parâmetro JSON, sem limite de variáveis)
+    ou um filtro com as mesmas chaves de search_projects(): 'query', 'status', 'project_type_id'.
+    """
+    if project_ids is not None:
+        return "id IN (SELECT value FROM json_each(?))", [json.dumps([int(i) for i in project_ids])]
+
+    filters = {key: value for key, value in (filters or {}).items() if value}
+    unknown = set(filters) - {'query', 'status', 'project_type_id'}
+    if unknown:
+        raise ValueError(f"Filtros não suportados: {', '.join(sorted(unknown))}")
+    if not filters:
+        raise ValueError("Informe os IDs dos projetos ou ao menos um filtro")
+
+    conditions = []
+    params = []
+    if 'query' in filters:
+        conditions.append("(name LIKE ? OR description LIKE ?)")
+        params.extend([f"%{filters['query']}%", f"%{filters['query']}%"])
+    if 'status' in filters:
+        conditions.append("status = ?")
+        params.append(filters['status'])
+    if 'project_type_id' in filters:
+        conditions.append("project_type_id = ?")
+        params.append(filters['project_type_id'])
+    return " AND ".join(conditions), params
+
+def _run_bulk_project_statement(statement, project_ids, filters, params, title, message, notification_type="info"):
+    """Executa uma instrução em massa e registra uma notificação de resumo na mesma transação"""
+    condition, condition_params = _bulk_project_condition(project_ids, filters)
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(statement.format(condition=condition), list(params) + condition_params)
+            affected = cursor.rowcount
+            if affected:
+                cursor.execute(
+                    "INSERT INTO notifications (title, message, type) VALUES (?, ?, ?)",
+                    (title.format(count=affected), message.format(count=affected), notification_type)
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return affected
+
+def bulk_update_project_status(new_status, project_ids=None, filters=None):
+    """Altera o status de vários projetos em uma única instrução; retorna quantos foram alterados"""
+    return _run_bulk_project_statement(
+        "UPDATE projects SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE status IS NOT ? AND ({condition})",
+        project_ids, filters, [new_status, new_status],
+        "Alteração em Massa: {count} projeto(s)",
+        f"{{count}} projeto(s) tiveram o status alterado para '{new_status}'."
+    )
+
+def bulk_reassign_project_type(project_type_id, project_ids=None, filters=None):
+    """Altera o tipo de vários projetos em uma única instrução; retorna quantos foram alterados"""
+    return _run_bulk_project_statement(
+        "UPDATE projects SET project_type_id = ?, updated_at = CURRENT_TIMESTAMP "
+        "WHERE project_type_id IS NOT ? AND ({condition})",
+        project_ids, filters, [project_type_id, project_type_id],
+        "Alteração em Massa: {count} projeto(s)",
+        "{count} projeto(s) foram movidos para outro tipo de projeto."
+    )
+
+def bulk_extend_project_deadlines(days, project_ids=None, filters=None):
+    """Adia a data de término de vários projetos em 'days' dias; projetos sem término não são alterados"""
+    return _run_bulk_project_statement(
+        "UPDATE projects SET end_date = date(end_date, ? || ' days'), updated_at = CURRENT_TIMESTAMP "
+        "WHERE end_date IS NOT NULL AND ({condition})",
+        project_ids, filters, [f"{int(days):+d}"],
+        "Prazos Alterados: {count} projeto(s)",
+        f"{{count}} projeto(s) tiveram o prazo alterado em {int(days)} dia(s)."
+    )
+
+def bulk_delete_projects(project_ids=None, filters=None):
+    """Exclui vários projetos em uma única instrução; retorna quantos foram excluídos"""
+    return _run_bulk_project_statement(
+        "DELETE FROM projects WHERE {condition}",
+        project_ids, filters, [],
+        "Exclusão em Massa: {count} projeto(s)",
+        "{count} projeto(s) foram excluídos do sistema.",
+        "warning"
+    )
+
 # Funções CRUD para Project Platforms (atualizadas)
 def add_platform_to_project(project_id, platform_id, assigned_date=None, description=None):
     """Adiciona uma plataforma a um projeto (histórico de plataformas)"""
@@ -381,9 +1042,38 @@ def get_platforms_by_project_and_date(project_id, date):
                    'description': row['description'], 'platform_name': row['platform_name']}
         return None
 
+def get_project_status_history(project_id):
+    """Retorna as transições de status de um projeto em ordem cronológica"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT * FROM project_status_history
+            WHERE project_id = ?
+            ORDER BY changed_at, id
+        """, (project_id,))
+        rows = cursor.fetchall()
+        return [{'id': row['id'], 'project_id': row['project_id'], 'old_status': row['old_status'],
+                'new_status': row['new_status'], 'changed_at': row['changed_at']}
+                for row in rows]
+
 # Novas funções para exportação e importação
-def export_projects_to_csv():
-    """Exporta todos os projetos para CSV"""
+# Cabeçalho do CSV de projetos (mesmas colunas lidas por import_projects_from_csv)
+EXPORT_CSV_HEADER = ['ID', 'Nome', 'Descrição', 'Tipo de Projeto', 'Data Início', 'Data Término', 'Status', 'Criado em', 'Atualizado em']
+# Linhas lidas do banco por vez durante a exportação
+EXPORT_BATCH_SIZE = 1000
+
+def write_projects_csv(output):
+    """
+    Escreve todos os projetos em CSV no arquivo de texto informado, lendo em lotes
+
+    Não mantém o resultado inteiro em memória, permitindo exportar para arquivos ou stdout.
+    Retorna o número de projetos escritos.
+    """
+    import csv
+    
+    writer = csv.writer(output)
+    writer.writerow(EXPORT_CSV_HEADER)
+    count = 0
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
@@ -392,71 +1082,279 @@ def export_projects_to_csv():
             LEFT JOIN project_types pt ON p.project_type_id = pt.id 
             ORDER BY p.created_at DESC
         """)
-        rows = cursor.fetchall()
-        
-        import io
-        import csv
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Escrever cabeçalhos
-        writer.writerow(['ID', 'Nome', 'Descrição', 'Tipo de Projeto', 'Data Início', 'Data Término', 'Status', 'Criado em', 'Atualizado em'])
-        
-        # Escrever dados
-        for row in rows:
-            writer.writerow([
-                row['id'],
-                row['name'],
-                row['description'],
-                row['project_type_name'],
-                row['start_date'],
-                row['end_date'],
-                row['status'],
-                row['created_at'],
-                row['updated_at']
-            ])
-        
-        return output.getvalue()
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                break
+            writer.writerows(
+                [row['id'], row['name'], row['description'], row['project_type_name'], row['start_date'],
+                 row['end_date'], row['status'], row['created_at'], row['updated_at']]
+                for row in rows
+            )
+            count += len(rows)
+    return count
+
+def export_projects_to_csv():
+    """Exporta todos os projetos para CSV"""
+    import io
+    
+    output = io.StringIO()
+    write_projects_csv(output)
+    return output.getvalue()
+
+def _to_excel_date(value):
+    """Converte 'YYYY-MM-DD' em date para células de data; outros valores seguem como texto"""
+    return _parse_date(value) or value
+
+def _to_excel_datetime(value):
+    """Converte 'YYYY-MM-DD HH:MM:SS' (CURRENT_TIMESTAMP) em datetime; outros valores seguem como texto"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return value
+
+# Planilhas do export Excel: (título, cabeçalho, consulta, conversores por coluna)
+EXPORT_XLSX_SHEETS = [
+    ("Projetos", EXPORT_CSV_HEADER, """
+        SELECT p.id, p.name, p.description, pt.name, p.start_date, p.end_date, p.status,
+               p.created_at, p.updated_at
+        FROM projects p
+        LEFT JOIN project_types pt ON p.project_type_id = pt.id
+        ORDER BY p.id
+    """, {4: _to_excel_date, 5: _to_excel_date, 7: _to_excel_datetime, 8: _to_excel_datetime}),
+    ("Histórico de Plataformas", ['Projeto', 'Plataforma', 'Data', 'Descrição'], """
+        SELECT p.name, pl.name, pp.assigned_date, pp.description
+        FROM project_platforms pp
+        JOIN projects p ON pp.project_id = p.id
+        JOIN platforms pl ON pp.platform_id = pl.id
+        ORDER BY pp.project_id, pp.assigned_date, pp.id
+    """, {2: _to_excel_date}),
+    ("Colaboradores", ['Projeto', 'Nome', 'E-mail', 'Função', 'Adicionado em'], """
+        SELECT p.name, COALESCE(pe.name, c.user_name), COALESCE(pe.email, c.user_email), c.role, c.added_at
+        FROM project_collaborators c
+        JOIN projects p ON c.project_id = p.id
+        LEFT JOIN people pe ON c.person_id = pe.id
+        ORDER BY c.project_id, c.id
+    """, {4: _to_excel_datetime}),
+    ("Estatísticas Mensais", ['Mês', 'Tipo de Projeto', 'Criados', 'Concluídos', 'Cancelados'], """
+        SELECT s.month, pt.name, s.created_count, s.completed_count, s.cancelled_count
+        FROM project_monthly_stats s
+        LEFT JOIN project_types pt ON s.project_type_id = pt.id
+        ORDER BY s.month, pt.name
+    """, {}),
+]
 
-def import_projects_from_csv(csv_content):
-    """Importa projetos de um arquivo CSV"""
+def write_workbook_xlsx(output):
+    """
+    Escreve a pasta de trabalho Excel (projetos, histórico de plataformas, colaboradores e
+    estatísticas mensais) no caminho ou arquivo binário informado
+    
+    Cada planilha é gravada em fluxo contínuo a partir de um cursor lido em lotes de
+    EXPORT_BATCH_SIZE, sem manter a planilha em memória; datas viram células de data.
+    Retorna {título da planilha: linhas escritas}.
+    """
+    from utils.xlsx import XlsxWriter
+    
+    def rows(cursor, converters):
+        while True:
+            batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not batch:
+                break
+            for row in batch:
+                values = list(row)
+                for index, convert in converters.items():
+                    values[index] = convert(values[index])
+                yield values
+    
+    counts = {}
+    with get_db_connection() as conn, XlsxWriter(output) as workbook:
+        cursor = conn.cursor()
+        for title, header, query, converters in EXPORT_XLSX_SHEETS:
+            cursor.execute(query)
+            counts[title] = workbook.write_sheet(title, header, rows(cursor, converters))
+    return counts
+
+def export_projects_to_xlsx():
+    """Exporta projetos, históricos, colaboradores e estatísticas para Excel; retorna os bytes do .xlsx"""
+    import io
+    
+    output = io.BytesIO()
+    write_workbook_xlsx(output)
+    return output.getvalue()
+
+def csv_row_to_project_record(row, project_types, errors):
+    """
+    Converte uma linha do CSV de projetos (colunas de EXPORT_CSV_HEADER) em registro
+
+    Retorna None e acrescenta a mensagem em 'errors' se o tipo de projeto não existe em
+    project_types ({nome: id}).
+    """
+    # Verificar se o tipo de projeto existe
+    project_type_name = row['Tipo de Projeto']
+    if project_type_name not in project_types:
+        errors.append(f"Tipo de projeto '{project_type_name}' não encontrado para o projeto '{row['Nome']}'")
+        return None
+    return {
+        'name': row['Nome'],
+        'description': row['Descrição'],
+        'project_type_id': project_types[project_type_name],
+        'start_date': row['Data Início'],
+        'end_date': row['Data Término'] if row['Data Término'] else None,
+        'status': row['Status']
+    }
+
+def _read_project_csv_chunks(csv_content, errors):
+    """
+    Lê um CSV de projetos e produz listas de até VALIDATION_CHUNK_SIZE registros
+
+    Linhas com tipo de projeto inexistente são relatadas em 'errors' e descartadas.
+    """
     import csv
     import io
+    from itertools import islice
     
     # Obter tipos de projeto existentes
     project_types = {pt.name: pt.id for pt in get_all_project_types()}
     
     # Ler conteúdo CSV
-    csv_file = io.StringIO(csv_content)
+    csv_file = io.StringIO(csv_content) if isinstance(csv_content, str) else csv_content
     reader = csv.DictReader(csv_file)
     
+    while True:
+        rows = list(islice(reader, VALIDATION_CHUNK_SIZE))
+        if not rows:
+            break
+        
+        records = [csv_row_to_project_record(row, project_types, errors) for row in rows]
+        records = [record for record in records if record is not None]
+        yield records
+
+def import_projects_from_csv(csv_content, keep_notification_details=False):
+    """
+    Importa projetos de um CSV (texto ou arquivo de texto aberto, lido linha a linha)
+    
+    As linhas são validadas em lotes de VALIDATION_CHUNK_SIZE com validate_projects_batch
+    (uma consulta de unicidade por lote); linhas inválidas são relatadas em 'errors'.
+    Com keep_notification_details=True, o nome de cada projeto importado fica guardado no
+    resumo de notificação (ver get_notification_events()).
+    Para sincronizações repetidas do mesmo arquivo, use upsert_projects_from_csv().
+    """
     imported_count = 0
     errors = []
     
-    for row in reader:
-        try:
-            # Verificar se o tipo de projeto existe
-            project_type_name = row['Tipo de Projeto']
-            if project_type_name not in project_types:
-                errors.append(f"Tipo de projeto '{project_type_name}' não encontrado para o projeto '{row['Nome']}'")
-                continue
-            
-            # Criar projeto
-            create_project(
-                name=row['Nome'],
-                description=row['Descrição'],
-                project_type_id=project_types[project_type_name],
-                start_date=row['Data Início'],
-                end_date=row['Data Término'] if row['Data Término'] else None,
-                status=row['Status']
-            )
-            imported_count += 1
-        except Exception as e:
-            errors.append(f"Erro ao importar projeto '{row['Nome']}': {str(e)}")
+    # Uma notificação de resumo para a importação, em vez de uma por projeto
+    with notification_batch(keep_details=keep_notification_details):
+        for records in _read_project_csv_chunks(csv_content, errors):
+            for record, record_errors in zip(records, validate_projects_batch(records)):
+                if record_errors:
+                    errors.append(f"Projeto '{record['name']}' ignorado: {'; '.join(record_errors)}")
+                    continue
+                try:
+                    # Criar projeto
+                    create_project(
+                        name=record['name'],
+                        description=record['description'],
+                        project_type_id=record['project_type_id'],
+                        start_date=record['start_date'],
+                        end_date=record['end_date'],
+                        status=record['status']
+                    )
+                    imported_count += 1
+                except Exception as e:
+                    errors.append(f"Erro ao importar projeto '{record['name']}': {str(e)}")
     
     return imported_count, errors
 
+# Campos comparados para decidir se um projeto importado mudou
+PROJECT_CONTENT_FIELDS = ('description', 'project_type_id', 'start_date', 'end_date', 'status')
+
+def _project_content_hash(record):
+    """Hash do conteúdo de um projeto; texto vazio e None são equivalentes (o CSV não distingue)"""
+    import hashlib
+    values = tuple(record[field] if record[field] not in ('', None) else None for field in PROJECT_CONTENT_FIELDS)
+    return hashlib.sha1(repr(values).encode('utf-8')).hexdigest()
+
+def upsert_projects_from_csv(csv_content):
+    """
+    Sincroniza projetos a partir de um CSV usando o nome como chave (importação idempotente)
+    
+    Para cada lote, os projetos já cadastrados com os nomes do lote são lidos em uma consulta
+    e comparados pelo hash do conteúdo: só linhas novas ou alteradas são gravadas, com
+    INSERT ... ON CONFLICT(name) DO UPDATE no índice único de nomes. Projetos novos recebem a
+    plataforma inicial; uma única notificação resume a sincronização, e nenhuma é criada
+    quando nada mudou. Reimportar o mesmo arquivo não escreve nada no banco.
+    
+    Returns:
+        Dicionário com 'inserted', 'updated', 'unchanged' e 'errors'
+    """
+    result = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'errors': []}
+    
+    for records in _read_project_csv_chunks(csv_content, result['errors']):
+        # Último registro de cada nome vence dentro do lote
+        records = list({record['name']: record for record in records}.values())
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT id, name, {', '.join(PROJECT_CONTENT_FIELDS)} FROM projects "
+                "WHERE name IN (SELECT value FROM json_each(?))",
+                (json.dumps([record['name'] for record in records]),)
+            )
+            existing = {row['name']: row for row in cursor.fetchall()}
+        
+        for record in records:
+            if record['name'] in existing:
+                record['exclude_id'] = existing[record['name']]['id']
+        
+        changed = []
+        new_names = []
+        for record, record_errors in zip(records, validate_projects_batch(records)):
+            if record_errors:
+                result['errors'].append(f"Projeto '{record['name']}' ignorado: {'; '.join(record_errors)}")
+                continue
+            current = existing.get(record['name'])
+            if current is None:
+                new_names.append(record['name'])
+                result['inserted'] += 1
+            elif _project_content_hash(dict(current)) == _project_content_hash(record):
+                result['unchanged'] += 1
+                continue
+            else:
+                result['updated'] += 1
+            changed.append(record)
+        
+        if not changed:
+            continue
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO projects (name, description, project_type_id, start_date, end_date, status)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    description = excluded.description, project_type_id = excluded.project_type_id,
+                    start_date = excluded.start_date, end_date = excluded.end_date,
+                    status = excluded.status, updated_at = CURRENT_TIMESTAMP
+            """, [
+                (record['name'], record['description'] or None, record['project_type_id'],
+                 record['start_date'], record['end_date'], record['status'])
+                for record in changed
+            ])
+            # Plataforma inicial dos projetos novos, como em create_project()
+            cursor.execute("""
+                INSERT INTO project_platforms (project_id, platform_id, assigned_date, description)
+                SELECT id, ?, start_date, 'Plataforma inicial para o projeto ' || name
+                FROM projects WHERE name IN (SELECT value FROM json_each(?))
+            """, (_get_default_platform_id(cursor), json.dumps(new_names)))
+            conn.commit()
+    
+    if result['inserted'] or result['updated']:
+        add_notification(
+            "Sincronização de Projetos",
+            f"{result['inserted']} projeto(s) criado(s), {result['updated']} atualizado(s) e "
+            f"{result['unchanged']} sem alteração.",
+            "success"
+        )
+    return result
+
 # Funções para notificações
 def add_notification(title, message, notification_type="info"):
     """Adiciona uma notificação ao sistema"""
@@ -478,6 +1376,151 @@ def get_unread_notifications():
         return [{'id': row['id'], 'title': row['title'], 'message': row['message'], 
                 'type': row['type'], 'created_at': row['created_at']} for row in rows]
 
+# Eventos do mesmo tipo dentro desta janela viram uma única notificação de resumo
+NOTIFICATION_COALESCE_WINDOW_SECONDS = 300
+# Assuntos citados na mensagem de um resumo
+NOTIFICATION_DIGEST_SUBJECTS = 5
+
+# Tipo de evento -> (título, mensagem, tipo da notificação, título do resumo)
+NOTIFICATION_EVENTS = {
+    'project_created': (
+        "Novo Projeto: {subject}", "O projeto '{subject}' foi criado com sucesso.", "success",
+        "{count} projetos criados"
+    ),
+    'project_deleted': (
+        "Projeto Excluído: {subject}", "O projeto '{subject}' foi excluído do sistema.", "warning",
+        "{count} projetos excluídos"
+    ),
+}
+
+# Eventos acumulados por notification_batch(), por thread (a API atende cada conexão em uma thread)
+_notification_state = threading.local()
+
+@contextmanager
+def notification_batch(keep_details=False):
+    """
+    Acumula em memória os eventos de notificação do bloco e os grava ao final
+    
+    Eventos do mesmo tipo dentro de NOTIFICATION_COALESCE_WINDOW_SECONDS viram um único
+    resumo ("152 projetos criados"), gravado em uma transação. Com keep_details=True, o assunto
+    de cada evento é guardado em notification_events (ver get_notification_events()).
+    Blocos aninhados se juntam ao bloco externo.
+    """
+    if getattr(_notification_state, 'events', None) is not None:
+        yield
+        return
+    _notification_state.events = []
+    try:
+        yield
+    finally:
+        events = _notification_state.events
+        _notification_state.events = None
+        _write_notification_events(events, keep_details)
+
+def record_notification_event(event_key, subject, keep_details=False):
+    """
+    Registra um evento de notificação (ver NOTIFICATION_EVENTS)
+    
+    Dentro de notification_batch() o evento é apenas acumulado. Fora dele é gravado na hora,
+    somando-se a uma notificação não lida do mesmo tipo criada dentro da janela de agrupamento.
+    """
+    # Em UTC, como o CURRENT_TIMESTAMP das notificações
+    occurred_at = datetime.now(timezone.utc)
+    events = getattr(_notification_state, 'events', None)
+    if events is not None:
+        events.append((event_key, subject, occurred_at))
+    else:
+        _write_notification_events([(event_key, subject, occurred_at)], keep_details)
+
+def _digest_message(count, subjects):
+    shown = subjects[-NOTIFICATION_DIGEST_SUBJECTS:]
+    message = "Mais recentes: " + ", ".join(f"'{subject}'" for subject in shown)
+    if count > len(shown):
+        message += f" e mais {count - len(shown)}"
+    return message + "."
+
+def _write_notification_events(events, keep_details):
+    """Agrupa os eventos por tipo e janela de tempo e grava os resumos em uma transação"""
+    if not events:
+        return
+    window = timedelta(seconds=NOTIFICATION_COALESCE_WINDOW_SECONDS)
+    groups = []
+    open_groups = {}
+    for event_key, subject, occurred_at in events:
+        group = open_groups.get(event_key)
+        if group is None or occurred_at - group['started_at'] > window:
+            group = {'event_key': event_key, 'started_at': occurred_at, 'subjects': [], 'first': group is None}
+            open_groups[event_key] = group
+            groups.append(group)
+        group['subjects'].append((subject, occurred_at))
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        details = []
+        for group in groups:
+            title, message, notification_type, digest_title = NOTIFICATION_EVENTS[group['event_key']]
+            subjects = [subject for subject, _ in group['subjects']]
+            existing = None
+            if group['first']:
+                # Somar a um resumo ainda não lido do mesmo tipo, criado dentro da janela
+                cursor.execute("""
+                    SELECT id, event_count FROM notifications
+                    WHERE event_key = ? AND is_read = 0 AND created_at >= datetime('now', ?)
+                    ORDER BY id DESC LIMIT 1
+                """, (group['event_key'], f"-{NOTIFICATION_COALESCE_WINDOW_SECONDS} seconds"))
+                existing = cursor.fetchone()
+            
+            count = len(subjects) + (existing['event_count'] if existing else 0)
+            if count == 1:
+                values = (title.format(subject=subjects[0]), message.format(subject=subjects[0]))
+            else:
+                values = (digest_title.format(count=count), _digest_message(count, subjects))
+            if existing:
+                notification_id = existing['id']
+                cursor.execute(
+                    "UPDATE notifications SET title = ?, message = ?, event_count = ? WHERE id = ?",
+                    values + (count, notification_id)
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO notifications (title, message, type, event_key, event_count) VALUES (?, ?, ?, ?, ?)",
+                    values + (notification_type, group['event_key'], count)
+                )
+                notification_id = cursor.lastrowid
+            if keep_details:
+                details.extend(
+                    (notification_id, subject, occurred_at.strftime('%Y-%m-%d %H:%M:%S'))
+                    for subject, occurred_at in group['subjects']
+                )
+        if details:
+            cursor.executemany(
+                "INSERT INTO notification_events (notification_id, subject, created_at) VALUES (?, ?, ?)", details
+            )
+        conn.commit()
+
+def get_notification_events(notification_id, limit=None):
+    """
+    Retorna os eventos guardados de um resumo de notificações (vazio se os detalhes não foram pedidos)
+
+    Args:
+        notification_id: ID da notificação de resumo
+        limit: Número máximo de eventos (os mais antigos primeiro); None retorna todos
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT subject, created_at FROM notification_events WHERE notification_id = ? ORDER BY id LIMIT ?",
+            (notification_id, -1 if limit is None else limit)
+        )
+        return [{'subject': row['subject'], 'created_at': row['created_at']} for row in cursor.fetchall()]
+
+def count_notification_events(notification_id):
+    """Retorna quantos eventos estão guardados para um resumo de notificações"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM notification_events WHERE notification_id = ?", (notification_id,))
+        return cursor.fetchone()[0]
+
 def mark_notification_as_read(notification_id):
     """Marca uma notificação como lida"""
     with get_db_connection() as conn:
@@ -490,34 +1533,204 @@ def get_recent_notifications(limit=10):
     """Retorna as notificações mais recentes"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM notifications ORDER BY created_at DESC LIMIT ?", (limit,))
+        cursor.execute("SELECT * FROM notifications ORDER BY created_at DESC, id DESC LIMIT ?", (limit,))
         rows = cursor.fetchall()
         return [{'id': row['id'], 'title': row['title'], 'message': row['message'], 
-                'type': row['type'], 'is_read': bool(row['is_read']), 'created_at': row['created_at']} 
+                'type': row['type'], 'is_read': bool(row['is_read']), 'created_at': row['created_at'],
+                'event_count': row['event_count']} 
                 for row in rows]
 
+def _encode_notification_cursor(notification):
+    """Cursor opaco (base64 seguro para URL) com a posição (created_at, id) da notificação"""
+    position = json.dumps([notification['created_at'], notification['id']])
+    return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii').rstrip('=')
+
+def _decode_notification_cursor(cursor):
+    """Lê a posição (created_at, id) de um cursor de _encode_notification_cursor(); ValueError se inválido"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, notification_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError("Cursor de paginação inválido")
+    if not isinstance(created_at, str) or not isinstance(notification_id, int):
+        raise ValueError("Cursor de paginação inválido")
+    return created_at, notification_id
+
+def get_notifications_page(before=None, limit=20, notification_type=None, is_read=None,
+                           start_date=None, end_date=None):
+    """
+    Retorna uma página de notificações, das mais recentes para as mais antigas, por keyset
+    sobre (created_at, id)
+    
+    Args:
+        before: Cursor 'next_before' da página anterior. Ele guarda a posição (created_at, id)
+            da última notificação carregada, então a paginação continua mesmo que ela tenha
+            sido excluída; um cursor malformado gera ValueError
+        limit: Tamanho da página
+        notification_type: Filtra por tipo ('info', 'success', 'warning', 'error')
+        is_read: True/False filtra por lidas/não lidas; None traz ambas
+        start_date, end_date: Intervalo de datas de criação 'YYYY-MM-DD' (inclusivo), em dias
+            UTC: created_at é gravado com CURRENT_TIMESTAMP, que é UTC
+    
+    Returns:
+        Dicionário com 'notifications' e 'next_before' (cursor a passar como before para a
+        próxima página, ou None na última)
+    """
+    conditions = []
+    params = []
+    if before:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend(_decode_notification_cursor(before))
+    if notification_type:
+        conditions.append("type = ?")
+        params.append(notification_type)
+    if is_read is not None:
+        # Literal (não parâmetro) para que o índice parcial de não lidas seja usado
+        conditions.append("is_read = 1" if is_read else "is_read = 0")
+    if start_date:
+        conditions.append("created_at >= ?")
+        params.append(str(start_date))
+    if end_date:
+        conditions.append("created_at < date(?, '+1 day')")
+        params.append(str(end_date))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT * FROM notifications {where} ORDER BY created_at DESC, id DESC LIMIT ?",
+            params + [limit + 1]
+        )
+        rows = cursor.fetchall()
+        notifications = [{'id': row['id'], 'title': row['title'], 'message': row['message'],
+                          'type': row['type'], 'is_read': bool(row['is_read']), 'created_at': row['created_at'],
+                          'event_count': row['event_count']}
+                         for row in rows[:limit]]
+        return {
+            'notifications': notifications,
+            'next_before': _encode_notification_cursor(notifications[-1]) if len(rows) > limit else None
+        }
+
 # Funções para colaboradores
+def get_or_create_person(name, email=None, cursor=None):
+    """
+    Retorna o ID da pessoa com o e-mail informado (ou, sem e-mail, com o mesmo nome), criando-a se necessário
+    
+    Aceita um cursor para participar da transação de quem chama.
+    """
+    if cursor is None:
+        with get_db_connection() as conn:
+            person_id = get_or_create_person(name, email, conn.cursor())
+            conn.commit()
+            return person_id
+    
+    name = name.strip()
+    email = email.strip().lower() if email and email.strip() else None
+    if email:
+        cursor.execute(
+            "INSERT INTO people (name, email) VALUES (?, ?) ON CONFLICT(email) DO NOTHING",
+            (name, email)
+        )
+        cursor.execute("SELECT id FROM people WHERE email = ?", (email,))
+        return cursor.fetchone()['id']
+    
+    cursor.execute(
+        "SELECT MIN(id) AS id FROM people WHERE email IS NULL AND name = ? COLLATE NOCASE",
+        (name,)
+    )
+    row = cursor.fetchone()
+    if row['id'] is not None:
+        return row['id']
+    cursor.execute("INSERT INTO people (name) VALUES (?)", (name,))
+    return cursor.lastrowid
+
 def add_collaborator_to_project(project_id, user_name, user_email=None, role="member"):
-    """Adiciona um colaborador a um projeto"""
+    """Adiciona um colaborador a um projeto (se a pessoa já participa, apenas atualiza a função)"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        person_id = get_or_create_person(user_name, user_email, cursor)
+        cursor.execute("""
+            INSERT INTO project_collaborators (project_id, person_id, user_name, user_email, role)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(project_id, person_id) DO UPDATE SET role = excluded.role
+        """, (project_id, person_id, user_name, user_email, role))
         cursor.execute(
-            "INSERT INTO project_collaborators (project_id, user_name, user_email, role) VALUES (?, ?, ?, ?)",
-            (project_id, user_name, user_email, role)
+            "SELECT id FROM project_collaborators WHERE project_id = ? AND person_id = ?",
+            (project_id, person_id)
         )
+        collaborator_id = cursor.fetchone()['id']
         conn.commit()
-        return cursor.lastrowid
+        return collaborator_id
 
 def get_project_collaborators(project_id):
-    """Retorna os colaboradores de um projeto"""
+    """Retorna os colaboradores de um projeto, com nome e e-mail do diretório de pessoas"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM project_collaborators WHERE project_id = ?", (project_id,))
+        cursor.execute("""
+            SELECT c.id, c.project_id, c.person_id, c.role, c.added_at,
+                   COALESCE(p.name, c.user_name) AS user_name,
+                   COALESCE(p.email, c.user_email) AS user_email
+            FROM project_collaborators c
+            LEFT JOIN people p ON p.id = c.person_id
+            WHERE c.project_id = ?
+            ORDER BY c.added_at, c.id
+        """, (project_id,))
         rows = cursor.fetchall()
-        return [{'id': row['id'], 'project_id': row['project_id'], 'user_name': row['user_name'], 
-                'user_email': row['user_email'], 'role': row['role'], 'added_at': row['added_at']} 
+        return [{'id': row['id'], 'project_id': row['project_id'], 'person_id': row['person_id'],
+                'user_name': row['user_name'], 'user_email': row['user_email'], 'role': row['role'],
+                'added_at': row['added_at']}
                 for row in rows]
 
+def get_all_people():
+    """Retorna todas as pessoas do diretório, ordenadas por nome"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, name, email FROM people ORDER BY name COLLATE NOCASE")
+        return [{'id': row['id'], 'name': row['name'], 'email': row['email']} for row in cursor.fetchall()]
+
+def get_person_projects(person_id):
+    """Retorna os projetos de uma pessoa, com a função dela em cada um (usa o índice por person_id)"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT p.id, p.name, p.status, p.start_date, p.end_date,
+                   pt.name AS project_type_name, c.role, c.added_at
+            FROM project_collaborators c
+            JOIN projects p ON p.id = c.project_id
+            JOIN project_types pt ON pt.id = p.project_type_id
+            WHERE c.person_id = ?
+            ORDER BY p.start_date DESC, p.id DESC
+        """, (person_id,))
+        return [{'id': row['id'], 'name': row['name'], 'status': row['status'],
+                 'start_date': row['start_date'], 'end_date': row['end_date'],
+                 'project_type_name': row['project_type_name'], 'role': row['role'],
+                 'added_at': row['added_at']}
+                for row in cursor.fetchall()]
+
+def get_people_workload():
+    """
+    Retorna a carga de cada pessoa em uma única consulta agrupada
+    
+    Returns:
+        Lista de dicionários com 'id', 'name', 'email', 'active_projects' (nem concluídos nem
+        cancelados) e 'total_projects', ordenada pela carga ativa
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT pe.id, pe.name, pe.email,
+                   COUNT(p.id) AS total_projects,
+                   COALESCE(SUM(p.status NOT IN ('Concluído', 'Cancelado')), 0) AS active_projects
+            FROM people pe
+            LEFT JOIN project_collaborators c ON c.person_id = pe.id
+            LEFT JOIN projects p ON p.id = c.project_id
+            GROUP BY pe.id
+            ORDER BY active_projects DESC, total_projects DESC, pe.name COLLATE NOCASE
+        """)
+        return [{'id': row['id'], 'name': row['name'], 'email': row['email'],
+                 'active_projects': row['active_projects'], 'total_projects': row['total_projects']}
+                for row in cursor.fetchall()]
+
 def remove_collaborator_from_project(collaborator_id):
     """Remove um colaborador de um projeto"""
     with get_db_connection() as conn:
@@ -527,13 +1740,14 @@ def remove_collaborator_from_project(collaborator_id):
         return cursor.rowcount > 0
 
 # Funções de backup e restauração
-def backup_database():
-    """Cria um backup do banco de dados"""
+def backup_database(backup_path=None):
+    """Cria um backup do banco de dados (por padrão ao lado do banco, com o horário no nome)"""
     import shutil
     import time
     
     db_path = get_db_path()
-    backup_path = get_db_path().replace('.db', f'_backup_{int(time.time())}.db')
+    if backup_path is None:
+        backup_path = get_db_path().replace('.db', f'_backup_{int(time.time())}.db')
     
     shutil.copy2(db_path, backup_path)
     return backup_path
@@ -544,111 +1758,156 @@ def restore_database(backup_path):
     
     db_path = get_db_path()
     shutil.copy2(backup_path, db_path)
+    # O arquivo novo pode repetir as gerações de escrita do anterior: o cache de leitura é descartado
+    from .cache import clear_cache
+    clear_cache()
+    _note_local_write()
+    # Um backup de uma versão anterior precisa das migrações de init_db() na próxima execução
+    _initialized_db_paths.discard(db_path)
     return True
 
 # Funções de validação aprimoradas
-def validate_project_data(name, description, project_type_id, start_date, end_date=None):
-    """Valida os dados de um projeto antes de salvar"""
-    errors = []
-    
+# Registros validados por consulta de unicidade nos lotes
+VALIDATION_CHUNK_SIZE = 500
+# Datas aceitas: exatamente YYYY-MM-DD (date.fromisoformat sozinho aceita outros formatos)
+_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+def _parse_date(value):
+    """Converte 'YYYY-MM-DD' em date; retorna None se o formato ou a data forem inválidos"""
+    if not isinstance(value, str) or not _DATE_PATTERN.match(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+def _find_existing_names(table, names, chunk_size=VALIDATION_CHUNK_SIZE):
+    """Retorna {nome: [ids]} dos nomes já cadastrados na tabela, com uma consulta IN por lote"""
+    existing = {}
+    names = list(dict.fromkeys(name for name in names if name))
+    if not names:
+        return existing
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(names), chunk_size):
+            cursor.execute(
+                f"SELECT id, name FROM {table} WHERE name IN (SELECT value FROM json_each(?))",
+                (json.dumps(names[start:start + chunk_size]),)
+            )
+            for row in cursor.fetchall():
+                existing.setdefault(row['name'], []).append(row['id'])
+    return existing
+
+def _validate_unique_names(table, records, errors, duplicate_message, batch_message):
+    """
+    Acrescenta aos erros de cada registro os nomes já cadastrados (exceto o próprio registro,
+    via 'exclude_id') e os nomes repetidos dentro do próprio lote
+    """
+    existing = _find_existing_names(table, [record.get('name') for record in records])
+    seen = set()
+    for record, record_errors in zip(records, errors):
+        name = record.get('name')
+        if not name or not name.strip():
+            continue
+        if any(found_id != record.get('exclude_id') for found_id in existing.get(name, [])):
+            record_errors.append(duplicate_message)
+        elif name in seen:
+            record_errors.append(batch_message)
+        seen.add(name)
+
+def _validate_name_length(name, label, max_length, record_errors):
+    """Valida nome obrigatório e tamanho máximo"""
     if not name or len(name.strip()) == 0:
-        errors.append("Nome do projeto é obrigatório")
-    elif len(name.strip()) > 200:
-        errors.append("Nome do projeto deve ter no máximo 200 caracteres")
+        record_errors.append(f"Nome {label} é obrigatório")
+    elif len(name.strip()) > max_length:
+        record_errors.append(f"Nome {label} deve ter no máximo {max_length} caracteres")
+
+def validate_project_fields(record):
+    """
+    Valida os campos de um projeto que não dependem do banco (nome, tipo e datas)
     
-    if not project_type_id:
-        errors.append("Tipo de projeto é obrigatório")
+    Não abre conexão, podendo rodar em processos auxiliares (ver database.parallel_import).
+    """
+    record_errors = []
+    _validate_name_length(record.get('name'), "do projeto", 200, record_errors)
     
-    if not start_date:
-        errors.append("Data de início é obrigatória")
+    if not record.get('project_type_id'):
+        record_errors.append("Tipo de projeto é obrigatório")
     
-    # Verificar se a data de início é válida
-    try:
-        datetime.strptime(start_date, '%Y-%m-%d')
-    except ValueError:
-        errors.append("Formato de data de início inválido (deve ser YYYY-MM-DD)")
+    start = _parse_date(record.get('start_date'))
+    if not record.get('start_date'):
+        record_errors.append("Data de início é obrigatória")
+    elif start is None:
+        record_errors.append("Formato de data de início inválido (deve ser YYYY-MM-DD)")
     
-    if end_date:
-        try:
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(end_date, '%Y-%m-%d')
-            if end < start:
-                errors.append("Data de término deve ser posterior à data de início")
-        except ValueError:
-            errors.append("Formato de data de término inválido (deve ser YYYY-MM-DD)")
+    if record.get('end_date'):
+        end = _parse_date(record['end_date'])
+        if end is None:
+            record_errors.append("Formato de data de término inválido (deve ser YYYY-MM-DD)")
+        elif start is not None and end < start:
+            record_errors.append("Data de término deve ser posterior à data de início")
+    return record_errors
+
+def validate_projects_batch(records):
+    """
+    Valida vários projetos de uma vez
     
-    # Verificar se já existe um projeto com o mesmo nome
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Tentar obter ID do Streamlit se disponível
-        current_id = 0
-        try:
-            import streamlit as st
-            current_id = getattr(st, 'current_project_id', 0)
-        except:
-            pass
-            
-        cursor.execute("SELECT id FROM projects WHERE name = ? AND id != ?", (name, current_id))
-        if cursor.fetchone():
-            errors.append("Já existe um projeto com este nome")
+    Cada registro é um dicionário com 'name', 'description', 'project_type_id', 'start_date',
+    'end_date' e, para atualizações, 'exclude_id' (ID do próprio projeto, ignorado na
+    verificação de nome duplicado). A unicidade dos nomes é verificada com uma consulta por
+    lote de VALIDATION_CHUNK_SIZE registros, e nomes repetidos dentro do lote também são erro.
     
+    Returns:
+        Lista de listas de erros, na mesma ordem dos registros (lista vazia = registro válido)
+    """
+    errors = [validate_project_fields(record) for record in records]
+    _validate_unique_names(
+        "projects", records, errors,
+        "Já existe um projeto com este nome", "Nome de projeto repetido no lote"
+    )
     return errors
 
-def validate_project_type_data(name):
-    """Valida os dados de um tipo de projeto antes de salvar"""
+def validate_project_types_batch(records):
+    """Valida vários tipos de projeto ({'name', 'exclude_id'}); retorna uma lista de erros por registro"""
     errors = []
-    
-    if not name or len(name.strip()) == 0:
-        errors.append("Nome do tipo de projeto é obrigatório")
-    elif len(name.strip()) > 100:
-        errors.append("Nome do tipo de projeto deve ter no máximo 100 caracteres")
-    
-    # Verificar se já existe um tipo de projeto com o mesmo nome
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Tentar obter ID do Streamlit se disponível
-        current_id = 0
-        try:
-            import streamlit as st
-            current_id = getattr(st, 'current_project_type_id', 0)
-        except:
-            pass
-            
-        cursor.execute("SELECT id FROM project_types WHERE name = ? AND id != ?", (name, current_id))
-        if cursor.fetchone():
-            errors.append("Já existe um tipo de projeto com este nome")
-    
+    for record in records:
+        record_errors = []
+        _validate_name_length(record.get('name'), "do tipo de projeto", 100, record_errors)
+        errors.append(record_errors)
+    _validate_unique_names(
+        "project_types", records, errors,
+        "Já existe um tipo de projeto com este nome", "Nome de tipo de projeto repetido no lote"
+    )
     return errors
 
-def validate_platform_data(name):
-    """Valida os dados de uma plataforma antes de salvar"""
+def validate_platforms_batch(records):
+    """Valida várias plataformas ({'name', 'exclude_id'}); retorna uma lista de erros por registro"""
     errors = []
-    
-    if not name or len(name.strip()) == 0:
-        errors.append("Nome da plataforma é obrigatório")
-    elif len(name.strip()) > 100:
-        errors.append("Nome da plataforma deve ter no máximo 100 caracteres")
-    
-    # Verificar se já existe uma plataforma com o mesmo nome
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Tentar obter ID do Streamlit se disponível
-        current_id = 0
-        try:
-            import streamlit as st
-            current_id = getattr(st, 'current_platform_id', 0)
-        except:
-            pass
-            
-        cursor.execute("SELECT id FROM platforms WHERE name = ? AND id != ?", (name, current_id))
-        if cursor.fetchone():
-            errors.append("Já existe uma plataforma com este nome")
-    
+    for record in records:
+        record_errors = []
+        _validate_name_length(record.get('name'), "da plataforma", 100, record_errors)
+        errors.append(record_errors)
+    _validate_unique_names(
+        "platforms", records, errors,
+        "Já existe uma plataforma com este nome", "Nome de plataforma repetido no lote"
+    )
     return errors
 
+def validate_project_data(name, description, project_type_id, start_date, end_date=None, exclude_id=None):
+    """Valida os dados de um projeto antes de salvar (exclude_id: projeto sendo editado)"""
+    return validate_projects_batch([{
+        'name': name, 'description': description, 'project_type_id': project_type_id,
+        'start_date': start_date, 'end_date': end_date, 'exclude_id': exclude_id
+    }])[0]
+
+def validate_project_type_data(name, exclude_id=None):
+    """Valida os dados de um tipo de projeto antes de salvar (exclude_id: tipo sendo editado)"""
+    return validate_project_types_batch([{'name': name, 'exclude_id': exclude_id}])[0]
+
+def validate_platform_data(name, exclude_id=None):
+    """Valida os dados de uma plataforma antes de salvar (exclude_id: plataforma sendo editada)"""
+    return validate_platforms_batch([{'name': name, 'exclude_id': exclude_id}])[0]
+
 # Funções auxiliares
 def get_project_statistics():
     """Retorna estatísticas gerais dos projetos"""
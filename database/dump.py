@@ -0,0 +1,152 @@
+# database/dump.py
+"""
+Dump lógico do banco de dados em NDJSON e restauração
+
+O dump cobre os dados de todas as tabelas de domínio (tipos, plataformas, projetos, histórico
+de plataformas e de status, pessoas, colaboradores, notificações e seus eventos) e serve para
+mover dados entre ambientes sem copiar o arquivo .db. Formato, uma linha JSON por registro:
+
+    {"format": "devflow-dump", "version": 1}
+    {"table": "projects", "columns": ["id", "name", ...]}
+    [1, "Projeto", ...]
+    ...
+
+Tabelas derivadas não são exportadas: write_generations é atualizada pelos triggers durante a
+restauração e project_monthly_stats é recalculada ao final; maintenance_runs é específica de cada ambiente e não é exportada.
+Leitura e escrita são feitas em lotes, com memória constante. Arquivos terminados em .gz são
+comprimidos com gzip.
+"""
+import gzip
+import json
+
+from .connection import get_db_connection, rebuild_monthly_stats
+from .maintenance import ORPHAN_CONDITIONS
+
+DUMP_FORMAT = "devflow-dump"
+DUMP_VERSION = 1
+# Linhas lidas por fetchmany e inseridas por transação na restauração
+DUMP_BATCH_SIZE = 1000
+
+# Em ordem de dependência: as tabelas referenciadas vêm antes das que as referenciam
+DUMP_TABLES = (
+    'project_types', 'platforms', 'projects', 'project_platforms', 'people',
+    'project_collaborators', 'project_status_history', 'notifications', 'notification_events'
+)
+# Tabelas preenchidas por triggers ao inserir projetos: o conteúdo gerado é descartado antes
+# de restaurar o conteúdo do dump
+_TRIGGER_FILLED_TABLES = ('project_status_history',)
+
+def open_dump(path, mode):
+    """Abre um arquivo de dump em modo texto ('r' ou 'w'), com gzip se terminar em .gz"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=6)
+    return open(path, mode, encoding='utf-8')
+
+def _write_line(output, value):
+    output.write(json.dumps(value, ensure_ascii=False, separators=(',', ':')))
+    output.write('\n')
+
+def dump_database(output):
+    """
+    Escreve o dump de todas as tabelas de DUMP_TABLES no arquivo de texto informado
+
+    Todas as tabelas são lidas em uma única transação de leitura, de modo que escritas feitas
+    durante o dump não produzem referências para linhas ausentes. Linhas órfãs (ver
+    database.maintenance.ORPHAN_CONDITIONS) não são exportadas, para que a restauração
+    respeite as chaves estrangeiras.
+
+    Returns:
+        Dicionário {tabela: linhas exportadas}
+    """
+    counts = {}
+    _write_line(output, {'format': DUMP_FORMAT, 'version': DUMP_VERSION})
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        # Um único instantâneo do banco para todas as tabelas
+        cursor.execute("BEGIN")
+        try:
+            for table in DUMP_TABLES:
+                where = f"WHERE NOT ({ORPHAN_CONDITIONS[table]})" if table in ORPHAN_CONDITIONS else ""
+                cursor.execute(f"SELECT * FROM {table} {where} ORDER BY id")
+                _write_line(output, {'table': table, 'columns': [column[0] for column in cursor.description]})
+                counts[table] = 0
+                while True:
+                    rows = cursor.fetchmany(DUMP_BATCH_SIZE)
+                    if not rows:
+                        break
+                    for row in rows:
+                        _write_line(output, list(row))
+                    counts[table] += len(rows)
+        finally:
+            conn.rollback()
+    return counts
+
+def restore_dump(dump_file, batch_size=DUMP_BATCH_SIZE):
+    """
+    Substitui os dados do banco pelo conteúdo de um dump, preservando os IDs
+
+    Os dados atuais das tabelas de DUMP_TABLES são excluídos em uma transação; depois as linhas
+    são inseridas com executemany em transações de até batch_size linhas. Colunas do dump que
+    não existem no esquema atual são ignoradas. Uma falha no meio deixa a restauração parcial:
+    faça um backup antes (a CLI faz isso automaticamente).
+
+    Returns:
+        Dicionário {tabela: linhas restauradas}
+    """
+    header = json.loads(dump_file.readline() or 'null')
+    if not isinstance(header, dict) or header.get('format') != DUMP_FORMAT:
+        raise ValueError("Arquivo não é um dump do DevFlow Manager")
+    if header.get('version') != DUMP_VERSION:
+        raise ValueError(f"Versão de dump não suportada: {header.get('version')}")
+
+    counts = {}
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        for table in reversed(DUMP_TABLES):
+            cursor.execute(f"DELETE FROM {table}")
+        conn.commit()
+
+        table = None
+        statement = None
+        keep = None
+        batch = []
+
+        def flush():
+            if batch:
+                cursor.executemany(statement, batch)
+                conn.commit()
+                counts[table] += len(batch)
+                batch.clear()
+
+        for line in dump_file:
+            value = json.loads(line)
+            if isinstance(value, list):
+                if statement is None:
+                    raise ValueError("Linha de dados antes do cabeçalho de tabela")
+                batch.append([value[i] for i in keep])
+                if len(batch) >= batch_size:
+                    flush()
+                continue
+
+            if not isinstance(value, dict):
+                raise ValueError(f"Linha inválida no dump: {line.strip()[:80]}")
+            flush()
+            table = value.get('table')
+            if table not in DUMP_TABLES:
+                raise ValueError(f"Tabela desconhecida no dump: {table}")
+            existing_columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            if not isinstance(value.get('columns'), list):
+                raise ValueError(f"Cabeçalho sem colunas para a tabela {table}")
+            keep = [i for i, column in enumerate(value['columns']) if column in existing_columns]
+            columns = [value['columns'][i] for i in keep]
+            statement = (
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})"
+            )
+            counts[table] = 0
+            if table in _TRIGGER_FILLED_TABLES:
+                cursor.execute(f"DELETE FROM {table}")
+        flush()
+        rebuild_monthly_stats(conn)
+        conn.commit()
+    return counts
@@ -0,0 +1,318 @@
+# database/maintenance.py
+"""
+Rotinas de manutenção do banco de dados do DevFlow Manager
+
+A compactação de órfãos remove linhas que apontam para projetos ou plataformas inexistentes.
+Elas se acumularam enquanto as chaves estrangeiras não eram aplicadas (o ON DELETE CASCADE
+nunca disparava) e podem voltar a surgir em bancos alterados por ferramentas externas.
+
+A manutenção periódica atualiza as estatísticas do planejador (ANALYZE / PRAGMA optimize),
+devolve ao sistema de arquivos as páginas livres deixadas por exclusões (auto_vacuum
+incremental, em pequenos passos) e, em bancos com journal_mode=WAL, trunca o WAL quando ele
+cresce demais. O app dispara as rotinas devidas em segundo plano (start_due_maintenance()).
+"""
+import json
+import os
+import threading
+import time
+
+from .connection import get_db_connection, get_db_path, add_notification
+
+# Linhas excluídas por transação, para não manter o banco bloqueado em tabelas grandes
+DEFAULT_BATCH_SIZE = 500
+# Intervalo mínimo entre execuções automáticas da compactação
+COMPACTION_INTERVAL_HOURS = 24
+# Intervalo mínimo entre execuções automáticas da manutenção (optimize, vacuum, checkpoint)
+MAINTENANCE_INTERVAL_HOURS = 6
+# Páginas livres devolvidas por passo de PRAGMA incremental_vacuum
+VACUUM_STEP_PAGES = 256
+# Tempo máximo gasto recuperando páginas livres em uma execução
+VACUUM_TIME_BUDGET_SECONDS = 0.5
+# Tamanho do arquivo -wal a partir do qual é feito um checkpoint com truncamento
+WAL_CHECKPOINT_THRESHOLD_BYTES = 4 * 1024 * 1024
+# Intervalo mínimo entre as verificações de rotinas devidas feitas por um processo do app
+DUE_CHECK_INTERVAL_SECONDS = 600
+
+# Valor de PRAGMA auto_vacuum para o modo incremental
+_AUTO_VACUUM_INCREMENTAL = 2
+
+_due_check_lock = threading.Lock()
+# Por banco: instante (time.monotonic()) a partir do qual start_due_maintenance() verifica de novo
+_next_due_check = {}
+
+# Tabela -> condição que identifica uma linha órfã
+ORPHAN_CONDITIONS = {
+    'project_platforms': (
+        "NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = project_platforms.project_id) "
+        "OR NOT EXISTS (SELECT 1 FROM platforms pl WHERE pl.id = project_platforms.platform_id)"
+    ),
+    'project_collaborators': (
+        "NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = project_collaborators.project_id) "
+        "OR (person_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM people pe WHERE pe.id = project_collaborators.person_id))"
+    ),
+    'project_status_history': (
+        "NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = project_status_history.project_id)"
+    ),
+}
+
+def count_orphans():
+    """Retorna {tabela: número de linhas órfãs}"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        counts = {}
+        for table, condition in ORPHAN_CONDITIONS.items():
+            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE {condition}")
+            counts[table] = cursor.fetchone()[0]
+        return counts
+
+def check_foreign_keys():
+    """Executa PRAGMA foreign_key_check e retorna as violações encontradas"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA foreign_key_check")
+        return [
+            {'table': row[0], 'rowid': row[1], 'parent': row[2], 'fkid': row[3]}
+            for row in cursor.fetchall()
+        ]
+
+def compact_orphans(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Exclui as linhas órfãs em lotes e verifica a integridade referencial
+
+    Cada lote é uma transação curta (DELETE ... WHERE id IN (SELECT id ... LIMIT ?)),
+    de modo que leitores e outras escritas não ficam bloqueados durante toda a limpeza.
+
+    Returns:
+        Dicionário com 'deleted' ({tabela: linhas excluídas}) e 'violations'
+        (resultado de PRAGMA foreign_key_check após a limpeza)
+    """
+    deleted = {}
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        for table, condition in ORPHAN_CONDITIONS.items():
+            deleted[table] = 0
+            while True:
+                cursor.execute(
+                    f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} WHERE {condition} LIMIT ?)",
+                    (batch_size,)
+                )
+                conn.commit()
+                deleted[table] += max(cursor.rowcount, 0)
+                if cursor.rowcount < batch_size:
+                    break
+
+    violations = check_foreign_keys()
+    _record_run('compact_orphans', {'deleted': deleted, 'violations': len(violations)})
+    total = sum(deleted.values())
+    if total or violations:
+        add_notification(
+            "Compactação de Registros Órfãos",
+            f"{total} registro(s) órfão(s) excluído(s); {len(violations)} violação(ões) de chave estrangeira restante(s).",
+            "warning" if violations else "info"
+        )
+    return {'deleted': deleted, 'violations': violations}
+
+def _record_run(job, details):
+    """Registra a execução de uma rotina de manutenção"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO maintenance_runs (job, last_run_at, details) VALUES (?, CURRENT_TIMESTAMP, ?)
+            ON CONFLICT(job) DO UPDATE SET last_run_at = excluded.last_run_at, details = excluded.details
+        """, (job, json.dumps(details)))
+        conn.commit()
+
+def get_last_run(job):
+    """Retorna {'last_run_at', 'details'} da última execução da rotina ou None"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT last_run_at, details FROM maintenance_runs WHERE job = ?", (job,))
+        row = cursor.fetchone()
+        if row:
+            return {'last_run_at': row['last_run_at'], 'details': json.loads(row['details']) if row['details'] else None}
+        return None
+
+def _is_due(job, interval_hours):
+    """Indica se a rotina nunca rodou ou se o intervalo desde a última execução já passou"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT 1 FROM maintenance_runs
+            WHERE job = ? AND last_run_at > datetime('now', ?)
+        """, (job, f"-{int(interval_hours)} hours"))
+        return cursor.fetchone() is None
+
+def run_compaction_if_due(interval_hours=COMPACTION_INTERVAL_HOURS, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Executa a compactação na primeira inicialização e depois no máximo uma vez por intervalo
+
+    Returns:
+        Resultado de compact_orphans() ou None se a compactação ainda não era devida
+    """
+    if not _is_due('compact_orphans', interval_hours):
+        return None
+    return compact_orphans(batch_size=batch_size)
+
+def get_file_sizes():
+    """Retorna o tamanho em bytes do arquivo do banco e do arquivo -wal (0 se não existir)"""
+    db_path = get_db_path()
+    wal_path = db_path + '-wal'
+    return {
+        'database': os.path.getsize(db_path) if os.path.exists(db_path) else 0,
+        'wal': os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+    }
+
+def is_incremental_vacuum_enabled():
+    """Indica se o banco já usa auto_vacuum=INCREMENTAL"""
+    with get_db_connection() as conn:
+        return conn.execute("PRAGMA auto_vacuum").fetchone()[0] == _AUTO_VACUUM_INCREMENTAL
+
+def enable_incremental_vacuum():
+    """
+    Migra o banco para auto_vacuum=INCREMENTAL
+
+    Em bancos já criados a mudança só vale após um VACUUM completo, executado uma única vez.
+    O VACUUM reescreve o arquivo inteiro e bloqueia o banco enquanto roda, por isso a migração
+    não faz parte da manutenção automática: é pedida pelo comando maintenance da CLI ou pela
+    aba Manutenção. Retorna True se a migração foi feita agora.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA auto_vacuum")
+        if cursor.fetchone()[0] == _AUTO_VACUUM_INCREMENTAL:
+            return False
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        cursor.execute("VACUUM")
+        return True
+
+def reclaim_free_pages(step_pages=VACUUM_STEP_PAGES, time_budget=VACUUM_TIME_BUDGET_SECONDS):
+    """
+    Devolve páginas livres ao sistema de arquivos em passos pequenos
+
+    Cada passo é uma transação curta de PRAGMA incremental_vacuum(step_pages); para quando
+    não há mais páginas livres ou quando o orçamento de tempo se esgota.
+    Retorna o número de páginas recuperadas.
+    """
+    reclaimed = 0
+    deadline = time.monotonic() + time_budget
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA freelist_count")
+        free_pages = cursor.fetchone()[0]
+        while free_pages and time.monotonic() < deadline:
+            cursor.execute(f"PRAGMA incremental_vacuum({int(step_pages)})")
+            cursor.fetchall()
+            cursor.execute("PRAGMA freelist_count")
+            remaining = cursor.fetchone()[0]
+            if remaining >= free_pages:
+                # auto_vacuum desativado: incremental_vacuum não tem efeito
+                break
+            reclaimed += free_pages - remaining
+            free_pages = remaining
+    return reclaimed
+
+def is_wal_enabled():
+    """Indica se o banco usa journal_mode=WAL (o padrão do DevFlow Manager é o journal de rollback)"""
+    with get_db_connection() as conn:
+        return conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == 'wal'
+
+def checkpoint_wal(threshold_bytes=WAL_CHECKPOINT_THRESHOLD_BYTES):
+    """
+    Executa wal_checkpoint(TRUNCATE) se o banco usa WAL e o arquivo -wal passou do limite
+
+    Retorna True se executou.
+    """
+    if get_file_sizes()['wal'] <= threshold_bytes or not is_wal_enabled():
+        return False
+    with get_db_connection() as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+    return True
+
+def optimize_database():
+    """
+    Atualiza as estatísticas usadas pelo planejador de consultas
+
+    Na primeira execução (sem sqlite_stat1) roda um ANALYZE completo; depois, PRAGMA optimize,
+    que só reanalisa as tabelas que mudaram o suficiente desde a última análise.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            cursor.execute("ANALYZE")
+        else:
+            cursor.execute("PRAGMA optimize")
+        conn.commit()
+
+def run_maintenance(step_pages=VACUUM_STEP_PAGES, time_budget=VACUUM_TIME_BUDGET_SECONDS,
+                    wal_threshold_bytes=WAL_CHECKPOINT_THRESHOLD_BYTES, migrate_auto_vacuum=False):
+    """
+    Executa a manutenção completa e registra tamanhos antes/depois e o tempo gasto
+
+    Com migrate_auto_vacuum=True, bancos antigos são migrados para auto_vacuum incremental
+    (um VACUUM completo, ver enable_incremental_vacuum()); sem a migração, esses bancos só
+    recebem optimize e checkpoint.
+
+    Returns:
+        Dicionário com 'size_before', 'size_after' (ver get_file_sizes()), 'migrated',
+        'reclaimed_pages', 'wal_checkpointed' e 'elapsed_seconds'
+    """
+    started = time.monotonic()
+    size_before = get_file_sizes()
+
+    migrated = enable_incremental_vacuum() if migrate_auto_vacuum else False
+    optimize_database()
+    reclaimed_pages = reclaim_free_pages(step_pages, time_budget)
+    wal_checkpointed = checkpoint_wal(wal_threshold_bytes)
+
+    report = {
+        'size_before': size_before,
+        'size_after': get_file_sizes(),
+        'migrated': migrated,
+        'reclaimed_pages': reclaimed_pages,
+        'wal_checkpointed': wal_checkpointed,
+        'elapsed_seconds': round(time.monotonic() - started, 3),
+    }
+    # logging só é carregado quando a manutenção realmente roda
+    import logging
+    logging.getLogger(__name__).info(
+        "Manutenção do banco: %d -> %d bytes (WAL %d -> %d), %d página(s) recuperada(s), %.3fs",
+        size_before['database'], report['size_after']['database'],
+        size_before['wal'], report['size_after']['wal'],
+        reclaimed_pages, report['elapsed_seconds']
+    )
+    _record_run('maintenance', report)
+    return report
+
+def run_maintenance_if_due(interval_hours=MAINTENANCE_INTERVAL_HOURS):
+    """Executa run_maintenance() se a última execução foi há mais de interval_hours; senão retorna None"""
+    if not _is_due('maintenance', interval_hours):
+        return None
+    return run_maintenance()
+
+def _run_due_jobs():
+    """Executa a compactação e a manutenção devidas, registrando falhas no log"""
+    try:
+        run_compaction_if_due()
+        run_maintenance_if_due()
+    except Exception:
+        import logging
+        logging.getLogger(__name__).exception("Falha na manutenção automática do banco")
+
+def start_due_maintenance():
+    """
+    Verifica em uma thread se a compactação e a manutenção estão devidas
+
+    Pode ser chamada a cada execução do app: a verificação (consulta a maintenance_runs) é feita
+    no máximo uma vez por DUE_CHECK_INTERVAL_SECONDS para cada banco neste processo, e nem ela
+    nem a manutenção fazem a página esperar. Retorna a thread iniciada ou None.
+    """
+    db_path = get_db_path()
+    now = time.monotonic()
+    with _due_check_lock:
+        if now < _next_due_check.get(db_path, 0):
+            return None
+        _next_due_check[db_path] = now + DUE_CHECK_INTERVAL_SECONDS
+    thread = threading.Thread(target=_run_due_jobs, name="devflow-maintenance", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,180 @@
+# database/parallel_import.py
+"""
+Importação paralela de CSVs grandes de projetos
+
+O arquivo é dividido em faixas de bytes alinhadas ao fim de um registro (uma varredura que
+acompanha as aspas, de modo que quebras de linha dentro de campos entre aspas não cortam um
+registro). Cada faixa é lida, convertida e validada em um processo do pool; a validação que
+depende do banco (nomes já cadastrados ou repetidos) e a gravação ficam com um único escritor,
+que consome as faixas na ordem do arquivo. No máximo max_pending faixas ficam em andamento ou
+aguardando gravação ao mesmo tempo, limitando a memória quando o escritor é o gargalo.
+"""
+import csv
+import io
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .connection import (
+    get_db_connection, get_all_project_types, add_notification, csv_row_to_project_record,
+    validate_project_fields, _find_existing_names, _get_default_platform_id
+)
+
+# Tamanho aproximado de cada faixa enviada a um processo
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+# Bloco lido por vez ao procurar os limites das faixas
+_SCAN_BLOCK_BYTES = 1024 * 1024
+
+def split_csv_ranges(path, data_start, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Divide o arquivo a partir de data_start em faixas [início, fim) de cerca de chunk_bytes
+
+    Cada faixa termina logo após uma quebra de linha fora de aspas. Em CSV, aspas dentro de um
+    campo são duplicadas, então a paridade do número de aspas desde o início dos dados indica
+    se a posição está dentro de um campo entre aspas.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = data_start
+    target = start + chunk_bytes
+    in_quotes = False
+    with open(path, 'rb') as f:
+        f.seek(data_start)
+        position = data_start
+        while True:
+            block = f.read(_SCAN_BLOCK_BYTES)
+            if not block:
+                break
+            i = 0
+            while target < position + len(block):
+                # Avançar até o alvo e depois até a próxima quebra de linha fora de aspas
+                target_index = max(target - position, i)
+                in_quotes ^= block.count(b'"', i, target_index) % 2 == 1
+                i = target_index
+                found = False
+                while True:
+                    newline = block.find(b'\n', i)
+                    if newline == -1:
+                        in_quotes ^= block.count(b'"', i) % 2 == 1
+                        i = len(block)
+                        break
+                    in_quotes ^= block.count(b'"', i, newline) % 2 == 1
+                    i = newline + 1
+                    if not in_quotes:
+                        found = True
+                        break
+                if not found:
+                    # O limite fica no próximo bloco
+                    break
+                ranges.append((start, position + i))
+                start = position + i
+                target = start + chunk_bytes
+            in_quotes ^= block.count(b'"', i) % 2 == 1
+            position += len(block)
+    if start < size:
+        ranges.append((start, size))
+    return ranges
+
+def _parse_range(path, start, end, fieldnames, project_types):
+    """
+    Lê, converte e valida uma faixa do arquivo (executado nos processos do pool)
+
+    Returns:
+        (registros válidos, mensagens de erro) na ordem do arquivo
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start).decode('utf-8')
+    errors = []
+    records = []
+    for row in csv.DictReader(io.StringIO(data, newline=''), fieldnames=fieldnames):
+        record = csv_row_to_project_record(row, project_types, errors)
+        if record is None:
+            continue
+        record_errors = validate_project_fields(record)
+        if record_errors:
+            errors.append(f"Projeto '{record['name']}' ignorado: {'; '.join(record_errors)}")
+            continue
+        records.append(record)
+    return records, errors
+
+def _write_records(conn, records, seen_names, errors):
+    """Grava um lote validado rejeitando nomes já cadastrados ou já vistos; retorna quantos gravou"""
+    existing = _find_existing_names("projects", [record['name'] for record in records])
+    to_insert = []
+    for record in records:
+        name = record['name']
+        if name in existing:
+            errors.append(f"Projeto '{name}' ignorado: Já existe um projeto com este nome")
+        elif name in seen_names:
+            errors.append(f"Projeto '{name}' ignorado: Nome de projeto repetido no lote")
+        else:
+            seen_names.add(name)
+            to_insert.append(record)
+    if not to_insert:
+        return 0
+
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO projects (name, description, project_type_id, start_date, end_date, status) VALUES (?, ?, ?, ?, ?, ?)",
+        [(r['name'], r['description'], r['project_type_id'], r['start_date'], r['end_date'], r['status'])
+         for r in to_insert]
+    )
+    # Plataforma inicial, como em create_project()
+    cursor.execute("""
+        INSERT INTO project_platforms (project_id, platform_id, assigned_date, description)
+        SELECT id, ?, start_date, 'Plataforma inicial para o projeto ' || name
+        FROM projects WHERE name IN (SELECT value FROM json_each(?))
+    """, (_get_default_platform_id(cursor), json.dumps([record['name'] for record in to_insert])))
+    conn.commit()
+    return len(to_insert)
+
+def import_projects_parallel(path, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES, max_pending=None):
+    """
+    Importa um arquivo CSV de projetos convertendo e validando as faixas em paralelo
+
+    Tem as mesmas regras de import_projects_from_csv(), mas grava cada faixa em uma transação
+    e cria uma única notificação de resumo em vez de uma por projeto.
+
+    Args:
+        path: Caminho do arquivo CSV (precisa ser um arquivo: as faixas são lidas por posição)
+        workers: Número de processos (padrão: os.cpu_count())
+        chunk_bytes: Tamanho aproximado de cada faixa
+        max_pending: Faixas em andamento ou aguardando o escritor (padrão: 2 por processo)
+
+    Returns:
+        (número de projetos importados, lista de erros)
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    project_types = {pt.name: pt.id for pt in get_all_project_types()}
+
+    with open(path, 'rb') as f:
+        header_line = f.readline()
+    data_start = len(header_line)
+    fieldnames = next(csv.reader([header_line.decode('utf-8-sig')]), [])
+    ranges = deque(split_csv_ranges(path, data_start, chunk_bytes))
+
+    imported_count = 0
+    errors = []
+    seen_names = set()
+    with ProcessPoolExecutor(max_workers=workers) as executor, get_db_connection() as conn:
+        pending = deque()
+        while ranges or pending:
+            # Manter no máximo max_pending faixas em andamento (contrapressão)
+            while ranges and len(pending) < max_pending:
+                start, end = ranges.popleft()
+                pending.append(executor.submit(_parse_range, path, start, end, fieldnames, project_types))
+            # Gravar na ordem do arquivo: o primeiro de cada nome repetido vence
+            records, chunk_errors = pending.popleft().result()
+            errors.extend(chunk_errors)
+            imported_count += _write_records(conn, records, seen_names, errors)
+
+    if imported_count:
+        add_notification(
+            "Importação de Projetos",
+            f"{imported_count} projeto(s) importado(s) de {os.path.basename(path)}.",
+            "success"
+        )
+    return imported_count, errors
@@ -0,0 +1,90 @@
+# database/search.py
+"""
+Busca incremental de projetos com cache de resultados por sessão
+"""
+from collections import OrderedDict
+
+from .connection import get_db_path, search_projects
+from .cache import get_write_generations
+
+# Tradução usada para reproduzir o LIKE do SQLite, que ignora maiúsculas apenas em ASCII
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+def _fold(text):
+    """Normaliza o texto como o LIKE do SQLite compara"""
+    return (text or '').translate(_ASCII_LOWER)
+
+def _matches(project, folded_query):
+    """Reproduz em memória o filtro 'name LIKE %q% OR description LIKE %q%'"""
+    return folded_query in _fold(project.name) or folded_query in _fold(project.description)
+
+class ProjectSearchSession:
+    """
+    Cache de resultados da busca de projetos para uma sessão de usuário
+
+    Guarda os últimos conjuntos de resultados por (filtros, termo) em um LRU. Quando o novo
+    termo contém um termo já em cache com os mesmos filtros (ex.: "lan" -> "land"), o
+    resultado é um subconjunto do anterior e é filtrado em memória. O banco só é consultado
+    quando o termo amplia a busca, quando os filtros mudam ou quando a geração de escrita
+    das tabelas de projetos muda.
+
+    As gerações vêm do instantâneo compartilhado com database.cache, então um acerto (inclusive
+    as buscas idênticas dos reruns em sequência do Streamlit) não abre conexão. Escritas de
+    outros processos aparecem em até GENERATION_TTL segundos.
+    """
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.stats = {'database': 0, 'narrowed': 0, 'cached': 0}
+
+    def search(self, query=None, status=None, project_type_id=None):
+        """Busca projetos com a mesma semântica de search_projects()"""
+        query = query or None
+        generation = (get_db_path(), get_write_generations('projects', 'project_types'))
+        filters = (generation, status, project_type_id)
+        result = self._lookup(filters, query)
+        if result is None:
+            result = search_projects(query=query, status=status, project_type_id=project_type_id)
+            self.stats['database'] += 1
+
+        self._store(filters, query, result)
+        return result
+
+    def _lookup(self, filters, query):
+        """Procura um resultado em cache igual ou mais amplo que a busca pedida"""
+        if (filters, query) in self._entries:
+            self._entries.move_to_end((filters, query))
+            self.stats['cached'] += 1
+            return self._entries[(filters, query)]
+
+        # Curingas do LIKE não podem ser reproduzidos por busca de substring
+        if query and ('%' in query or '_' in query):
+            return None
+
+        folded_query = _fold(query)
+        best_key = None
+        for key in self._entries:
+            cached_filters, cached_query = key
+            if cached_filters != filters:
+                continue
+            if cached_query and ('%' in cached_query or '_' in cached_query):
+                continue
+            if _fold(cached_query) in folded_query:
+                if best_key is None or len(cached_query or '') > len(best_key[1] or ''):
+                    best_key = key
+        if best_key is None:
+            return None
+
+        self.stats['narrowed'] += 1
+        return [project for project in self._entries[best_key] if _matches(project, folded_query)]
+
+    def _store(self, filters, query, result):
+        """Guarda o resultado no LRU, descartando entradas de gerações antigas"""
+        generation = filters[0]
+        for key in [key for key in self._entries if key[0][0] != generation]:
+            del self._entries[key]
+        self._entries[(filters, query)] = result
+        self._entries.move_to_end((filters, query))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -47,6 +47,7 @@ CREATE TABLE IF NOT EXISTS project_platforms (
 -- Índices para melhorar performance
 CREATE INDEX IF NOT EXISTS idx_projects_type_id ON projects(project_type_id);
 CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status);
+CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name COLLATE NOCASE);
 CREATE INDEX IF NOT EXISTS idx_project_platforms_project_id ON project_platforms(project_id);
 CREATE INDEX IF NOT EXISTS idx_project_platforms_platform_id ON project_platforms(platform_id);
 CREATE INDEX IF NOT EXISTS idx_project_platforms_assigned_date ON project_platforms(assigned_date);
@@ -76,3 +77,191 @@ INSERT OR IGNORE INTO platforms (name, description) VALUES
 ('Angular', 'Framework TypeScript para aplicações web'),
 ('Laravel', 'Framework PHP para desenvolvimento web'),
 ('Custom', 'Solução desenvolvida sob medida');
+
+-- Gerações de escrita por tabela (incrementadas por triggers, usadas para invalidar caches)
+CREATE TABLE IF NOT EXISTS write_generations (
+    table_name TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO write_generations (table_name) VALUES
+('project_types'), ('platforms'), ('projects'), ('project_platforms');
+
+CREATE TRIGGER IF NOT EXISTS trg_project_types_generation_insert AFTER INSERT ON project_types
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_types_generation_update AFTER UPDATE ON project_types
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_types_generation_delete AFTER DELETE ON project_types
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_platforms_generation_insert AFTER INSERT ON platforms
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'platforms';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_platforms_generation_update AFTER UPDATE ON platforms
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'platforms';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_platforms_generation_delete AFTER DELETE ON platforms
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'platforms';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_generation_insert AFTER INSERT ON projects
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'projects';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_generation_update AFTER UPDATE ON projects
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'projects';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_generation_delete AFTER DELETE ON projects
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'projects';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_platforms_generation_insert AFTER INSERT ON project_platforms
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_platforms';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_platforms_generation_update AFTER UPDATE ON project_platforms
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_platforms';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_platforms_generation_delete AFTER DELETE ON project_platforms
+BEGIN
+    UPDATE write_generations SET generation = generation + 1 WHERE table_name = 'project_platforms';
+END;
+
+-- Fatos mensais de projetos (mantidos incrementalmente por triggers em projects e em
+-- project_status_history): created_count conta os projetos pelo mês de início;
+-- completed_count/cancelled_count, pelo mês em que o projeto entrou no status (changed_at do
+-- histórico). São fatos históricos: excluir um projeto não altera as contagens.
+-- Bancos existentes são recalculados por _migrate_monthly_stats (database/connection.py)
+CREATE TABLE IF NOT EXISTS project_monthly_stats (
+    month TEXT NOT NULL,
+    project_type_id INTEGER NOT NULL,
+    created_count INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    cancelled_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (month, project_type_id)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_monthly_created_insert AFTER INSERT ON projects
+BEGIN
+    INSERT INTO project_monthly_stats (month, project_type_id, created_count)
+    SELECT strftime('%Y-%m', NEW.start_date), NEW.project_type_id, 1
+    WHERE strftime('%Y-%m', NEW.start_date) IS NOT NULL
+    ON CONFLICT(month, project_type_id) DO UPDATE SET created_count = created_count + excluded.created_count;
+END;
+
+-- Mudanças de data de início ou de tipo movem a contagem de criação; mudanças de tipo também
+-- movem a conclusão/cancelamento em vigor para o novo tipo, no mesmo mês
+CREATE TRIGGER IF NOT EXISTS trg_projects_monthly_created_update AFTER UPDATE OF start_date, project_type_id ON projects
+WHEN OLD.start_date IS NOT NEW.start_date OR OLD.project_type_id IS NOT NEW.project_type_id
+BEGIN
+    INSERT INTO project_monthly_stats (month, project_type_id, created_count)
+    SELECT strftime('%Y-%m', OLD.start_date), OLD.project_type_id, -1
+    WHERE strftime('%Y-%m', OLD.start_date) IS NOT NULL
+    ON CONFLICT(month, project_type_id) DO UPDATE SET created_count = created_count + excluded.created_count;
+    INSERT INTO project_monthly_stats (month, project_type_id, created_count)
+    SELECT strftime('%Y-%m', NEW.start_date), NEW.project_type_id, 1
+    WHERE strftime('%Y-%m', NEW.start_date) IS NOT NULL
+    ON CONFLICT(month, project_type_id) DO UPDATE SET created_count = created_count + excluded.created_count;
+    INSERT INTO project_monthly_stats (month, project_type_id, completed_count, cancelled_count)
+    SELECT month, type_id, sign * (OLD.status = 'Concluído'), sign * (OLD.status = 'Cancelado')
+    FROM (
+        SELECT strftime('%Y-%m', (
+            SELECT h.changed_at FROM project_status_history h
+            WHERE h.project_id = OLD.id AND h.new_status = OLD.status
+            ORDER BY h.id DESC LIMIT 1
+        )) AS month
+    ), (SELECT OLD.project_type_id AS type_id, -1 AS sign UNION ALL SELECT NEW.project_type_id, 1)
+    WHERE OLD.status IN ('Concluído', 'Cancelado')
+      AND OLD.project_type_id IS NOT NEW.project_type_id
+      AND month IS NOT NULL
+    ON CONFLICT(month, project_type_id) DO UPDATE SET
+        completed_count = completed_count + excluded.completed_count,
+        cancelled_count = cancelled_count + excluded.cancelled_count;
+END;
+
+-- Histórico de status dos projetos (somente inserção, alimentado por triggers em projects)
+CREATE TABLE IF NOT EXISTS project_status_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL,
+    old_status TEXT,
+    new_status TEXT NOT NULL,
+    changed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_project_status_history_project ON project_status_history(project_id, changed_at);
+
+-- Status inicial dos projetos criados antes do histórico
+INSERT INTO project_status_history (project_id, old_status, new_status, changed_at)
+SELECT p.id, NULL, p.status, p.created_at
+FROM projects p
+WHERE NOT EXISTS (SELECT 1 FROM project_status_history h WHERE h.project_id = p.id);
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_status_history_insert AFTER INSERT ON projects
+BEGIN
+    INSERT INTO project_status_history (project_id, old_status, new_status) VALUES (NEW.id, NULL, NEW.status);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_status_history_update AFTER UPDATE OF status ON projects
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    INSERT INTO project_status_history (project_id, old_status, new_status) VALUES (NEW.id, OLD.status, NEW.status);
+END;
+
+-- Conclusões e cancelamentos entram no mês da transição; reabrir um projeto desconta a
+-- transição anterior, no mês em que ela aconteceu
+CREATE TRIGGER IF NOT EXISTS trg_project_status_history_monthly AFTER INSERT ON project_status_history
+WHEN NEW.new_status IN ('Concluído', 'Cancelado') OR NEW.old_status IN ('Concluído', 'Cancelado')
+BEGIN
+    INSERT INTO project_monthly_stats (month, project_type_id, completed_count, cancelled_count)
+    SELECT strftime('%Y-%m', (
+               SELECT h.changed_at FROM project_status_history h
+               WHERE h.project_id = NEW.project_id AND h.new_status = NEW.old_status AND h.id < NEW.id
+               ORDER BY h.id DESC LIMIT 1
+           )) AS month,
+           p.project_type_id, -(NEW.old_status = 'Concluído'), -(NEW.old_status = 'Cancelado')
+    FROM projects p
+    WHERE p.id = NEW.project_id
+      AND NEW.old_status IN ('Concluído', 'Cancelado')
+      AND month IS NOT NULL
+    ON CONFLICT(month, project_type_id) DO UPDATE SET
+        completed_count = completed_count + excluded.completed_count,
+        cancelled_count = cancelled_count + excluded.cancelled_count;
+    INSERT INTO project_monthly_stats (month, project_type_id, completed_count, cancelled_count)
+    SELECT strftime('%Y-%m', NEW.changed_at), p.project_type_id,
+           (NEW.new_status = 'Concluído'), (NEW.new_status = 'Cancelado')
+    FROM projects p
+    WHERE p.id = NEW.project_id
+      AND NEW.new_status IN ('Concluído', 'Cancelado')
+      AND strftime('%Y-%m', NEW.changed_at) IS NOT NULL
+    ON CONFLICT(month, project_type_id) DO UPDATE SET
+        completed_count = completed_count + excluded.completed_count,
+        cancelled_count = cancelled_count + excluded.cancelled_count;
+END;
+
+-- Registro de execução das rotinas de manutenção (compactação de órfãos, otimização)
+CREATE TABLE IF NOT EXISTS maintenance_runs (
+    job TEXT PRIMARY KEY,
+    last_run_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    details TEXT
+);
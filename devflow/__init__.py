@@ -0,0 +1,5 @@
+"""
+Interface de linha de comando do DevFlow Manager
+
+Executada com `python -m devflow`; usa apenas a camada de dados (database/), sem Streamlit.
+"""
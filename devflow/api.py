@@ -0,0 +1,332 @@
+# devflow/api.py
+"""
+API HTTP/JSON do DevFlow Manager (somente biblioteca padrão)
+
+Rotas:
+    GET    /projects?limit=&after=&status=&project_type_id=   lista paginada por keyset
+    POST   /projects                                          cria um projeto
+    GET    /projects/<id>                                     detalhes de um projeto
+    PUT    /projects/<id>                                     atualiza campos de um projeto
+    DELETE /projects/<id>                                     exclui um projeto
+    GET    /projects/<id>/platforms                           histórico de plataformas
+    GET    /projects/<id>/status-history                      histórico de status
+    GET    /projects/<id>/collaborators                       colaboradores
+    POST   /projects/<id>/collaborators                       adiciona um colaborador
+    GET    /statistics                                        estatísticas gerais
+    GET    /notifications?limit=&before=&type=&read=&since=&until=
+                                                              notificações paginadas por keyset
+                                                              (before: cursor 'next_before')
+    POST   /notifications/<id>/read                           marca uma notificação como lida
+
+Respostas GET levam um ETag derivado da geração de escrita das tabelas lidas: um
+If-None-Match igual é respondido com 304 sem executar a consulta da rota. Corpos maiores que
+GZIP_MIN_BYTES são comprimidos quando o cliente aceita gzip. Datas (since/until, created_at)
+estão em UTC.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from database import cache
+from database.connection import (
+    get_db_path, get_write_generation, create_project, update_project, delete_project,
+    add_collaborator_to_project, mark_notification_as_read, validate_project_data, PROJECT_STATUSES
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# Corpos menores que isso não compensam a compressão
+GZIP_MIN_BYTES = 1024
+# Tipo esperado de cada campo aceito nos corpos JSON
+_TEXT_FIELDS = ('name', 'description', 'status', 'user_name', 'user_email', 'role')
+_DATE_FIELDS = ('start_date', 'end_date')
+_INT_FIELDS = ('project_type_id',)
+
+class ApiError(Exception):
+    """Erro com código HTTP, devolvido ao cliente como {"error": mensagem}"""
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _int_param(query, name, default=None, maximum=None):
+    """Lê um parâmetro inteiro da query string"""
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise ApiError(400, f"Parâmetro '{name}' deve ser um número inteiro")
+    if value < 0:
+        raise ApiError(400, f"Parâmetro '{name}' não pode ser negativo")
+    return min(value, maximum) if maximum else value
+
+def _project_to_dict(project):
+    """Converte um Project (inclusive atributos extras, como project_type_name) em dicionário"""
+    return dict(vars(project))
+
+def _get_project_or_404(project_id):
+    project = cache.get_project_by_id(project_id)
+    if project is None:
+        raise ApiError(404, f"Projeto {project_id} não encontrado")
+    return project
+
+def _list_projects(match, query):
+    page = cache.get_projects_page(
+        after_id=_int_param(query, 'after'),
+        limit=_int_param(query, 'limit', DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE) or DEFAULT_PAGE_SIZE,
+        status=query.get('status', [None])[0],
+        project_type_id=_int_param(query, 'project_type_id')
+    )
+    return {'projects': [_project_to_dict(p) for p in page['projects']], 'next_after': page['next_after']}
+
+def _show_project(match, query):
+    return _project_to_dict(_get_project_or_404(int(match.group(1))))
+
+def _project_platforms(match, query):
+    project_id = int(match.group(1))
+    _get_project_or_404(project_id)
+    return cache.get_project_platforms_history(project_id)
+
+def _project_status_history(match, query):
+    project_id = int(match.group(1))
+    _get_project_or_404(project_id)
+    return cache.get_project_status_history(project_id)
+
+def _project_collaborators(match, query):
+    project_id = int(match.group(1))
+    _get_project_or_404(project_id)
+    return cache.get_project_collaborators(project_id)
+
+def _statistics(match, query):
+    return cache.get_project_statistics()
+
+def _date_param(query, name):
+    """Lê um parâmetro de data YYYY-MM-DD da query string"""
+    value = query.get(name, [None])[0]
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ApiError(400, f"Parâmetro '{name}' deve ser uma data YYYY-MM-DD")
+
+def _list_notifications(match, query):
+    read = query.get('read', [None])[0]
+    if read not in (None, 'true', 'false'):
+        raise ApiError(400, "Parâmetro 'read' deve ser 'true' ou 'false'")
+    arguments = {
+        'limit': _int_param(query, 'limit', DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE) or DEFAULT_PAGE_SIZE,
+        'notification_type': query.get('type', [None])[0],
+        'is_read': None if read is None else read == 'true',
+        'start_date': _date_param(query, 'since'),
+        'end_date': _date_param(query, 'until')
+    }
+    try:
+        # 'before' é o cursor opaco 'next_before' da página anterior
+        return cache.get_notifications_page(before=query.get('before', [None])[0], **arguments)
+    except ValueError as e:
+        raise ApiError(400, f"Parâmetro 'before' inválido: {e}")
+
+# Rotas GET: (padrão, tabelas que definem o ETag, se depende da data, função(match, query) -> dados)
+GET_ROUTES = [
+    (re.compile(r'^/projects$'), ('projects', 'project_types'), False, _list_projects),
+    (re.compile(r'^/projects/(\d+)$'), ('projects', 'project_types'), False, _show_project),
+    (re.compile(r'^/projects/(\d+)/platforms$'), ('projects', 'project_platforms', 'platforms'), False, _project_platforms),
+    (re.compile(r'^/projects/(\d+)/status-history$'), ('projects',), False, _project_status_history),
+    (re.compile(r'^/projects/(\d+)/collaborators$'), ('projects', 'project_collaborators', 'people'), False, _project_collaborators),
+    (re.compile(r'^/statistics$'), ('projects', 'project_types'), True, _statistics),
+    (re.compile(r'^/notifications$'), ('notifications',), False, _list_notifications),
+]
+
+def _require_fields(fields, names):
+    """
+    Rejeita campos obrigatórios ausentes, campos com o tipo JSON errado e status desconhecidos
+    antes da validação (que espera textos, datas em texto e IDs inteiros)
+    """
+    missing = [name for name in names if fields.get(name) in (None, '')]
+    if missing:
+        raise ApiError(400, f"Campos obrigatórios ausentes: {', '.join(missing)}")
+    for name, value in fields.items():
+        if value is None:
+            continue
+        if name in _DATE_FIELDS and not isinstance(value, str):
+            raise ApiError(400, f"Campo '{name}' deve ser uma data YYYY-MM-DD")
+        if name in _TEXT_FIELDS and not isinstance(value, str):
+            raise ApiError(400, f"Campo '{name}' deve ser um texto")
+        # bool é subclasse de int, mas true/false não são IDs
+        if name in _INT_FIELDS and (not isinstance(value, int) or isinstance(value, bool)):
+            raise ApiError(400, f"Campo '{name}' deve ser um número inteiro")
+    status = fields.get('status')
+    if status is not None and status not in PROJECT_STATUSES:
+        raise ApiError(400, f"Status inválido: {status}. Use um de: {', '.join(PROJECT_STATUSES)}")
+
+def _create_project(match, body):
+    _require_fields(body, ('name', 'project_type_id', 'start_date'))
+    errors = validate_project_data(
+        body.get('name'), body.get('description'), body.get('project_type_id'),
+        body.get('start_date'), body.get('end_date')
+    )
+    if errors:
+        raise ApiError(400, "; ".join(errors))
+    project_id = create_project(
+        body['name'], body.get('description'), body['project_type_id'], body['start_date'],
+        body.get('end_date'), body.get('status') or "Planejamento"
+    )
+    return 201, _project_to_dict(cache.get_project_by_id(project_id))
+
+def _update_project(match, body):
+    project = _get_project_or_404(int(match.group(1)))
+    fields = {
+        name: body.get(name, getattr(project, name))
+        for name in ('name', 'description', 'project_type_id', 'start_date', 'end_date', 'status')
+    }
+    _require_fields(fields, ('name', 'project_type_id', 'start_date', 'status'))
+    errors = validate_project_data(
+        fields['name'], fields['description'], fields['project_type_id'], fields['start_date'], fields['end_date'],
+        exclude_id=project.id
+    )
+    if errors:
+        raise ApiError(400, "; ".join(errors))
+    update_project(project.id, **fields)
+    return 200, _project_to_dict(cache.get_project_by_id(project.id))
+
+def _delete_project(match, body):
+    project = _get_project_or_404(int(match.group(1)))
+    delete_project(project.id)
+    return 204, None
+
+def _add_collaborator(match, body):
+    project = _get_project_or_404(int(match.group(1)))
+    _require_fields(body, ())
+    if not (body.get('user_name') or '').strip():
+        raise ApiError(400, "Nome do colaborador é obrigatório")
+    collaborator_id = add_collaborator_to_project(
+        project.id, body['user_name'].strip(), body.get('user_email'), body.get('role') or "member"
+    )
+    return 201, {'id': collaborator_id}
+
+def _mark_notification_read(match, body):
+    if not mark_notification_as_read(int(match.group(1))):
+        raise ApiError(404, f"Notificação {match.group(1)} não encontrada")
+    return 200, {'id': int(match.group(1)), 'is_read': True}
+
+# Rotas de escrita: (método, padrão, função(match, corpo JSON) -> (status, dados))
+WRITE_ROUTES = [
+    ('POST', re.compile(r'^/projects$'), _create_project),
+    ('PUT', re.compile(r'^/projects/(\d+)$'), _update_project),
+    ('DELETE', re.compile(r'^/projects/(\d+)$'), _delete_project),
+    ('POST', re.compile(r'^/projects/(\d+)/collaborators$'), _add_collaborator),
+    ('POST', re.compile(r'^/notifications/(\d+)/read$'), _mark_notification_read),
+]
+
+def compute_etag(table_names, depends_on_date, path, query_string):
+    """ETag fraco derivado do banco, da geração de escrita das tabelas e da URL"""
+    key = repr((get_db_path(), get_write_generation(*table_names),
+                date.today() if depends_on_date else None, path, query_string))
+    return 'W/"' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:20] + '"'
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """Despacha as requisições para as rotas GET e de escrita"""
+    server_version = "DevFlowAPI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        # Silencioso por padrão; o servidor é usado por outras ferramentas e pelo teste de carga
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            for pattern, table_names, depends_on_date, handler in GET_ROUTES:
+                match = pattern.match(url.path)
+                if match is None:
+                    continue
+                etag = compute_etag(table_names, depends_on_date, url.path, url.query)
+                if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+                    self._send(304, None, etag=etag)
+                    return
+                self._send(200, handler(match, parse_qs(url.query)), etag=etag)
+                return
+            raise ApiError(404, "Rota não encontrada")
+        except ApiError as e:
+            self._send(e.status, {'error': e.message})
+        except Exception:
+            self._send_internal_error()
+
+    def _do_write(self):
+        url = urlsplit(self.path)
+        try:
+            allowed = False
+            for method, pattern, handler in WRITE_ROUTES:
+                match = pattern.match(url.path)
+                if match is None:
+                    continue
+                allowed = True
+                if method == self.command:
+                    status, data = handler(match, self._read_json())
+                    self._send(status, data)
+                    return
+            raise ApiError(405 if allowed else 404, "Método não permitido" if allowed else "Rota não encontrada")
+        except ApiError as e:
+            self._send(e.status, {'error': e.message})
+        except sqlite3.IntegrityError as e:
+            # Ex.: project_type_id inexistente (chave estrangeira)
+            self._send(409, {'error': f"Violação de integridade: {e}"})
+        except Exception:
+            self._send_internal_error()
+
+    do_POST = do_PUT = do_DELETE = _do_write
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            raise ApiError(400, "Corpo da requisição não é um JSON válido")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Corpo da requisição deve ser um objeto JSON")
+        return body
+
+    def _send_internal_error(self):
+        # O texto da exceção (SQL, caminhos) fica no log, não na resposta
+        logger.exception("Erro interno em %s %s", self.command, self.path)
+        self._send(500, {'error': "Erro interno do servidor"})
+
+    def _send(self, status, data, etag=None):
+        body = b'' if data is None else json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if body:
+            if len(body) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip.compress(body, compresslevel=5)
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+class ApiServer(ThreadingHTTPServer):
+    """Servidor HTTP com uma thread por conexão"""
+    daemon_threads = True
+    # A fila padrão (5) descarta conexões sob carga e o cliente só tenta de novo após 1s
+    request_queue_size = 128
+
+def create_server(host='127.0.0.1', port=8000):
+    """Cria o servidor HTTP; port=0 escolhe uma porta livre"""
+    return ApiServer((host, port), ApiRequestHandler)
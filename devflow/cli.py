@@ -0,0 +1,322 @@
+# devflow/cli.py
+"""
+Comandos de importação, exportação, backup/restauração, migração e manutenção
+
+Pensado para tarefas agendadas (cron): lê e escreve em arquivos ou stdin/stdout sem manter
+o conjunto de dados inteiro em memória e informa a vazão de cada operação em stderr.
+Nunca importa streamlit, plotly ou pandas.
+
+Exemplos:
+    python -m devflow export -o projetos.csv
+    python -m devflow export --xlsx -o relatorio.xlsx
+    python -m devflow import projetos.csv
+    python -m devflow import --upsert sincronizacao.csv
+    python -m devflow import --workers 8 exportacao_legada.csv
+    python -m devflow --db /dados/devflow.db backup -o backup.db
+    python -m devflow dump -o devflow.ndjson.gz
+    python -m devflow --db /dados/homologacao.db load devflow.ndjson.gz
+    python -m devflow maintenance --compact-orphans
+    python -m devflow profile-startup --budget-ms 100
+    python -m devflow serve --port 8000
+    python -m devflow loadtest --requests 2000 --concurrency 16
+    python -m devflow benchmark-import --rows 200000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Permite executar a partir de qualquer diretório
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, write_projects_csv, write_workbook_xlsx, import_projects_from_csv, upsert_projects_from_csv,
+    backup_database, restore_database
+)
+from database.maintenance import run_maintenance, compact_orphans, is_incremental_vacuum_enabled
+from .profiling import DASHBOARD_STARTUP_BUDGET_MS
+
+def _report(action, count, unit, started):
+    """Escreve em stderr a quantidade processada, o tempo e a vazão"""
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else 0
+    print(f"{action}: {count} {unit} em {elapsed:.2f}s ({rate:.0f} {unit}/s)", file=sys.stderr)
+
+def _open_text(path, mode):
+    """Abre um arquivo de texto ou retorna stdin/stdout quando o caminho é '-'"""
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        return open(stream.fileno(), mode, encoding='utf-8', newline='', closefd=False)
+    return open(path, mode, encoding='utf-8', newline='')
+
+def cmd_export(args):
+    """Exporta todos os projetos em CSV ou, com --xlsx, a planilha Excel completa"""
+    started = time.perf_counter()
+    if args.xlsx:
+        output = sys.stdout.buffer if args.output == '-' else args.output
+        counts = write_workbook_xlsx(output)
+        for title, count in counts.items():
+            print(f"{title}: {count}", file=sys.stderr)
+        _report("Exportação", sum(counts.values()), "linhas", started)
+        return 0
+    with _open_text(args.output, 'w') as output:
+        count = write_projects_csv(output)
+    _report("Exportação", count, "projetos", started)
+    return 0
+
+def cmd_import(args):
+    """Importa projetos de um CSV (com --upsert, sincroniza pelo nome sem duplicar)"""
+    started = time.perf_counter()
+    if args.notification_details and (args.upsert or args.workers):
+        print("--notification-details não pode ser combinado com --upsert ou --workers "
+              "(ambos criam uma única notificação de resumo)", file=sys.stderr)
+        return 2
+    if args.workers:
+        if args.upsert or args.input == '-':
+            print("--workers exige um arquivo (não stdin) e não pode ser combinado com --upsert", file=sys.stderr)
+            return 2
+        from database.parallel_import import import_projects_parallel
+
+        imported_count, errors = import_projects_parallel(args.input, workers=args.workers)
+        for error in errors:
+            print(error, file=sys.stderr)
+        _report("Importação", imported_count, "projetos", started)
+        return 1 if errors else 0
+    with _open_text(args.input, 'r') as csv_file:
+        if args.upsert:
+            result = upsert_projects_from_csv(csv_file)
+            errors = result['errors']
+            imported_count = result['inserted'] + result['updated'] + result['unchanged']
+        else:
+            imported_count, errors = import_projects_from_csv(
+                csv_file, keep_notification_details=args.notification_details
+            )
+    for error in errors:
+        print(error, file=sys.stderr)
+    if args.upsert:
+        print(f"{result['inserted']} inserido(s), {result['updated']} atualizado(s), "
+              f"{result['unchanged']} sem alteração", file=sys.stderr)
+    _report("Importação", imported_count, "projetos", started)
+    return 1 if errors else 0
+
+def cmd_backup(args):
+    """Copia o banco de dados para um arquivo de backup"""
+    started = time.perf_counter()
+    backup_path = backup_database(args.output)
+    size = os.path.getsize(backup_path)
+    print(backup_path)
+    _report("Backup", size // 1024, "KB", started)
+    return 0
+
+def cmd_restore(args):
+    """Substitui o banco de dados por um backup"""
+    if not os.path.exists(args.backup):
+        print(f"Backup não encontrado: {args.backup}", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    restore_database(args.backup)
+    # Um backup antigo pode não ter as tabelas e colunas mais recentes
+    init_db()
+    _report("Restauração", os.path.getsize(args.backup) // 1024, "KB", started)
+    return 0
+
+def cmd_dump(args):
+    """Exporta todas as tabelas em NDJSON (gzip se o arquivo terminar em .gz)"""
+    from database.dump import dump_database, open_dump
+
+    started = time.perf_counter()
+    if args.output == '-':
+        with _open_text('-', 'w') as output:
+            counts = dump_database(output)
+    else:
+        with open_dump(args.output, 'w') as output:
+            counts = dump_database(output)
+    for table, count in counts.items():
+        print(f"{table}: {count}", file=sys.stderr)
+    _report("Dump", sum(counts.values()), "linhas", started)
+    return 0
+
+def cmd_load(args):
+    """Substitui os dados do banco pelo conteúdo de um dump NDJSON, após um backup"""
+    from database.dump import restore_dump, open_dump
+
+    if args.input != '-' and not os.path.exists(args.input):
+        print(f"Dump não encontrado: {args.input}", file=sys.stderr)
+        return 1
+    if not args.no_backup:
+        print(f"Backup dos dados atuais: {backup_database()}", file=sys.stderr)
+    started = time.perf_counter()
+    try:
+        if args.input == '-':
+            with _open_text('-', 'r') as dump_file:
+                counts = restore_dump(dump_file)
+        else:
+            with open_dump(args.input, 'r') as dump_file:
+                counts = restore_dump(dump_file)
+    except ValueError as e:
+        print(f"Dump inválido: {e}", file=sys.stderr)
+        return 1
+    for table, count in counts.items():
+        print(f"{table}: {count}", file=sys.stderr)
+    _report("Carga", sum(counts.values()), "linhas", started)
+    return 0
+
+def cmd_migrate(args):
+    """Cria ou atualiza o esquema do banco de dados"""
+    started = time.perf_counter()
+    init_db()
+    print(f"Esquema atualizado em {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    return 0
+
+def cmd_maintenance(args):
+    """Executa a manutenção do banco e, opcionalmente, a compactação de órfãos"""
+    if args.compact_orphans:
+        result = compact_orphans()
+        for table, deleted in result['deleted'].items():
+            print(f"{table}: {deleted} registro(s) órfão(s) excluído(s)", file=sys.stderr)
+        if result['violations']:
+            print(f"{len(result['violations'])} violação(ões) de chave estrangeira restante(s)", file=sys.stderr)
+    if not is_incremental_vacuum_enabled():
+        print("Migrando o banco para auto_vacuum incremental (VACUUM completo, pode demorar em bancos grandes)...",
+              file=sys.stderr)
+    report = run_maintenance(migrate_auto_vacuum=True)
+    print(
+        f"Banco: {report['size_before']['database'] // 1024} KB -> {report['size_after']['database'] // 1024} KB, "
+        f"{report['reclaimed_pages']} página(s) recuperada(s) em {report['elapsed_seconds']:.2f}s",
+        file=sys.stderr
+    )
+    return 1 if args.compact_orphans and result['violations'] else 0
+
+def cmd_profile_startup(args):
+    """Mede o tempo de inicialização a frio do painel por módulo e o tempo de init_db"""
+    from .profiling import profile_startup, format_report
+
+    report = profile_startup(budget_ms=args.budget_ms)
+    print(format_report(report, top=args.top))
+    return 0 if report['within_budget'] else 1
+
+def cmd_serve(args):
+    """Executa a API HTTP/JSON até ser interrompida"""
+    from .api import create_server
+
+    server = create_server(args.host, args.port)
+    print(f"API em http://{server.server_address[0]}:{server.server_address[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+def cmd_benchmark_import(args):
+    """Mede a vazão da importação paralela com 1, 2, 4, ... processos"""
+    from .import_benchmark import run_import_benchmark, format_report
+
+    worker_counts = [int(value) for value in args.workers.split(',')] if args.workers else None
+    results = run_import_benchmark(rows=args.rows, worker_counts=worker_counts)
+    print(format_report(results, args.rows))
+    return 0
+
+def cmd_loadtest(args):
+    """Executa o teste de carga contra --url ou contra um servidor local iniciado para o teste"""
+    import threading
+    from .loadtest import run_load_test, format_report
+
+    server = None
+    url = args.url
+    if url is None:
+        from .api import create_server
+
+        server = create_server('127.0.0.1', 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        report = run_load_test(url, args.requests, args.concurrency, conditional=not args.no_etag)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    print(format_report(report))
+    return 1 if report['errors'] else 0
+
+def build_parser():
+    """Monta o parser de argumentos com um subcomando por operação"""
+    parser = argparse.ArgumentParser(prog="python -m devflow", description="DevFlow Manager sem interface web")
+    parser.add_argument("--db", help="Caminho do banco de dados (padrão: variável DB_NAME ou devflow_manager.db)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Exporta os projetos em CSV")
+    export_parser.add_argument("-o", "--output", default="-", help="Arquivo de saída ('-' para stdout)")
+    export_parser.add_argument("--xlsx", action="store_true",
+                               help="Planilha Excel com projetos, históricos, colaboradores e estatísticas")
+    export_parser.set_defaults(func=cmd_export)
+
+    import_parser = subparsers.add_parser("import", help="Importa projetos de um CSV")
+    import_parser.add_argument("input", nargs="?", default="-", help="Arquivo CSV ('-' para stdin)")
+    import_parser.add_argument("--upsert", action="store_true",
+                               help="Atualiza projetos existentes com o mesmo nome em vez de rejeitá-los")
+    import_parser.add_argument("--workers", type=int,
+                               help="Converte e valida o arquivo em paralelo com N processos")
+    import_parser.add_argument("--notification-details", action="store_true",
+                               help="Guarda o nome de cada projeto importado na notificação de resumo "
+                                    "(sem --upsert ou --workers)")
+    import_parser.set_defaults(func=cmd_import)
+
+    backup_parser = subparsers.add_parser("backup", help="Cria um backup do banco de dados")
+    backup_parser.add_argument("-o", "--output", help="Arquivo de backup (padrão: ao lado do banco)")
+    backup_parser.set_defaults(func=cmd_backup)
+
+    restore_parser = subparsers.add_parser("restore", help="Restaura o banco de dados a partir de um backup")
+    restore_parser.add_argument("backup", help="Arquivo de backup")
+    restore_parser.set_defaults(func=cmd_restore)
+
+    dump_parser = subparsers.add_parser("dump", help="Exporta todas as tabelas em NDJSON (.gz para comprimir)")
+    dump_parser.add_argument("-o", "--output", default="-", help="Arquivo de saída ('-' para stdout)")
+    dump_parser.set_defaults(func=cmd_dump)
+
+    load_parser = subparsers.add_parser("load", help="Substitui os dados pelo conteúdo de um dump NDJSON")
+    load_parser.add_argument("input", help="Arquivo de dump ('-' para stdin)")
+    load_parser.add_argument("--no-backup", action="store_true", help="Não criar backup antes de substituir os dados")
+    load_parser.set_defaults(func=cmd_load)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Cria ou atualiza o esquema do banco")
+    migrate_parser.set_defaults(func=cmd_migrate)
+
+    maintenance_parser = subparsers.add_parser("maintenance", help="Otimiza o banco e recupera espaço livre")
+    maintenance_parser.add_argument("--compact-orphans", action="store_true", help="Exclui também registros órfãos")
+    maintenance_parser.set_defaults(func=cmd_maintenance)
+
+    profile_parser = subparsers.add_parser("profile-startup", help="Mede o tempo de inicialização do painel")
+    profile_parser.add_argument("--top", type=int, default=15, help="Número de módulos mais lentos exibidos")
+    profile_parser.add_argument("--budget-ms", type=int, default=DASHBOARD_STARTUP_BUDGET_MS,
+                                help="Orçamento de inicialização a frio em milissegundos")
+    profile_parser.set_defaults(func=cmd_profile_startup)
+
+    serve_parser = subparsers.add_parser("serve", help="Executa a API HTTP/JSON")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Endereço de escuta")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Porta de escuta")
+    serve_parser.set_defaults(func=cmd_serve)
+
+    loadtest_parser = subparsers.add_parser("loadtest", help="Teste de carga da API HTTP")
+    loadtest_parser.add_argument("--url", help="Servidor a testar (padrão: inicia um servidor local)")
+    loadtest_parser.add_argument("--requests", type=int, default=1000, help="Total de requisições")
+    loadtest_parser.add_argument("--concurrency", type=int, default=8, help="Requisições simultâneas")
+    loadtest_parser.add_argument("--no-etag", action="store_true", help="Não reenviar ETags (sem GET condicional)")
+    loadtest_parser.set_defaults(func=cmd_loadtest)
+
+    benchmark_parser = subparsers.add_parser("benchmark-import", help="Benchmark da importação paralela")
+    benchmark_parser.add_argument("--rows", type=int, default=100000, help="Projetos no CSV sintético")
+    benchmark_parser.add_argument("--workers", help="Números de processos separados por vírgula (padrão: 1, 2, 4, ... núcleos)")
+    benchmark_parser.set_defaults(func=cmd_benchmark_import)
+
+    return parser
+
+def main(argv=None):
+    """Ponto de entrada da CLI; retorna o código de saída"""
+    args = build_parser().parse_args(argv)
+    if args.db:
+        os.environ['DB_NAME'] = os.path.abspath(args.db)
+    if args.command not in ('restore', 'migrate', 'profile-startup', 'benchmark-import'):
+        init_db()
+    return args.func(args)
@@ -0,0 +1,84 @@
+# devflow/import_benchmark.py
+"""
+Benchmark da importação paralela de CSV
+
+Gera um CSV sintético de projetos e o importa em bancos temporários com 1, 2, 4, ... processos
+(até o número de núcleos), informando o tempo, a vazão e o ganho em relação a um processo.
+"""
+import csv
+import os
+import tempfile
+import time
+
+from database.connection import EXPORT_CSV_HEADER, init_db
+from database.parallel_import import import_projects_parallel, DEFAULT_CHUNK_BYTES
+
+STATUSES = ["Planejamento", "Em Desenvolvimento", "Testes", "Implantação", "Concluído", "Cancelado"]
+
+def generate_csv(path, rows):
+    """Escreve um CSV sintético com 'rows' projetos válidos de tipos padrão"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_CSV_HEADER)
+        for i in range(rows):
+            writer.writerow([
+                '', f"Projeto Benchmark {i}", f"Descrição do projeto {i}, com vírgula\ne quebra de linha",
+                "Landing Page" if i % 2 else "Chatbot",
+                f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}", f"2027-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                STATUSES[i % len(STATUSES)], '', ''
+            ])
+
+def default_worker_counts():
+    """1, 2, 4, ... até o número de núcleos (inclusive)"""
+    cpus = os.cpu_count() or 1
+    counts = []
+    workers = 1
+    while workers < cpus:
+        counts.append(workers)
+        workers *= 2
+    counts.append(cpus)
+    return counts
+
+def run_import_benchmark(rows=100000, worker_counts=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Importa o mesmo CSV sintético com cada número de processos, em um banco novo por execução
+
+    Returns:
+        Lista de dicionários com 'workers', 'seconds', 'rows_per_second' e 'speedup'
+    """
+    worker_counts = worker_counts or default_worker_counts()
+    previous_db = os.environ.get('DB_NAME')
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, 'projetos.csv')
+        generate_csv(csv_path, rows)
+        try:
+            for workers in worker_counts:
+                os.environ['DB_NAME'] = os.path.join(temp_dir, f'benchmark_{workers}.db')
+                init_db()
+                started = time.perf_counter()
+                imported_count, errors = import_projects_parallel(csv_path, workers=workers, chunk_bytes=chunk_bytes)
+                seconds = time.perf_counter() - started
+                if errors or imported_count != rows:
+                    raise RuntimeError(f"Importação incompleta com {workers} processo(s): {imported_count}/{rows}")
+                results.append({
+                    'workers': workers,
+                    'seconds': seconds,
+                    'rows_per_second': rows / seconds if seconds else 0.0,
+                    'speedup': results[0]['seconds'] / seconds if results and seconds else 1.0
+                })
+        finally:
+            if previous_db is None:
+                os.environ.pop('DB_NAME', None)
+            else:
+                os.environ['DB_NAME'] = previous_db
+    return results
+
+def format_report(results, rows):
+    """Formata o resultado de run_import_benchmark() como tabela de texto"""
+    lines = [f"{rows} projetos, {os.cpu_count() or 1} núcleo(s)", "processos   tempo (s)   projetos/s   ganho"]
+    for result in results:
+        lines.append(
+            f"{result['workers']:>9}   {result['seconds']:>9.2f}   {result['rows_per_second']:>10.0f}   {result['speedup']:>4.2f}x"
+        )
+    return "\n".join(lines)
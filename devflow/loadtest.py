@@ -0,0 +1,84 @@
+# devflow/loadtest.py
+"""
+Teste de carga da API HTTP contra um servidor local
+
+Dispara requisições GET concorrentes às rotas de leitura, com e sem If-None-Match, e
+informa requisições por segundo, latência (p50/p95/máxima), respostas 304 e bytes recebidos.
+"""
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from database.analytics import _percentile
+
+DEFAULT_PATHS = ['/projects?limit=50', '/statistics', '/notifications?limit=20']
+
+def _fetch(url, etag=None):
+    """Faz um GET aceitando gzip e retorna (status, ETag, bytes recebidos, segundos)"""
+    headers = {'Accept-Encoding': 'gzip'}
+    if etag:
+        headers['If-None-Match'] = etag
+    request = urllib.request.Request(url, headers=headers)
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            body = response.read()
+            status, response_etag = response.status, response.headers.get('ETag')
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        status, response_etag = e.code, e.headers.get('ETag')
+    return status, response_etag, len(body), time.perf_counter() - started
+
+def run_load_test(base_url, requests=1000, concurrency=8, paths=DEFAULT_PATHS, conditional=True):
+    """
+    Executa o teste de carga e retorna as métricas
+
+    Args:
+        base_url: URL do servidor (ex.: http://127.0.0.1:8000)
+        requests: Total de requisições
+        concurrency: Requisições simultâneas
+        paths: Rotas GET exercitadas em rodízio
+        conditional: Se True, reenvia o último ETag de cada rota (como um cliente com cache)
+    """
+    etags = {}
+    lock = threading.Lock()
+
+    def one(index):
+        path = paths[index % len(paths)]
+        with lock:
+            etag = etags.get(path) if conditional else None
+        status, response_etag, size, elapsed = _fetch(base_url.rstrip('/') + path, etag)
+        if response_etag:
+            with lock:
+                etags[path] = response_etag
+        return status, size, elapsed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one, range(requests)))
+    total_seconds = time.perf_counter() - started
+
+    latencies = sorted(elapsed for _, _, elapsed in results)
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'seconds': total_seconds,
+        'requests_per_second': requests / total_seconds if total_seconds else 0.0,
+        'p50_ms': (_percentile(latencies, 0.50) or 0.0) * 1000,
+        'p95_ms': (_percentile(latencies, 0.95) or 0.0) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        'not_modified': sum(1 for status, _, _ in results if status == 304),
+        'errors': sum(1 for status, _, _ in results if status >= 400),
+        'bytes_received': sum(size for _, size, _ in results)
+    }
+
+def format_report(report):
+    """Formata as métricas de run_load_test() como texto"""
+    return (
+        f"{report['requests']} requisições, {report['concurrency']} simultâneas, em {report['seconds']:.2f}s\n"
+        f"{report['requests_per_second']:.0f} req/s | p50 {report['p50_ms']:.1f} ms | "
+        f"p95 {report['p95_ms']:.1f} ms | máx {report['max_ms']:.1f} ms\n"
+        f"304: {report['not_modified']} | erros: {report['errors']} | {report['bytes_received'] // 1024} KB recebidos"
+    )
@@ -0,0 +1,127 @@
+# devflow/profiling.py
+"""
+Auditoria do tempo de inicialização do DevFlow Manager
+
+Mede, em um processo Python novo (sem cache de módulos), o tempo de importação de cada módulo
+carregado pelo painel (python -X importtime) e o tempo de init_db() em um banco novo e em um
+banco já existente, comparando o total com o orçamento de inicialização a frio.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos importados por app.py (ponto de entrada do painel)
+DASHBOARD_MODULES = ['streamlit', 'dotenv', 'database.connection', 'database.cache', 'utils.helpers', 'utils.ui']
+# Orçamento de inicialização a frio do painel, sem contar o próprio Streamlit (importação + init_db)
+DASHBOARD_STARTUP_BUDGET_MS = 100
+# Módulos de terceiros cujo tempo de importação não depende deste projeto
+EXTERNAL_MODULES = ('streamlit',)
+
+_IMPORT_SCRIPT = """
+import sys
+for name in sys.argv[1:]:
+    try:
+        exec('import ' + name)
+    except ImportError:
+        print(name)
+"""
+
+def _parse_importtime(stderr):
+    """Converte a saída de -X importtime em uma lista de módulos com tempos em milissegundos"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        entries.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000
+        })
+    return entries
+
+def measure_import_times(modules=DASHBOARD_MODULES):
+    """
+    Importa os módulos em um processo novo e retorna o tempo gasto em cada um
+
+    Returns:
+        Dicionário com 'modules' (todos os módulos carregados, do mais lento para o mais rápido,
+        por tempo acumulado), 'top_level' ({módulo pedido: ms acumulados}) e 'missing'
+        (módulos pedidos que não estão instalados)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _IMPORT_SCRIPT, *modules],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    missing = result.stdout.split()
+    entries = _parse_importtime(result.stderr)
+    top_level = {entry['module']: entry['cumulative_ms'] for entry in entries if entry['depth'] == 0}
+    return {
+        'modules': sorted(entries, key=lambda entry: entry['cumulative_ms'], reverse=True),
+        'top_level': {name: top_level[name] for name in modules if name in top_level and name not in missing},
+        'missing': missing
+    }
+
+def measure_init_db():
+    """Mede init_db() em um banco novo e novamente no mesmo banco já criado (em milissegundos)"""
+    from database.connection import init_db
+
+    previous_db = os.environ.get('DB_NAME')
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ['DB_NAME'] = os.path.join(temp_dir, 'profile.db')
+        try:
+            timings = {}
+            for label in ('new_ms', 'existing_ms'):
+                started = time.perf_counter()
+                init_db()
+                timings[label] = (time.perf_counter() - started) * 1000
+        finally:
+            if previous_db is None:
+                del os.environ['DB_NAME']
+            else:
+                os.environ['DB_NAME'] = previous_db
+    return timings
+
+def profile_startup(modules=DASHBOARD_MODULES, budget_ms=DASHBOARD_STARTUP_BUDGET_MS):
+    """
+    Mede a inicialização a frio do painel e compara com o orçamento
+
+    O total considera a importação dos módulos do projeto e dependências leves mais o
+    init_db() em um banco existente; bibliotecas externas (EXTERNAL_MODULES) são listadas,
+    mas não contam para o orçamento.
+    """
+    imports = measure_import_times(modules)
+    init_timings = measure_init_db()
+    # Tempo acumulado dos módulos pedidos; um módulo já carregado por outro conta só uma vez
+    import_total_ms = sum(ms for name, ms in imports['top_level'].items() if name not in EXTERNAL_MODULES)
+    total_ms = import_total_ms + init_timings['existing_ms']
+    return {
+        'imports': imports,
+        'import_total_ms': import_total_ms,
+        'init_db': init_timings,
+        'total_ms': total_ms,
+        'budget_ms': budget_ms,
+        'within_budget': total_ms <= budget_ms
+    }
+
+def format_report(report, top=15):
+    """Formata o relatório de profile_startup() como texto"""
+    lines = [f"{'Módulo':<50} {'Próprio (ms)':>13} {'Acumulado (ms)':>15}"]
+    for entry in report['imports']['modules'][:top]:
+        lines.append(f"{'  ' * entry['depth'] + entry['module']:<50} {entry['self_ms']:>13.1f} {entry['cumulative_ms']:>15.1f}")
+    lines.append("")
+    for name, ms in report['imports']['top_level'].items():
+        external = " (externo, fora do orçamento)" if name in EXTERNAL_MODULES else ""
+        lines.append(f"import {name}: {ms:.1f} ms{external}")
+    for name in report['imports']['missing']:
+        lines.append(f"import {name}: não instalado")
+    lines.append(f"init_db (banco novo): {report['init_db']['new_ms']:.1f} ms")
+    lines.append(f"init_db (banco existente): {report['init_db']['existing_ms']:.1f} ms")
+    status = "dentro do" if report['within_budget'] else "ACIMA do"
+    lines.append(f"Total: {report['total_ms']:.1f} ms, {status} orçamento de {report['budget_ms']} ms")
+    return "\n".join(lines)
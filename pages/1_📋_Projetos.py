@@ -8,16 +8,24 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.connection import (
-    get_all_projects, get_project_by_id, create_project, update_project, delete_project,
-    get_all_project_types, get_all_platforms, add_platform_to_project,
-    get_project_platforms_history, search_projects, validate_project_data,
-    add_collaborator_to_project, get_project_collaborators, remove_collaborator_from_project,
-    get_upcoming_project_deadlines
+    create_project, update_project, delete_project, add_platform_to_project, validate_project_data,
+    add_collaborator_to_project, remove_collaborator_from_project,
+    bulk_update_project_status, bulk_reassign_project_type, bulk_extend_project_deadlines, bulk_delete_projects
+)
+from database.cache import (
+    get_project_by_id, get_all_projects, get_all_project_types, get_all_platforms, lookup_projects_by_name,
+    get_project_collaborators, search_projects_faceted,
+    get_upcoming_project_deadlines, get_all_people
 )
 from components.project_timeline import render_project_timeline
 from utils.helpers import format_date, format_status
 from utils.ui import apply_custom_styles, render_sidebar
 
+# Número máximo de projetos sugeridos pela busca do formulário de edição
+PROJECT_LOOKUP_LIMIT = 20
+# Projetos por página na lista de projetos
+PROJECT_LIST_PAGE_SIZE = 50
+
 def main():
     # Aplicar estilos globais
     apply_custom_styles()
@@ -32,6 +40,10 @@ def main():
     tab1, tab2, tab3 = st.tabs(["Visualizar Projetos", "Novo Projeto", "Editar Projeto"])
     
     with tab1:
+        # Detalhes do projeto selecionado na lista
+        if st.session_state.get('details_project_id'):
+            show_project_details(st.session_state.details_project_id)
+        
         show_projects_list()
     
     with tab2:
@@ -49,45 +61,86 @@ def show_deadline_alerts():
         for project in upcoming_projects:
             st.caption(f"- {project.name} (vence em {format_date(project.end_date)})")
 
+@st.fragment
 def show_projects_list():
-    """Exibe a lista de projetos com opções de filtro"""
+    """Exibe a lista de projetos com opções de filtro (fragmento: filtros recarregam só a lista)"""
     st.header("Lista de Projetos")
     
+    # Carregar tipos de projeto para o filtro
+    project_types = get_all_project_types()
+    type_options = {pt.name: pt.id for pt in project_types}
+    type_options_with_all = {"Todos": None, **type_options}
+    status_options = ["Todos", "Planejamento", "Em Desenvolvimento", "Testes", "Implantação", "Concluído", "Cancelado"]
+    
+    # Filtros atuais lidos do estado dos widgets antes de desenhá-los: a página da lista e as
+    # contagens por faceta vêm de uma única consulta
+    current_query = st.session_state.get("filter_query") or None
+    current_type_name = st.session_state.get("filter_type", "Todos")
+    current_status = st.session_state.get("filter_status", "Todos")
+    filters = {
+        'query': current_query,
+        'status': None if current_status == "Todos" else current_status,
+        'project_type_id': type_options_with_all.get(current_type_name)
+    }
+    # Volta à primeira página quando os filtros mudam
+    if st.session_state.get("projects_list_filters") != filters:
+        st.session_state.projects_list_filters = filters
+        st.session_state.projects_list_page = 0
+    page = st.session_state.get("projects_list_page", 0)
+    result = search_projects_faceted(
+        **filters, limit=PROJECT_LIST_PAGE_SIZE, offset=page * PROJECT_LIST_PAGE_SIZE
+    )
+    facets = result['facets']
+    
+    def format_type_option(name):
+        counts = facets['project_type']
+        count = sum(counts.values()) if name == "Todos" else counts.get(type_options[name], 0)
+        return f"{name} ({count})"
+    
+    def format_status_option(name):
+        counts = facets['status']
+        count = sum(counts.values()) if name == "Todos" else counts.get(name, 0)
+        return f"{name} ({count})"
+    
     # Filtros
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        search_query = st.text_input("Buscar projetos", placeholder="Nome ou descrição...")
+        st.text_input("Buscar projetos", placeholder="Nome ou descrição...", key="filter_query")
     
     with col2:
-        # Carregar tipos de projeto para o filtro
-        project_types = get_all_project_types()
-        type_options = {pt.name: pt.id for pt in project_types}
-        type_options_with_all = {"Todos": None, **type_options}
-        selected_type_name = st.selectbox("Filtrar por tipo", options=list(type_options_with_all.keys()))
-        selected_type_id = type_options_with_all[selected_type_name]
+        st.selectbox(
+            "Filtrar por tipo", options=list(type_options_with_all.keys()),
+            format_func=format_type_option, key="filter_type"
+        )
     
     with col3:
-        status_options = ["Todos", "Planejamento", "Em Desenvolvimento", "Testes", "Implantação", "Concluído", "Cancelado"]
-        selected_status = st.selectbox("Filtrar por status", options=status_options)
-        # Converter "Todos" para None
-        if selected_status == "Todos":
-            selected_status = None
-    
-    # Aplicar filtros
-    if selected_type_id is None and selected_status is None and not search_query:
-        projects = get_all_projects()
-    else:
-        projects = search_projects(
-            query=search_query if search_query else None,
-            status=selected_status,
-            project_type_id=selected_type_id
+        st.selectbox(
+            "Filtrar por status", options=status_options,
+            format_func=format_status_option, key="filter_status"
         )
     
+    # Plataformas atuais dos projetos filtrados
+    platform_names = {p.id: p.name for p in get_all_platforms()}
+    platform_counts = sorted(facets['platform'].items(), key=lambda item: -item[1])
+    if platform_counts:
+        st.caption("Plataformas atuais: " + ", ".join(
+            f"{platform_names.get(platform_id, 'Sem plataforma')} ({count})"
+            for platform_id, count in platform_counts
+        ))
+    
+    projects = result['projects']
+    total = result['total']
+    if not projects and page > 0:
+        # A página deixou de existir (projetos excluídos): voltar à primeira
+        st.session_state.projects_list_page = 0
+        st.rerun(scope="fragment")
     if not projects:
         st.info("Nenhum projeto encontrado.")
         return
     
+    show_bulk_actions(projects, total, project_types, filters)
+    
     # Exibir projetos em cards
     for project in projects:
         with st.container():
@@ -111,18 +164,91 @@ def show_projects_list():
             
             with col4:
                 if st.button(f"Ver Detalhes", key=f"details_{project.id}"):
-                    show_project_details(project.id)
+                    # Os detalhes ficam fora do fragmento da lista
+                    st.session_state.details_project_id = project.id
+                    st.rerun()
             
             st.divider()
+    
+    # Paginação da lista
+    first_shown = page * PROJECT_LIST_PAGE_SIZE + 1
+    st.caption(f"Mostrando {first_shown}–{first_shown + len(projects) - 1} de {total} projeto(s)")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Página anterior", disabled=page == 0, key="projects_list_previous"):
+            st.session_state.projects_list_page = page - 1
+            st.rerun(scope="fragment")
+    with col2:
+        if st.button("Próxima página", disabled=first_shown + len(projects) > total, key="projects_list_next"):
+            st.session_state.projects_list_page = page + 1
+            st.rerun(scope="fragment")
+
+def show_bulk_actions(projects, total, project_types, filters):
+    """Aplica uma alteração a vários projetos de uma vez (selecionados ou todos os filtrados)"""
+    with st.expander("Ações em Massa", expanded=False):
+        apply_to_filter = st.checkbox("Aplicar a todos os projetos da lista filtrada", key="bulk_all_filtered")
+        
+        if apply_to_filter:
+            project_ids = None
+            st.caption(f"{total} projeto(s) serão afetados.")
+        else:
+            project_names = {p.id: p.name for p in projects}
+            project_ids = st.multiselect(
+                "Projetos", options=list(project_names),
+                format_func=lambda project_id: f"{project_names[project_id]} (ID: {project_id})",
+                key="bulk_selected_projects"
+            )
+            filters = None
+        
+        action = st.selectbox("Ação", ["Alterar status", "Alterar tipo", "Adiar prazo", "Excluir"], key="bulk_action")
+        
+        if action == "Alterar status":
+            status_options = ["Planejamento", "Em Desenvolvimento", "Testes", "Implantação", "Concluído", "Cancelado"]
+            new_status = st.selectbox("Novo status", options=status_options, key="bulk_new_status")
+        elif action == "Alterar tipo":
+            type_options = {pt.name: pt.id for pt in project_types}
+            new_type_name = st.selectbox("Novo tipo", options=list(type_options), key="bulk_new_type")
+        elif action == "Adiar prazo":
+            days = st.number_input("Dias (negativo para antecipar)", value=7, step=1, key="bulk_days")
+        else:
+            st.warning("A exclusão em massa é irreversível.")
+            confirm_delete = st.checkbox("Estou ciente e quero excluir os projetos", key="bulk_confirm_delete")
+        
+        disabled = not (apply_to_filter or project_ids) or (action == "Excluir" and not confirm_delete)
+        if st.button("Aplicar Ação em Massa", disabled=disabled, key="bulk_apply"):
+            try:
+                if apply_to_filter and not any(filters.values()):
+                    # Sem filtros ativos a lista contém todos os projetos, não só a página exibida
+                    project_ids = [p.id for p in get_all_projects()]
+                    filters = None
+                if action == "Alterar status":
+                    count = bulk_update_project_status(new_status, project_ids, filters)
+                elif action == "Alterar tipo":
+                    count = bulk_reassign_project_type(type_options[new_type_name], project_ids, filters)
+                elif action == "Adiar prazo":
+                    count = bulk_extend_project_deadlines(days, project_ids, filters)
+                else:
+                    count = bulk_delete_projects(project_ids, filters)
+                    if st.session_state.get('details_project_id') in (project_ids or []):
+                        del st.session_state.details_project_id
+                st.success(f"{count} projeto(s) alterado(s).")
+                # Prazos e contagens fora da lista também mudam
+                st.rerun()
+            except Exception as e:
+                st.error(f"Erro ao aplicar ação em massa: {e}")
 
 def show_project_details(project_id):
     """Exibe os detalhes completos de um projeto"""
     project = get_project_by_id(project_id)
     if not project:
         st.error("Projeto não encontrado.")
+        del st.session_state.details_project_id
         return
     
     st.subheader(f"Detalhes do Projeto: {project.name}")
+    if st.button("Fechar Detalhes", key=f"close_details_{project_id}"):
+        del st.session_state.details_project_id
+        st.rerun()
     
     # Informações básicas do projeto
     col1, col2 = st.columns(2)
@@ -140,10 +266,15 @@ def show_project_details(project_id):
         if project.updated_at:
             st.write(f"**Atualizado em:** {format_date(project.updated_at.split()[0])}")
     
-    # Histórico de plataformas
+    show_platform_history_section(project_id)
+    show_collaborators_section(project_id)
+    st.divider()
+
+@st.fragment
+def show_platform_history_section(project_id):
+    """Exibe o histórico de plataformas e o formulário de nova plataforma (fragmento)"""
     st.subheader("Histórico de Plataformas")
-    platform_history = get_project_platforms_history(project_id)
-    render_project_timeline(platform_history)
+    render_project_timeline(project_id)
     
     # Formulário para adicionar nova plataforma
     st.subheader("Adicionar Nova Plataforma")
@@ -168,23 +299,41 @@ def show_project_details(project_id):
                 description if description.strip() else None
             )
             st.success("Plataforma adicionada ao projeto com sucesso!")
-            st.rerun()
+            st.rerun(scope="fragment")
         except Exception as e:
             st.error(f"Erro ao adicionar plataforma: {e}")
-    
-    # Gerenciamento de colaboradores
+
+@st.fragment
+def show_collaborators_section(project_id):
+    """Gerencia os colaboradores do projeto (fragmento)"""
     st.subheader("Colaboradores do Projeto")
     
-    # Adicionar novo colaborador
+    # Adicionar novo colaborador: uma pessoa já cadastrada ou uma nova
+    people = {person['id']: person for person in get_all_people()}
+    person_id = st.selectbox(
+        "Pessoa cadastrada",
+        options=[None] + list(people),
+        format_func=lambda pid: "Nova pessoa..." if pid is None else (
+            f"{people[pid]['name']} ({people[pid]['email']})" if people[pid]['email'] else people[pid]['name']
+        ),
+        key=f"collab_person_{project_id}"
+    )
+    
     col1, col2, col3 = st.columns(3)
     with col1:
-        collaborator_name = st.text_input("Nome do Colaborador", key=f"collab_name_{project_id}")
+        collaborator_name = st.text_input("Nome do Colaborador", key=f"collab_name_{project_id}",
+                                          disabled=person_id is not None)
     with col2:
-        collaborator_email = st.text_input("Email (opcional)", key=f"collab_email_{project_id}")
+        collaborator_email = st.text_input("Email (opcional)", key=f"collab_email_{project_id}",
+                                           disabled=person_id is not None)
     with col3:
         role_options = ["Membro", "Administrador", "Observador"]
         collaborator_role = st.selectbox("Função", options=role_options, key=f"collab_role_{project_id}")
     
+    if person_id is not None:
+        collaborator_name = people[person_id]['name']
+        collaborator_email = people[person_id]['email'] or ""
+    
     if st.button("Adicionar Colaborador", key=f"add_collab_{project_id}"):
         if collaborator_name.strip():
             try:
@@ -195,7 +344,7 @@ def show_project_details(project_id):
                     collaborator_role.lower()
                 )
                 st.success(f"Colaborador '{collaborator_name}' adicionado ao projeto!")
-                st.rerun()
+                st.rerun(scope="fragment")
             except Exception as e:
                 st.error(f"Erro ao adicionar colaborador: {e}")
         else:
@@ -224,12 +373,13 @@ def show_project_details(project_id):
                             try:
                                 remove_collaborator_from_project(collab['id'])
                                 st.success(f"Colaborador '{collab['user_name']}' removido do projeto!")
-                                st.rerun()
+                                st.rerun(scope="fragment")
                             except Exception as e:
                                 st.error(f"Erro ao remover colaborador: {e}")
 
+@st.fragment
 def create_new_project_form():
-    """Formulário para criação de novo projeto"""
+    """Formulário para criação de novo projeto (fragmento)"""
     st.header("Criar Novo Projeto")
     
     # Carregar dados necessários
@@ -282,23 +432,38 @@ def create_new_project_form():
             except Exception as e:
                 st.error(f"Erro ao criar projeto: {e}")
 
+@st.fragment
 def edit_project_form():
-    """Formulário para edição de projeto existente"""
+    """Formulário para edição de projeto existente (fragmento)"""
     st.header("Editar Projeto")
     
-    # Carregar projetos para seleção
-    projects = get_all_projects()
+    # Projeto indicado no link da página (?project_id=...)
+    linked_id = st.query_params.get("project_id")
+    linked_project = get_project_by_id(int(linked_id)) if linked_id and linked_id.isdigit() else None
     
-    if not projects:
+    # Buscar apenas os projetos cujo nome começa com o texto digitado
+    name_prefix = st.text_input("Buscar projeto pelo nome", placeholder="Digite o início do nome...", key="edit_lookup")
+    matches = lookup_projects_by_name(name_prefix.strip(), limit=PROJECT_LOOKUP_LIMIT)
+    
+    project_options = {f"{m['name']} (ID: {m['id']})": m['id'] for m in matches}
+    if linked_project and linked_project.id not in project_options.values():
+        project_options = {f"{linked_project.name} (ID: {linked_project.id})": linked_project.id, **project_options}
+    
+    if not project_options:
         st.info("Nenhum projeto encontrado para edição.")
         return
     
-    project_options = {f"{p.name} (ID: {p.id})": p.id for p in projects}
-    selected_project_key = st.selectbox("Selecione o Projeto", options=list(project_options.keys()))
+    option_ids = list(project_options.values())
+    selected_index = option_ids.index(linked_project.id) if linked_project else 0
+    selected_project_key = st.selectbox("Selecione o Projeto", options=list(project_options.keys()), index=selected_index)
     selected_project_id = project_options[selected_project_key]
     
+    # Manter o projeto selecionado no link para permitir compartilhar a página
+    if linked_id != str(selected_project_id):
+        st.query_params["project_id"] = str(selected_project_id)
+    
     # Carregar dados do projeto selecionado
-    project = get_project_by_id(selected_project_id)
+    project = linked_project if linked_project and linked_project.id == selected_project_id else get_project_by_id(selected_project_id)
     if not project:
         st.error("Projeto não encontrado.")
         return
@@ -308,29 +473,30 @@ def edit_project_form():
     project_type_options = {pt.name: pt.id for pt in project_types}
     
     # Campos do formulário com dados atuais
-    name = st.text_input("Nome do Projeto", value=project.name, max_chars=200, key="edit_name")
-    description = st.text_area("Descrição do Projeto", value=project.description or "", key="edit_desc")
+    name = st.text_input("Nome do Projeto", value=project.name, max_chars=200, key=f"edit_name_{project.id}")
+    description = st.text_area("Descrição do Projeto", value=project.description or "", key=f"edit_desc_{project.id}")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Encontrar o tipo de projeto atual
         current_type_name = next((name for name, id in project_type_options.items() if id == project.project_type_id), list(project_type_options.keys())[0])
-        selected_type = st.selectbox("Tipo de Projeto", options=list(project_type_options.keys()), index=list(project_type_options.keys()).index(current_type_name), key="edit_type")
-        start_date = st.date_input("Data de Início", value=datetime.strptime(project.start_date, '%Y-%m-%d'), key="edit_start")
+        selected_type = st.selectbox("Tipo de Projeto", options=list(project_type_options.keys()), index=list(project_type_options.keys()).index(current_type_name), key=f"edit_type_{project.id}")
+        start_date = st.date_input("Data de Início", value=datetime.strptime(project.start_date, '%Y-%m-%d'), key=f"edit_start_{project.id}")
     
     with col2:
-        end_date = st.date_input("Data de Término (opcional)", value=datetime.strptime(project.end_date, '%Y-%m-%d') if project.end_date else None, key="edit_end")
+        end_date = st.date_input("Data de Término (opcional)", value=datetime.strptime(project.end_date, '%Y-%m-%d') if project.end_date else None, key=f"edit_end_{project.id}")
         status_options = ["Planejamento", "Em Desenvolvimento", "Testes", "Implantação", "Concluído", "Cancelado"]
         current_status_index = status_options.index(project.status) if project.status in status_options else 0
-        status = st.selectbox("Status", options=status_options, index=current_status_index, key="edit_status")
+        status = st.selectbox("Status", options=status_options, index=current_status_index, key=f"edit_status_{project.id}")
     
     if st.button("Atualizar Projeto"):
         # Validação dos dados
         errors = validate_project_data(
             name, description, project_type_options[selected_type], 
             start_date.strftime('%Y-%m-%d'), 
-            end_date.strftime('%Y-%m-%d') if end_date else None
+            end_date.strftime('%Y-%m-%d') if end_date else None,
+            exclude_id=project.id
         )
         
         if errors:
@@ -369,6 +535,8 @@ def edit_project_form():
                 success = delete_project(selected_project_id)
                 if success:
                     st.success("Projeto excluído com sucesso!")
+                    if st.session_state.get('details_project_id') == selected_project_id:
+                        del st.session_state.details_project_id
                     # Pequena pausa para o usuário ver a mensagem antes do rerun
                     import time
                     time.sleep(1)
@@ -7,10 +7,19 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.connection import (
-    get_all_project_types, create_project_type, update_project_type, delete_project_type,
-    get_all_platforms, create_platform, update_platform, delete_platform,
+    create_project_type, update_project_type, delete_project_type,
+    create_platform, update_platform, delete_platform,
+    merge_project_types, merge_platforms,
     validate_project_type_data, validate_platform_data
 )
+from database.cache import (
+    get_all_project_types, get_all_platforms, get_project_type_usage_counts, get_platform_usage_counts,
+    get_cache_stats, clear_cache
+)
+from database.maintenance import (
+    count_orphans, compact_orphans, run_maintenance, get_last_run, get_file_sizes, is_incremental_vacuum_enabled,
+    is_wal_enabled
+)
 from utils.ui import apply_custom_styles, render_sidebar
 
 def main():
@@ -19,20 +28,28 @@ def main():
     st.title("🔧 Configurações")
     
     # Tabs para diferentes configurações
-    tab1, tab2 = st.tabs(["Tipos de Projetos", "Plataformas"])
+    tab1, tab2, tab3, tab4 = st.tabs(["Tipos de Projetos", "Plataformas", "Cache de Consultas", "Manutenção"])
     
     with tab1:
         manage_project_types()
     
     with tab2:
         manage_platforms()
+    
+    with tab3:
+        show_cache_stats()
+    
+    with tab4:
+        show_maintenance()
 
+@st.fragment
 def manage_project_types():
-    """Gerencia os tipos de projetos"""
+    """Gerencia os tipos de projetos (fragmento: ações recarregam apenas esta aba)"""
     st.header("Tipos de Projetos")
     
     # Listar tipos de projetos existentes
     project_types = get_all_project_types()
+    usage_counts = get_project_type_usage_counts()
     
     if project_types:
         st.subheader("Tipos de Projetos Cadastrados")
@@ -48,24 +65,34 @@ def manage_project_types():
                 with col2:
                     st.write(f"ID: {pt.id}")
                     st.write(f"Criado em: {pt.created_at.split()[0] if pt.created_at else 'N/A'}")
+                    st.write(f"Usado por: {usage_counts.get(pt.id, 0)} projeto(s)")
                 
                 with col3:
                     if st.button(f"Editar", key=f"edit_pt_{pt.id}"):
                         st.session_state.editing_project_type = pt.id
-                        st.rerun()
+                        st.rerun(scope="fragment")
                     
-                    if st.button(f"Excluir", key=f"delete_pt_{pt.id}", type="secondary"):
+                    in_use = usage_counts.get(pt.id, 0) > 0
+                    if st.button(f"Excluir", key=f"delete_pt_{pt.id}", type="secondary", disabled=in_use,
+                                 help="Mescle este tipo em outro para reatribuir os projetos" if in_use else None):
                         if st.checkbox("Confirmar exclusão", key=f"confirm_delete_pt_{pt.id}"):
                             try:
                                 success = delete_project_type(pt.id)
                                 if success:
                                     st.success(f"Tipo de projeto '{pt.name}' excluído com sucesso!")
-                                    st.rerun()
+                                    st.rerun(scope="fragment")
                                 else:
                                     st.error("Falha ao excluir o tipo de projeto.")
                             except Exception as e:
                                 st.error(f"Erro ao excluir tipo de projeto: {e}")
     
+    if len(project_types) > 1:
+        st.divider()
+        show_merge_form(
+            "Mesclar Tipos de Projeto", project_types, usage_counts, "merge_pt",
+            merge_project_types, "projeto(s) reatribuído(s)"
+        )
+    
     # Formulário para novo tipo de projeto
     st.divider()
     st.subheader("Adicionar Novo Tipo de Projeto")
@@ -82,7 +109,7 @@ def manage_project_types():
             try:
                 type_id = create_project_type(new_name, new_description if new_description.strip() else None)
                 st.success(f"Tipo de projeto '{new_name}' adicionado com sucesso! ID: {type_id}")
-                st.rerun()
+                st.rerun(scope="fragment")
             except Exception as e:
                 st.error(f"Erro ao adicionar tipo de projeto: {e}")
     
@@ -99,7 +126,7 @@ def manage_project_types():
             edit_description = st.text_area("Descrição", value=current_type.description or "", key="edit_pt_desc")
             
             if st.button("Atualizar Tipo de Projeto"):
-                errors = validate_project_type_data(edit_name)
+                errors = validate_project_type_data(edit_name, exclude_id=editing_id)
                 if errors:
                     for error in errors:
                         st.error(error)
@@ -109,7 +136,7 @@ def manage_project_types():
                         if success:
                             st.success(f"Tipo de projeto '{edit_name}' atualizado com sucesso!")
                             del st.session_state.editing_project_type
-                            st.rerun()
+                            st.rerun(scope="fragment")
                         else:
                             st.error("Falha ao atualizar o tipo de projeto.")
                     except Exception as e:
@@ -117,14 +144,16 @@ def manage_project_types():
             
             if st.button("Cancelar Edição"):
                 del st.session_state.editing_project_type
-                st.rerun()
+                st.rerun(scope="fragment")
 
+@st.fragment
 def manage_platforms():
-    """Gerencia as plataformas"""
+    """Gerencia as plataformas (fragmento: ações recarregam apenas esta aba)"""
     st.header("Plataformas")
     
     # Listar plataformas existentes
     platforms = get_all_platforms()
+    usage_counts = get_platform_usage_counts()
     
     if platforms:
         st.subheader("Plataformas Cadastradas")
@@ -140,24 +169,34 @@ def manage_platforms():
                 with col2:
                     st.write(f"ID: {p.id}")
                     st.write(f"Criado em: {p.created_at.split()[0] if p.created_at else 'N/A'}")
+                    st.write(f"Usada por: {usage_counts.get(p.id, 0)} projeto(s)")
                 
                 with col3:
                     if st.button(f"Editar", key=f"edit_plat_{p.id}"):
                         st.session_state.editing_platform = p.id
-                        st.rerun()
+                        st.rerun(scope="fragment")
                     
-                    if st.button(f"Excluir", key=f"delete_plat_{p.id}", type="secondary"):
+                    in_use = usage_counts.get(p.id, 0) > 0
+                    if st.button(f"Excluir", key=f"delete_plat_{p.id}", type="secondary", disabled=in_use,
+                                 help="Mescle esta plataforma em outra para reatribuir o histórico" if in_use else None):
                         if st.checkbox("Confirmar exclusão", key=f"confirm_delete_plat_{p.id}"):
                             try:
                                 success = delete_platform(p.id)
                                 if success:
                                     st.success(f"Plataforma '{p.name}' excluída com sucesso!")
-                                    st.rerun()
+                                    st.rerun(scope="fragment")
                                 else:
                                     st.error("Falha ao excluir a plataforma.")
                             except Exception as e:
                                 st.error(f"Erro ao excluir plataforma: {e}")
     
+    if len(platforms) > 1:
+        st.divider()
+        show_merge_form(
+            "Mesclar Plataformas", platforms, usage_counts, "merge_plat",
+            merge_platforms, "registro(s) de histórico reatribuído(s)"
+        )
+    
     # Formulário para nova plataforma
     st.divider()
     st.subheader("Adicionar Nova Plataforma")
@@ -174,7 +213,7 @@ def manage_platforms():
             try:
                 platform_id = create_platform(new_name, new_description if new_description.strip() else None)
                 st.success(f"Plataforma '{new_name}' adicionada com sucesso! ID: {platform_id}")
-                st.rerun()
+                st.rerun(scope="fragment")
             except Exception as e:
                 st.error(f"Erro ao adicionar plataforma: {e}")
     
@@ -191,7 +230,7 @@ def manage_platforms():
             edit_description = st.text_area("Descrição", value=current_platform.description or "", key="edit_plat_desc")
             
             if st.button("Atualizar Plataforma"):
-                errors = validate_platform_data(edit_name)
+                errors = validate_platform_data(edit_name, exclude_id=editing_id)
                 if errors:
                     for error in errors:
                         st.error(error)
@@ -201,7 +240,7 @@ def manage_platforms():
                         if success:
                             st.success(f"Plataforma '{edit_name}' atualizada com sucesso!")
                             del st.session_state.editing_platform
-                            st.rerun()
+                            st.rerun(scope="fragment")
                         else:
                             st.error("Falha ao atualizar a plataforma.")
                     except Exception as e:
@@ -209,7 +248,102 @@ def manage_platforms():
             
             if st.button("Cancelar Edição"):
                 del st.session_state.editing_platform
-                st.rerun()
+                st.rerun(scope="fragment")
+
+def show_merge_form(title, items, usage_counts, key_prefix, merge_function, moved_label):
+    """Formulário para mesclar um registro duplicado em outro, reatribuindo todos os seus usos"""
+    st.subheader(title)
+    labels = {item.id: f"{item.name} ({usage_counts.get(item.id, 0)} projeto(s))" for item in items}
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        source_id = st.selectbox("Mesclar (será excluído)", options=list(labels), format_func=labels.get,
+                                 key=f"{key_prefix}_source")
+    with col2:
+        target_id = st.selectbox("Em", options=[item_id for item_id in labels if item_id != source_id],
+                                 format_func=labels.get, key=f"{key_prefix}_target")
+    
+    confirm = st.checkbox("Confirmo a mesclagem (não pode ser desfeita)", key=f"{key_prefix}_confirm")
+    if st.button("Mesclar", key=f"{key_prefix}_button", disabled=not confirm or target_id is None):
+        try:
+            moved = merge_function(source_id, target_id)
+            st.success(f"Mesclagem concluída: {moved} {moved_label}.")
+            st.rerun(scope="fragment")
+        except Exception as e:
+            st.error(f"Erro ao mesclar: {e}")
+
+@st.fragment
+def show_cache_stats():
+    """Exibe acertos e falhas do cache de consultas para ajuste"""
+    st.header("Cache de Consultas")
+    st.write("O cache é compartilhado entre sessões e invalidado a cada escrita nas tabelas consultadas.")
+    
+    stats = get_cache_stats()
+    st.dataframe([
+        {
+            'Função': name,
+            'Acertos': stat['hits'],
+            'Falhas': stat['misses'],
+            'Taxa de Acerto': f"{stat['hits'] / (stat['hits'] + stat['misses']):.0%}" if stat['hits'] + stat['misses'] else '-',
+            'Entradas': stat['size']
+        }
+        for name, stat in stats.items()
+    ])
+    
+    if st.button("Limpar Cache"):
+        clear_cache()
+        st.rerun(scope="fragment")
+
+@st.fragment
+def show_maintenance():
+    """Exibe o estado do banco e permite executar a manutenção manualmente"""
+    st.header("Manutenção do Banco de Dados")
+    st.write("A manutenção roda automaticamente na inicialização; use os botões para executá-la agora.")
+    
+    sizes = get_file_sizes()
+    st.metric("Tamanho do Banco", f"{sizes['database'] / 1024:.0f} KB")
+    
+    # O corpo de todas as abas roda a cada execução da página: as consultas de estado
+    # (contagem de órfãos, últimas execuções) só rodam quando pedidas
+    if st.toggle("Mostrar estado da manutenção", key="maintenance_show_status"):
+        for job, label in [('maintenance', "Última otimização"), ('compact_orphans', "Última compactação de órfãos")]:
+            last_run = get_last_run(job)
+            st.caption(f"{label}: {last_run['last_run_at'] if last_run else 'nunca'}")
+        orphans = count_orphans()
+        st.caption(f"Registros órfãos: {sum(orphans.values())}")
+        # O WAL só existe em bancos com journal_mode=WAL
+        if is_wal_enabled():
+            st.caption(f"Tamanho do WAL: {sizes['wal'] / 1024:.0f} KB")
+        
+        if not is_incremental_vacuum_enabled():
+            st.warning(
+                "Este banco foi criado sem auto_vacuum incremental, então o espaço de exclusões não é "
+                "devolvido ao disco. A migração executa um VACUUM completo, que reescreve o arquivo e "
+                "bloqueia o banco enquanto roda (pode levar minutos em bancos grandes)."
+            )
+            if st.button("Migrar para Vacuum Incremental"):
+                with st.spinner("Executando VACUUM..."):
+                    report = run_maintenance(migrate_auto_vacuum=True)
+                st.success(
+                    f"Banco migrado em {report['elapsed_seconds']:.2f}s: "
+                    f"{report['size_before']['database'] / 1024:.0f} KB -> {report['size_after']['database'] / 1024:.0f} KB."
+                )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Otimizar Banco"):
+            report = run_maintenance()
+            st.success(
+                f"Banco otimizado em {report['elapsed_seconds']:.2f}s: "
+                f"{report['size_before']['database'] / 1024:.0f} KB -> {report['size_after']['database'] / 1024:.0f} KB "
+                f"({report['reclaimed_pages']} página(s) recuperada(s))."
+            )
+    with col2:
+        if st.button("Compactar Órfãos"):
+            result = compact_orphans()
+            st.success(f"{sum(result['deleted'].values())} registro(s) órfão(s) excluído(s).")
+            if result['violations']:
+                st.warning(f"{len(result['violations'])} violação(ões) de chave estrangeira restante(s).")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,11 +6,20 @@ import os
 # Adicionar o diretório raiz ao path para importar módulos
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.connection import get_project_statistics, get_all_projects
+from database.cache import get_project_statistics, get_all_projects, get_people_workload, get_person_projects
+from database.analytics import (
+    get_platform_migration_stats, get_monthly_project_series, get_status_cycle_metrics,
+    get_collaborator_capacity, DEFAULT_CAPACITY_THRESHOLD
+)
+from datetime import date, timedelta
 from utils.helpers import format_status
-import plotly.express as px
 from utils.ui import apply_custom_styles, render_sidebar
 
+def _plotly_express():
+    """Importa o plotly.express apenas quando um gráfico vai ser desenhado (importação lenta)"""
+    import plotly.express as px
+    return px
+
 def main():
     apply_custom_styles()
     render_sidebar()
@@ -49,6 +58,7 @@ def main():
         
         with col1:
             st.subheader("Distribuição por Status")
+            px = _plotly_express()
             fig_status = px.pie(
                 values=status_df['Quantidade'], 
                 names=status_df['Status'],
@@ -71,6 +81,26 @@ def main():
                 )
                 st.plotly_chart(fig_type, key="chart_type")
     
+    # Tendências mensais
+    st.divider()
+    show_monthly_trends()
+    
+    # Tempo de ciclo por status
+    st.divider()
+    show_status_cycle_times()
+    
+    # Migração entre plataformas
+    st.divider()
+    show_platform_migration()
+    
+    # Carga por colaborador
+    st.divider()
+    show_people_workload()
+    
+    # Capacidade e sobreposição por colaborador
+    st.divider()
+    show_collaborator_capacity()
+    
     # Detalhes dos projetos
     st.divider()
     st.header("Detalhes dos Projetos")
@@ -91,5 +121,229 @@ def main():
     else:
         st.info("Nenhum projeto cadastrado para exibir relatórios.")
 
+def show_monthly_trends():
+    """Exibe a evolução mensal dos projetos a partir da tabela de fatos mensais"""
+    st.header("Tendências Mensais")
+    
+    series = get_monthly_project_series()
+    
+    if not series['month']:
+        st.info("Nenhum dado mensal disponível.")
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Movimento de Projetos")
+        px = _plotly_express()
+        fig_flow = px.line(
+            series,
+            x='month',
+            y=['created', 'completed', 'cancelled'],
+            labels={'month': 'Mês', 'value': 'Projetos', 'variable': 'Série'},
+            markers=True
+        )
+        fig_flow.for_each_trace(lambda trace: trace.update(name={
+            'created': 'Iniciados', 'completed': 'Concluídos', 'cancelled': 'Cancelados'
+        }[trace.name]))
+        st.plotly_chart(fig_flow, key="chart_monthly_flow")
+    
+    with col2:
+        st.subheader("Projetos Ativos por Tipo")
+        series_by_type = get_monthly_project_series(by_type=True)
+        fig_active = px.area(
+            series_by_type,
+            x='month',
+            y='active',
+            color='project_type',
+            labels={'month': 'Mês', 'active': 'Projetos Ativos', 'project_type': 'Tipo'}
+        )
+        st.plotly_chart(fig_active, key="chart_monthly_active")
+
+def show_status_cycle_times():
+    """Exibe o tempo gasto em cada status e os tempos de ciclo por tipo de projeto"""
+    st.header("Tempo de Ciclo")
+    
+    metrics = get_status_cycle_metrics()
+    
+    if not metrics['time_in_status'] and not metrics['cycle_times']:
+        st.info("Nenhuma mudança de status registrada.")
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Dias Médios por Status")
+        if metrics['time_in_status']:
+            px = _plotly_express()
+            fig_status_time = px.bar(
+                {
+                    'Status': [format_status(m['status']) for m in metrics['time_in_status']],
+                    'Dias': [m['avg_days'] for m in metrics['time_in_status']],
+                    'Tipo': [m['project_type_name'] for m in metrics['time_in_status']]
+                },
+                x='Dias',
+                y='Status',
+                color='Tipo',
+                orientation='h',
+                barmode='group'
+            )
+            st.plotly_chart(fig_status_time, key="chart_status_time")
+        else:
+            st.info("Nenhum período de status encerrado.")
+    
+    with col2:
+        st.subheader("Ciclo e Lead Time por Tipo")
+        if metrics['cycle_times']:
+            st.dataframe([
+                {
+                    'Tipo': m['project_type_name'],
+                    'Concluídos': m['completed_projects'],
+                    'Ciclo Médio (dias)': round(m['avg_cycle_days'], 1) if m['avg_cycle_days'] is not None else None,
+                    'Lead Time Médio (dias)': round(m['avg_lead_days'], 1) if m['avg_lead_days'] is not None else None
+                }
+                for m in metrics['cycle_times']
+            ])
+        else:
+            st.info("Nenhum projeto concluído ainda.")
+
+def show_people_workload():
+    """Exibe os projetos ativos por pessoa e os projetos de uma pessoa selecionada"""
+    st.header("Carga por Colaborador")
+    
+    workload = get_people_workload()
+    
+    if not workload:
+        st.info("Nenhum colaborador cadastrado.")
+        return
+    
+    px = _plotly_express()
+    fig_workload = px.bar(
+        {
+            'Pessoa': [w['name'] for w in workload],
+            'Projetos Ativos': [w['active_projects'] for w in workload]
+        },
+        x='Projetos Ativos',
+        y='Pessoa',
+        orientation='h'
+    )
+    fig_workload.update_layout(yaxis={'categoryorder': 'total ascending'})
+    st.plotly_chart(fig_workload, key="chart_people_workload")
+    
+    people = {w['id']: w for w in workload}
+    person_id = st.selectbox(
+        "Projetos de",
+        options=list(people),
+        format_func=lambda pid: f"{people[pid]['name']} ({people[pid]['active_projects']} ativo(s) de {people[pid]['total_projects']})",
+        key="workload_person"
+    )
+    person_projects = get_person_projects(person_id)
+    if person_projects:
+        st.dataframe([
+            {
+                'Projeto': p['name'],
+                'Tipo': p['project_type_name'],
+                'Status': format_status(p['status']),
+                'Função': p['role'].title() if p['role'] else '-',
+                'Início': p['start_date'],
+                'Término': p['end_date'] or 'Em andamento'
+            }
+            for p in person_projects
+        ])
+    else:
+        st.info("Esta pessoa não participa de nenhum projeto.")
+
+@st.fragment
+def show_collaborator_capacity():
+    """Exibe os projetos ativos simultâneos por pessoa ao longo do tempo e os períodos de sobrecarga"""
+    st.header("Capacidade por Colaborador")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        start_date = st.date_input("De", value=date.today() - timedelta(days=180), key="capacity_start")
+    with col2:
+        end_date = st.date_input("Até", value=date.today() + timedelta(days=90), key="capacity_end")
+    with col3:
+        threshold = st.number_input("Limite de projetos simultâneos", min_value=1,
+                                    value=DEFAULT_CAPACITY_THRESHOLD, key="capacity_threshold")
+    
+    if end_date < start_date:
+        st.error("A data final deve ser igual ou posterior à data inicial.")
+        return
+    
+    capacity = get_collaborator_capacity(start_date, end_date, int(threshold))
+    if not capacity['people']:
+        st.info("Nenhum colaborador com projetos no período.")
+        return
+    
+    curves = {'Data': [], 'Projetos Simultâneos': [], 'Pessoa': []}
+    for person in capacity['people']:
+        curves['Data'].extend(person['curve']['date'])
+        curves['Projetos Simultâneos'].extend(person['curve']['concurrent'])
+        curves['Pessoa'].extend([person['name']] * len(person['curve']['date']))
+    
+    px = _plotly_express()
+    fig_capacity = px.line(curves, x='Data', y='Projetos Simultâneos', color='Pessoa', line_shape='hv')
+    fig_capacity.add_hline(y=threshold, line_dash="dash", line_color="red")
+    st.plotly_chart(fig_capacity, key="chart_capacity")
+    
+    overloads = [
+        {
+            'Pessoa': person['name'],
+            'Início': period['start'],
+            'Fim': period['end'],
+            'Dias': period['days'],
+            'Pico': period['peak']
+        }
+        for person in capacity['people']
+        for period in person['overload_periods']
+    ]
+    if overloads:
+        st.subheader("Períodos de Sobrecarga")
+        st.dataframe(overloads)
+    else:
+        st.success("Nenhum colaborador acima do limite no período.")
+
+def show_platform_migration():
+    """Exibe a matriz de transição e o tempo de permanência por plataforma"""
+    st.header("Migração de Plataformas")
+    
+    migration = get_platform_migration_stats()
+    
+    if not migration['dwell_stats']:
+        st.info("Nenhum histórico de plataformas registrado.")
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Transições entre Plataformas")
+        if migration['platforms']:
+            px = _plotly_express()
+            fig_transitions = px.imshow(
+                migration['transition_matrix'],
+                x=migration['platforms'],
+                y=migration['platforms'],
+                labels={'x': 'Para', 'y': 'De', 'color': 'Projetos'},
+                text_auto=True,
+                color_continuous_scale='Purples'
+            )
+            st.plotly_chart(fig_transitions, key="chart_platform_transitions")
+        else:
+            st.info("Nenhuma migração de plataforma registrada.")
+    
+    with col2:
+        st.subheader("Tempo de Permanência (dias)")
+        st.dataframe([
+            {
+                'Plataforma': stat['platform_name'],
+                'Períodos Encerrados': stat['closed_stints'],
+                'Mediana': round(stat['median_days'], 1) if stat['median_days'] is not None else None,
+                'P90': round(stat['p90_days'], 1) if stat['p90_days'] is not None else None,
+                'Projetos Atuais': stat['current_projects']
+            }
+            for stat in migration['dwell_stats']
+        ])
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
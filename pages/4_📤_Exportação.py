@@ -2,12 +2,14 @@
 import streamlit as st
 import sys
 import os
-import pandas as pd
+from datetime import date
 
 # Adicionar o diretório raiz ao path para importar módulos
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.connection import export_projects_to_csv, import_projects_from_csv, backup_database
+from database.connection import (
+    export_projects_to_csv, export_projects_to_xlsx, import_projects_from_csv, upsert_projects_from_csv, backup_database
+)
 from utils.helpers import format_date
 from utils.ui import apply_custom_styles, render_sidebar
 
@@ -28,8 +30,9 @@ def main():
     with tab3:
         backup_section()
 
+@st.fragment
 def export_data_section():
-    """Seção para exportação de dados"""
+    """Seção para exportação de dados (fragmento)"""
     st.header("Exportar Projetos")
     
     st.write("Exporte todos os projetos cadastrados para um arquivo CSV.")
@@ -41,16 +44,30 @@ def export_data_section():
             st.download_button(
                 label="Download CSV",
                 data=csv_data,
-                file_name=f"projetos_devflow_{format_date(str(pd.Timestamp.now().date()))}.csv",
+                file_name=f"projetos_devflow_{format_date(str(date.today()))}.csv",
                 mime="text/csv"
             )
             
             st.success("Dados exportados com sucesso! Clique no botão acima para baixar.")
         except Exception as e:
             st.error(f"Erro ao exportar dados: {e}")
+    
+    st.write("Ou gere uma planilha Excel com projetos, histórico de plataformas, colaboradores e estatísticas mensais.")
+    
+    if st.button("Exportar Planilha Excel"):
+        try:
+            st.download_button(
+                label="Download Excel",
+                data=export_projects_to_xlsx(),
+                file_name=f"devflow_{format_date(str(date.today()))}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+        except Exception as e:
+            st.error(f"Erro ao exportar planilha: {e}")
 
+@st.fragment
 def import_data_section():
-    """Seção para importação de dados"""
+    """Seção para importação de dados (fragmento)"""
     st.header("Importar Projetos")
     
     st.write("Importe projetos de um arquivo CSV. O arquivo deve conter as colunas: ID, Nome, Descrição, Tipo de Projeto, Data Início, Data Término, Status")
@@ -62,11 +79,29 @@ def import_data_section():
             # Ler o conteúdo do arquivo
             stringio = uploaded_file.getvalue().decode("utf-8")
             
+            upsert = st.checkbox(
+                "Atualizar projetos existentes (sincronização pelo nome)",
+                help="Projetos com o mesmo nome são atualizados; reimportar o mesmo arquivo não altera nada."
+            )
+            keep_details = st.checkbox(
+                "Guardar a lista de projetos importados na notificação",
+                disabled=upsert,
+                help="A notificação de resumo da importação passa a listar cada projeto criado, com o horário."
+            )
+            
             if st.button("Importar Projetos", type="primary"):
-                imported_count, errors = import_projects_from_csv(stringio)
-                
-                if imported_count > 0:
-                    st.success(f"{imported_count} projetos importados com sucesso!")
+                if upsert:
+                    result = upsert_projects_from_csv(stringio)
+                    imported_count = result['inserted'] + result['updated']
+                    errors = result['errors']
+                    st.info(
+                        f"{result['inserted']} projeto(s) criado(s), {result['updated']} atualizado(s), "
+                        f"{result['unchanged']} sem alteração."
+                    )
+                else:
+                    imported_count, errors = import_projects_from_csv(stringio, keep_notification_details=keep_details)
+                    if imported_count > 0:
+                        st.success(f"{imported_count} projetos importados com sucesso!")
                 
                 if errors:
                     st.error("Erros encontrados durante a importação:")
@@ -79,8 +114,9 @@ def import_data_section():
         except Exception as e:
             st.error(f"Erro ao ler o arquivo: {e}")
 
+@st.fragment
 def backup_section():
-    """Seção para backup de dados"""
+    """Seção para backup de dados (fragmento)"""
     st.header("Backup do Banco de Dados")
     
     st.write("Crie um backup completo do banco de dados para segurança.")
@@ -6,7 +6,10 @@ import os
 # Adicionar o diretório raiz ao path para importar módulos
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.connection import get_recent_notifications, mark_notification_as_read
+from database.connection import (
+    mark_notification_as_read, get_notification_events, count_notification_events, get_notifications_page,
+    get_write_generation
+)
 from utils.ui import apply_custom_styles, render_sidebar
 
 def main():
@@ -14,56 +17,128 @@ def main():
     render_sidebar()
     st.title("🔔 Notificações")
     
+    show_notifications()
+
+# Notificações buscadas por clique em "Carregar mais"
+PAGE_SIZE = 20
+# Eventos de um resumo exibidos quando o usuário pede os detalhes
+EVENTS_SHOWN = 100
+
+TYPE_OPTIONS = {"Todos": None, "Informação": "info", "Sucesso": "success", "Aviso": "warning", "Erro": "error"}
+READ_OPTIONS = {"Todas": None, "Não lidas": False, "Lidas": True}
+
+def load_next_page():
+    """Busca só a página seguinte às já carregadas e a acrescenta à lista da sessão"""
+    page = get_notifications_page(
+        before=st.session_state.notification_next_before,
+        limit=PAGE_SIZE,
+        **st.session_state.notification_filters
+    )
+    st.session_state.notification_rows.extend(page['notifications'])
+    st.session_state.notification_next_before = page['next_before']
+
+@st.fragment
+def show_notifications():
+    """Lista as notificações com filtros e paginação por keyset (fragmento: só a lista recarrega)"""
     st.header("Notificações Recentes")
     
-    notifications = get_recent_notifications(20)  # Pegar as 20 mais recentes
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        type_label = st.selectbox("Tipo", list(TYPE_OPTIONS), key="notification_type_filter")
+    with col2:
+        read_label = st.selectbox("Situação", list(READ_OPTIONS), key="notification_read_filter")
+    with col3:
+        # As datas de criação são gravadas em UTC (CURRENT_TIMESTAMP)
+        period = st.date_input("Período (UTC)", value=(), key="notification_period_filter",
+                               help="Dias em UTC, o mesmo fuso dos horários exibidos nas notificações.")
+    
+    filters = {
+        'notification_type': TYPE_OPTIONS[type_label],
+        'is_read': READ_OPTIONS[read_label],
+        'start_date': period[0].isoformat() if len(period) > 0 else None,
+        'end_date': period[-1].isoformat() if len(period) > 0 else None
+    }
+    # As linhas carregadas ficam na sessão: "Carregar mais" busca só a página nova. Filtros
+    # novos ou notificações alteradas fora desta página recomeçam da primeira página
+    generation = get_write_generation('notifications')
+    if (st.session_state.get('notification_filters') != filters
+            or st.session_state.get('notification_generation') != generation):
+        st.session_state.notification_filters = filters
+        st.session_state.notification_generation = generation
+        st.session_state.notification_rows = []
+        st.session_state.notification_next_before = None
+        load_next_page()
+    
+    rows = st.session_state.notification_rows
+    for notification in rows:
+        show_notification(notification)
     
-    if not notifications:
+    if not rows:
         st.info("Nenhuma notificação encontrada.")
-        return
+    elif st.session_state.notification_next_before is not None:
+        st.button("Carregar mais", on_click=load_next_page)
+
+def show_notification(notification):
+    """Exibe uma notificação com botão para marcá-la como lida"""
+    # Determinar cor com base no tipo de notificação
+    color_map = {
+        'info': '#3498db',
+        'success': '#2ecc71',
+        'warning': '#f39c12',
+        'error': '#e74c3c'
+    }
+    color = color_map.get(notification['type'], '#7f8c8d')
     
-    for notification in notifications:
-        # Determinar cor com base no tipo de notificação
-        color_map = {
-            'info': '#3498db',
-            'success': '#2ecc71',
-            'warning': '#f39c12',
-            'error': '#e74c3c'
-        }
-        color = color_map.get(notification['type'], '#7f8c8d')
+    with st.container():
+        col1, col2, col3 = st.columns([6, 2, 1])
         
-        with st.container():
-            col1, col2, col3 = st.columns([6, 2, 1])
-            
-            with col1:
-                st.markdown(
-                    f"""
-                    <div style="
-                        border-left: 4px solid {color};
-                        padding-left: 15px;
-                        margin-bottom: 10px;
-                        background-color: #f8f9fa;
-                        padding: 10px;
-                        border-radius: 5px;
-                    ">
-                        <strong>{notification['title']}</strong><br>
-                        <small style="color: #666;">{notification['message']}</small><br>
-                        <small style="color: #999;">{notification['created_at']}</small>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
-            
-            with col2:
-                status_text = "Lida" if notification['is_read'] else "Não lida"
-                status_color = "green" if notification['is_read'] else "red"
-                st.markdown(f"<span style='color: {status_color};'>● {status_text}</span>", unsafe_allow_html=True)
+        with col1:
+            st.markdown(
+                f"""
+                <div style="
+                    border-left: 4px solid {color};
+                    padding-left: 15px;
+                    margin-bottom: 10px;
+                    background-color: #f8f9fa;
+                    padding: 10px;
+                    border-radius: 5px;
+                ">
+                    <strong>{notification['title']}</strong><br>
+                    <small style="color: #666;">{notification['message']}</small><br>
+                    <small style="color: #999;">{notification['created_at']}</small>
+                </div>
+                """, 
+                unsafe_allow_html=True
+            )
             
-            with col3:
-                if not notification['is_read']:
-                    if st.button("Marcar como lida", key=f"mark_read_{notification['id']}"):
-                        mark_notification_as_read(notification['id'])
-                        st.rerun()
+            # Resumos gravados com detalhes (importação com "Guardar a lista de projetos importados"):
+            # os eventos só são lidos quando pedidos, e no máximo EVENTS_SHOWN por vez
+            if notification.get('event_count', 1) > 1:
+                if st.toggle(f"Ver eventos ({notification['event_count']})", key=f"show_events_{notification['id']}"):
+                    events = get_notification_events(notification['id'], limit=EVENTS_SHOWN)
+                    if not events:
+                        st.caption("Os detalhes deste resumo não foram guardados.")
+                    for event in events:
+                        st.caption(f"{event['created_at']} — {event['subject']}")
+                    if len(events) == EVENTS_SHOWN:
+                        remaining = count_notification_events(notification['id']) - EVENTS_SHOWN
+                        if remaining > 0:
+                            st.caption(f"... e mais {remaining}")
+        
+        with col2:
+            status_text = "Lida" if notification['is_read'] else "Não lida"
+            status_color = "green" if notification['is_read'] else "red"
+            st.markdown(f"<span style='color: {status_color};'>● {status_text}</span>", unsafe_allow_html=True)
+        
+        with col3:
+            if not notification['is_read']:
+                if st.button("Marcar como lida", key=f"mark_read_{notification['id']}"):
+                    mark_notification_as_read(notification['id'])
+                    # Atualiza a linha já carregada em vez de recarregar todas as páginas
+                    notification['is_read'] = True
+                    st.session_state.notification_generation = get_write_generation('notifications')
+                    # Execução completa: o contador de não lidas da barra lateral fica fora do fragmento
+                    st.rerun()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
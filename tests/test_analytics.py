@@ -0,0 +1,228 @@
+"""
+Testes para as análises do DevFlow Manager
+"""
+import unittest
+import tempfile
+import os
+import sys
+from datetime import datetime, timezone
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, create_project_type, create_platform, create_project,
+    add_platform_to_project, get_write_generation, update_project, delete_project,
+    get_project_status_history, get_db_connection, add_collaborator_to_project
+)
+from database.analytics import (
+    get_platform_migration_stats, get_monthly_project_series, get_status_cycle_metrics,
+    get_collaborator_capacity
+)
+
+class TestAnalytics(unittest.TestCase):
+    """Testes para as funções de análise"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Configurar variáveis de ambiente para usar o banco temporário
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def test_write_generation_changes_on_write(self):
+        """Testa que a geração de escrita muda a cada alteração na tabela"""
+        before = get_write_generation('platforms', 'projects')
+        create_platform("Plataforma Geração", "Descrição")
+        after = get_write_generation('platforms', 'projects')
+        self.assertGreater(after[0], before[0])
+        self.assertEqual(after[1], before[1])
+
+    def test_platform_migration_stats(self):
+        """Testa a matriz de transição e o tempo de permanência por plataforma"""
+        project_type_id = create_project_type("Tipo Migração", "Descrição")
+        wordpress_id = create_platform("WordPress Migração", "Descrição")
+        nextjs_id = create_platform("Next.js Migração", "Descrição")
+
+        for index in range(2):
+            project_id = create_project(f"Projeto Migração {index}", "Descrição", project_type_id, "2026-01-01")
+            add_platform_to_project(project_id, wordpress_id, "2026-01-11")
+            # Registro repetido da mesma plataforma não conta como migração
+            add_platform_to_project(project_id, wordpress_id, "2026-01-20")
+            add_platform_to_project(project_id, nextjs_id, f"2026-02-{10 + index * 10}")
+
+        stats = get_platform_migration_stats()
+        transitions = {(t['from'], t['to']): t['count'] for t in stats['transitions']}
+        self.assertEqual(transitions[("Custom", "WordPress Migração")], 2)
+        self.assertEqual(transitions[("WordPress Migração", "Next.js Migração")], 2)
+        self.assertNotIn(("WordPress Migração", "WordPress Migração"), transitions)
+
+        dwell = {s['platform_name']: s for s in stats['dwell_stats']}
+        self.assertEqual(dwell["WordPress Migração"]['closed_stints'], 2)
+        self.assertEqual(dwell["WordPress Migração"]['median_days'], 35.0)
+        self.assertAlmostEqual(dwell["WordPress Migração"]['p90_days'], 39.0)
+        self.assertEqual(dwell["Custom"]['median_days'], 10.0)
+        self.assertEqual(dwell["Next.js Migração"]['current_projects'], 2)
+
+        # Resultado em cache até a próxima escrita no histórico
+        self.assertIs(get_platform_migration_stats(), stats)
+        add_platform_to_project(project_id, wordpress_id, "2026-03-01")
+        self.assertIsNot(get_platform_migration_stats(), stats)
+
+    def test_monthly_project_series(self):
+        """Testa a manutenção incremental da tabela de fatos mensais"""
+        web_type_id = create_project_type("Tipo Mensal Web", "Descrição")
+        api_type_id = create_project_type("Tipo Mensal API", "Descrição")
+        # Conclusões entram no mês da transição de status (CURRENT_TIMESTAMP, em UTC)
+        current_month = datetime.now(timezone.utc).strftime('%Y-%m')
+
+        first_id = create_project("Projeto Mensal 1", "Descrição", web_type_id, "2026-01-10")
+        second_id = create_project("Projeto Mensal 2", "Descrição", api_type_id, "2026-01-20")
+        third_id = create_project("Projeto Mensal 3", "Descrição", web_type_id, "2026-03-05", "2026-04-01", "Cancelado")
+
+        update_project(first_id, "Projeto Mensal 1", "Descrição", web_type_id, "2026-01-10", "2026-02-15", "Concluído")
+        # Edições posteriores não movem a conclusão e a exclusão não altera os fatos já registrados
+        update_project(first_id, "Projeto Mensal 1 (renomeado)", "Descrição", web_type_id, "2026-01-10", "2026-02-20", "Concluído")
+        delete_project(second_id)
+        # Reabrir desconta o cancelamento
+        update_project(third_id, "Projeto Mensal 3", "Descrição", web_type_id, "2026-03-05", None, "Em Desenvolvimento")
+
+        series = get_monthly_project_series()
+        self.assertEqual(series['month'][0], "2026-01")
+        self.assertEqual(series['month'][-1], max(current_month, "2026-03"))
+        by_month = {month: i for i, month in enumerate(series['month'])}
+        self.assertEqual(series['created'][by_month["2026-01"]], 2)
+        self.assertEqual(series['created'][by_month["2026-03"]], 1)
+        self.assertEqual(sum(series['created']), 3)
+        self.assertEqual(series['completed'][by_month[current_month]], 1)
+        self.assertEqual(sum(series['completed']), 1)
+        self.assertEqual(sum(series['cancelled']), 0)
+        self.assertEqual(series['active'][-1], 2)
+
+        filtered = get_monthly_project_series(start_month="2026-02", end_month="2026-03")
+        self.assertEqual(filtered['month'], ["2026-02", "2026-03"])
+        self.assertEqual(filtered['created'], [0, 1])
+
+        # Mudar o tipo de um projeto concluído move a conclusão para o novo tipo
+        update_project(first_id, "Projeto Mensal 1 (renomeado)", "Descrição", api_type_id, "2026-01-10", "2026-02-20", "Concluído")
+        by_type = get_monthly_project_series(by_type=True)
+        self.assertEqual(set(by_type['project_type']), {"Tipo Mensal Web", "Tipo Mensal API"})
+        completed_by_type = {}
+        for project_type, completed in zip(by_type['project_type'], by_type['completed']):
+            completed_by_type[project_type] = completed_by_type.get(project_type, 0) + completed
+        self.assertEqual(completed_by_type, {"Tipo Mensal Web": 0, "Tipo Mensal API": 1})
+
+    def test_monthly_stats_migration_rebuilds_from_status_history(self):
+        """Testa que bancos com os triggers antigos são recalculados pelo histórico de status"""
+        type_id = create_project_type("Tipo Migração Mensal", "Descrição")
+        project_id = create_project("Projeto Migração Mensal", "Descrição", type_id, "2026-01-10")
+        update_project(project_id, "Projeto Migração Mensal", "Descrição", type_id, "2026-01-10", None, "Concluído")
+        with get_db_connection() as conn:
+            conn.execute("UPDATE project_status_history SET changed_at = '2026-02-03 10:00:00' "
+                         "WHERE project_id = ? AND new_status = 'Concluído'", (project_id,))
+            # Trigger da versão anterior e contagens desatualizadas
+            conn.execute("CREATE TRIGGER trg_projects_monthly_delete AFTER DELETE ON projects BEGIN SELECT 1; END")
+            conn.execute("UPDATE project_monthly_stats SET completed_count = 5")
+            conn.commit()
+        init_db()
+        with get_db_connection() as conn:
+            rows = [tuple(row) for row in conn.execute(
+                "SELECT month, created_count, completed_count FROM project_monthly_stats WHERE project_type_id = ? ORDER BY month",
+                (type_id,)
+            )]
+            old_trigger = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'trg_projects_monthly_delete'").fetchone()
+        self.assertEqual(rows, [("2026-01", 1, 0), ("2026-02", 0, 1)])
+        self.assertIsNone(old_trigger)
+
+    def test_status_history_and_cycle_metrics(self):
+        """Testa o histórico de status e as métricas de ciclo por tipo"""
+        project_type_id = create_project_type("Tipo Ciclo", "Descrição")
+        project_id = create_project("Projeto Ciclo", "Descrição", project_type_id, "2026-01-01")
+
+        for status in ["Em Desenvolvimento", "Em Desenvolvimento", "Testes", "Concluído"]:
+            update_project(project_id, "Projeto Ciclo", "Descrição", project_type_id, "2026-01-01", None, status)
+
+        history = get_project_status_history(project_id)
+        self.assertEqual([h['new_status'] for h in history],
+                         ["Planejamento", "Em Desenvolvimento", "Testes", "Concluído"])
+        self.assertEqual(history[1]['old_status'], "Planejamento")
+
+        # Ajustar as datas das transições para simular a passagem do tempo
+        with get_db_connection() as conn:
+            for entry, changed_at in zip(history, ["2026-01-01", "2026-01-05", "2026-01-15", "2026-01-20"]):
+                conn.execute("UPDATE project_status_history SET changed_at = ? WHERE id = ?", (changed_at, entry['id']))
+            conn.commit()
+        # Forçar nova geração de escrita para invalidar o cache
+        update_project(project_id, "Projeto Ciclo", "Descrição", project_type_id, "2026-01-01", "2026-01-20", "Concluído")
+
+        metrics = get_status_cycle_metrics()
+        time_in_status = {m['status']: m['avg_days'] for m in metrics['time_in_status']}
+        self.assertEqual(time_in_status["Planejamento"], 4.0)
+        self.assertEqual(time_in_status["Em Desenvolvimento"], 10.0)
+        self.assertEqual(time_in_status["Testes"], 5.0)
+        self.assertNotIn("Concluído", time_in_status)
+
+        cycle = metrics['cycle_times'][0]
+        self.assertEqual(cycle['project_type_name'], "Tipo Ciclo")
+        self.assertEqual(cycle['completed_projects'], 1)
+        self.assertEqual(cycle['avg_cycle_days'], 15.0)
+        self.assertEqual(cycle['avg_lead_days'], 19.0)
+
+    def test_collaborator_capacity(self):
+        """Testa a curva de projetos simultâneos e os períodos de sobrecarga"""
+        project_type_id = create_project_type("Tipo Capacidade", "Descrição")
+        periods = [("2026-01-01", "2026-01-31"), ("2026-01-10", "2026-01-20"),
+                   ("2026-01-15", None), ("2026-03-01", "2026-03-10")]
+        for i, (start, end) in enumerate(periods):
+            project_id = create_project(f"Projeto Capacidade {i}", "Descrição", project_type_id, start, end)
+            add_collaborator_to_project(project_id, "Ana", "ana@email.com")
+        add_collaborator_to_project(project_id, "Bruno", "bruno@email.com")
+
+        capacity = get_collaborator_capacity("2026-01-01", "2026-03-31", threshold=2)
+        ana, bruno = capacity['people']
+        self.assertEqual(ana['name'], "Ana")
+        self.assertEqual(ana['peak'], 3)
+        self.assertEqual(ana['curve']['date'][:4], ["2026-01-01", "2026-01-10", "2026-01-15", "2026-01-21"])
+        self.assertEqual(ana['curve']['concurrent'][:4], [1, 2, 3, 2])
+        self.assertEqual(ana['curve']['date'][-1], "2026-03-31")
+        self.assertEqual(ana['overload_periods'], [
+            {'start': "2026-01-15", 'end': "2026-01-20", 'days': 6, 'peak': 3}
+        ])
+        self.assertEqual(bruno['peak'], 1)
+        self.assertEqual(bruno['overload_periods'], [])
+
+        # Intervalo começando no meio de projetos já ativos parte do nível correto
+        capacity = get_collaborator_capacity("2026-01-16", "2026-01-18", threshold=2)
+        ana = capacity['people'][0]
+        self.assertEqual(ana['curve']['concurrent'], [3, 3])
+        self.assertEqual(ana['overload_periods'][0]['end'], "2026-01-18")
+
+        with self.assertRaises(ValueError):
+            get_collaborator_capacity("2026-02-01", "2026-01-01")
+
+    def test_collaborator_capacity_skips_legacy_dates(self):
+        """Testa que datas fora do formato ISO são ignoradas com um aviso no log"""
+        project_type_id = create_project_type("Tipo Capacidade Legada", "Descrição")
+        valid_id = create_project("Projeto Capacidade Válido", "Descrição", project_type_id, "2026-01-05", "2026-01-10")
+        legacy_id = create_project("Projeto Capacidade Legado", "Descrição", project_type_id, "2026-01-01")
+        for project_id in (valid_id, legacy_id):
+            add_collaborator_to_project(project_id, "Carla", "carla@email.com")
+        with get_db_connection() as conn:
+            conn.execute("UPDATE projects SET start_date = '01/02/2024' WHERE id = ?", (legacy_id,))
+            conn.commit()
+
+        with self.assertLogs('database.analytics', level='WARNING'):
+            capacity = get_collaborator_capacity("2026-01-01", "2026-01-31", threshold=2)
+        carla = capacity['people'][0]
+        self.assertEqual(carla['peak'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Testes para a API HTTP/JSON (devflow/api.py)
+"""
+import unittest
+import tempfile
+import threading
+import gzip
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import init_db, get_db_connection, create_project_type, create_project, add_notification
+from devflow.api import create_server
+
+class TestHttpApi(unittest.TestCase):
+    """Testes executando a API em um servidor local"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Configurar variáveis de ambiente para usar o banco temporário
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+        self.project_type_id = create_project_type("Tipo de Teste API", "Descrição")
+
+        self.server = create_server('127.0.0.1', 0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        self.server.shutdown()
+        self.server.server_close()
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def request(self, method, path, body=None, headers=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, method=method, headers=headers or {})
+        if data:
+            request.add_header('Content-Type', 'application/json')
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def get_json(self, path):
+        status, headers, body = self.request('GET', path)
+        return status, headers, json.loads(body) if body else None
+
+    def test_keyset_pagination(self):
+        """Testa a paginação de projetos por keyset"""
+        ids = [create_project(f"Projeto API {i}", "Descrição", self.project_type_id, "2026-01-04") for i in range(5)]
+
+        status, _, page = self.get_json('/projects?limit=2')
+        self.assertEqual(status, 200)
+        self.assertEqual([p['id'] for p in page['projects']], ids[:2])
+
+        seen = []
+        after = None
+        while True:
+            _, _, page = self.get_json('/projects?limit=2' + (f'&after={after}' if after else ''))
+            seen.extend(p['id'] for p in page['projects'])
+            after = page['next_after']
+            if after is None:
+                break
+        self.assertEqual(seen, ids)
+
+        status, _, error = self.get_json('/projects?limit=abc')
+        self.assertEqual(status, 400)
+        self.assertIn('error', error)
+
+        # Feed de notificações com filtros
+        add_notification("Aviso Filtro", "Mensagem", "warning")
+        status, _, page = self.get_json('/notifications?type=warning&read=false&since=2000-01-01')
+        self.assertEqual(status, 200)
+        self.assertEqual([n['title'] for n in page['notifications']], ["Aviso Filtro"])
+        status, _, _ = self.get_json('/notifications?since=ontem')
+        self.assertEqual(status, 400)
+        status, _, _ = self.get_json('/notifications?before=123')
+        self.assertEqual(status, 400)
+
+    def test_etag_returns_304_until_a_write(self):
+        """Testa o GET condicional com ETag derivado da geração de escrita"""
+        create_project("Projeto ETag", "Descrição", self.project_type_id, "2026-01-04")
+        status, headers, _ = self.request('GET', '/projects')
+        etag = headers['ETag']
+
+        status, _, body = self.request('GET', '/projects', headers={'If-None-Match': etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b'')
+
+        # Rotas que não leem projetos não são invalidadas por escritas em projetos
+        _, headers, _ = self.request('GET', '/notifications')
+        notifications_etag = headers['ETag']
+
+        create_project("Projeto ETag 2", "Descrição", self.project_type_id, "2026-01-05")
+        status, headers, _ = self.request('GET', '/projects', headers={'If-None-Match': etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+
+        # create_project registra uma notificação, então o ETag de notificações também muda
+        status, _, _ = self.request('GET', '/notifications', headers={'If-None-Match': notifications_etag})
+        self.assertEqual(status, 200)
+
+    def test_gzip_for_large_responses(self):
+        """Testa a compressão gzip quando o cliente aceita"""
+        for i in range(30):
+            add_notification(f"Notificação {i}", "Mensagem " * 20)
+        status, headers, body = self.request('GET', '/notifications', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(len(json.loads(gzip.decompress(body))['notifications']), 30)
+
+        status, headers, body = self.request('GET', '/notifications')
+        self.assertIsNone(headers['Content-Encoding'])
+
+    def test_project_write_routes(self):
+        """Testa criação, atualização, colaboradores e exclusão via API"""
+        status, _, body = self.request('POST', '/projects', {
+            'name': "Projeto via API", 'project_type_id': self.project_type_id, 'start_date': "2026-01-04"
+        })
+        self.assertEqual(status, 201)
+        project = json.loads(body)
+        self.assertEqual(project['status'], "Planejamento")
+
+        status, _, body = self.request('PUT', f"/projects/{project['id']}", {'status': "Testes"})
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['status'], "Testes")
+
+        status, _, _ = self.request('POST', f"/projects/{project['id']}/collaborators", {'user_name': "Ana"})
+        self.assertEqual(status, 201)
+        _, _, collaborators = self.get_json(f"/projects/{project['id']}/collaborators")
+        self.assertEqual(collaborators[0]['user_name'], "Ana")
+
+        _, _, history = self.get_json(f"/projects/{project['id']}/status-history")
+        self.assertEqual([h['new_status'] for h in history], ["Planejamento", "Testes"])
+
+        status, _, body = self.request('POST', '/projects', {'name': "Projeto via API"})
+        self.assertEqual(status, 400)
+
+        status, _, _ = self.request('DELETE', f"/projects/{project['id']}")
+        self.assertEqual(status, 204)
+        status, _, _ = self.request('GET', f"/projects/{project['id']}")
+        self.assertEqual(status, 404)
+        status, _, _ = self.request('DELETE', '/statistics')
+        self.assertEqual(status, 404)
+
+    def test_write_routes_reject_wrong_types_and_unknown_status(self):
+        """Testa que campos com tipo JSON errado ou status desconhecido retornam 400, não 500"""
+        project_id = create_project("Projeto Tipos", "Descrição", self.project_type_id, "2026-01-04")
+        valid = {'name': "Projeto Tipos Novo", 'project_type_id': self.project_type_id, 'start_date': "2026-01-04"}
+        for invalid in ({'name': ["x"]}, {'status': ["x"]}, {'status': "Arquivado"},
+                        {'project_type_id': "1"}, {'project_type_id': True}, {'description': 5}):
+            status, _, body = self.request('POST', '/projects', {**valid, **invalid})
+            self.assertEqual(status, 400, (invalid, body))
+            status, _, body = self.request('PUT', f'/projects/{project_id}', invalid)
+            self.assertEqual(status, 400, (invalid, body))
+        for invalid in ({'user_name': 5}, {'user_name': "Ana", 'user_email': 5}, {'user_name': "Ana", 'role': []}):
+            status, _, body = self.request('POST', f'/projects/{project_id}/collaborators', invalid)
+            self.assertEqual(status, 400, (invalid, body))
+
+        status, _, body = self.request('PUT', f'/projects/{project_id}', {'status': "Concluído"})
+        self.assertEqual(status, 200)
+
+    def test_internal_errors_are_logged_not_returned(self):
+        """Testa que a resposta 500 não expõe o texto da exceção"""
+        project_id = create_project("Projeto Erro", "Descrição", self.project_type_id, "2026-01-04")
+        with get_db_connection() as conn:
+            conn.execute("PRAGMA foreign_keys = OFF")
+            conn.execute("DROP TABLE project_collaborators")
+            conn.commit()
+
+        with self.assertLogs('devflow.api', level='ERROR') as logs:
+            status, _, data = self.get_json(f'/projects/{project_id}/collaborators')
+        self.assertEqual(status, 500)
+        self.assertEqual(data, {'error': "Erro interno do servidor"})
+        self.assertIn("no such table", '\n'.join(logs.output))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Testes para o cache de consultas do DevFlow Manager
+"""
+import unittest
+import tempfile
+import sqlite3
+import os
+import sys
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, create_project_type, create_project, update_project, add_notification, get_db_call_count
+)
+from database import cache
+
+class TestQueryCache(unittest.TestCase):
+    """Testes para a fachada de leitura em cache"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Configurar variáveis de ambiente para usar o banco temporário
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+        cache.clear_cache()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def test_hits_and_misses_per_argument_tuple(self):
+        """Testa a memorização por tupla de argumentos"""
+        cache.search_projects(query="Cache")
+        cache.search_projects(query="Cache")
+        cache.search_projects(query="Outro")
+
+        stats = cache.get_cache_stats()['search_projects']
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['size'], 2)
+
+    def test_project_write_invalidates_project_reads(self):
+        """Testa que escritas em projetos invalidam as leituras de projetos"""
+        project_type_id = create_project_type("Tipo Cache", "Descrição")
+        project_id = create_project("Projeto Cache", "Descrição", project_type_id, "2026-01-04")
+
+        self.assertEqual(cache.get_project_by_id(project_id).status, "Planejamento")
+        update_project(project_id, "Projeto Cache", "Descrição", project_type_id, "2026-01-04", None, "Testes")
+        self.assertEqual(cache.get_project_by_id(project_id).status, "Testes")
+        self.assertEqual(cache.get_cache_stats()['get_project_by_id']['misses'], 2)
+
+    def test_notification_write_keeps_project_reads(self):
+        """Testa que escritas em notificações não invalidam leituras de projetos"""
+        projects = cache.get_all_projects()
+        notifications = cache.get_recent_notifications(5)
+
+        add_notification("Aviso Cache", "Mensagem", "info")
+
+        self.assertIs(cache.get_all_projects(), projects)
+        self.assertIsNot(cache.get_recent_notifications(5), notifications)
+        self.assertEqual(len(cache.get_recent_notifications(5)), len(notifications) + 1)
+
+    def test_hits_do_not_open_connections(self):
+        """Testa que acertos reutilizam as gerações lidas e não consultam o banco"""
+        project_type_id = create_project_type("Tipo Cache", "Descrição")
+        project_id = create_project("Projeto Cache", "Descrição", project_type_id, "2026-01-04")
+        cache.get_project_by_id(project_id)
+
+        calls_before = get_db_call_count()
+        for _ in range(5):
+            cache.get_project_by_id(project_id)
+        self.assertEqual(get_db_call_count(), calls_before)
+        self.assertEqual(cache.get_cache_stats()['get_project_by_id']['hits'], 5)
+
+    def test_other_process_writes_seen_after_ttl(self):
+        """Testa que escritas de outro processo invalidam o cache depois de GENERATION_TTL"""
+        project_type_id = create_project_type("Tipo Cache", "Descrição")
+        project_id = create_project("Projeto Cache", "Descrição", project_type_id, "2026-01-04")
+        self.assertEqual(cache.get_project_by_id(project_id).status, "Planejamento")
+
+        # Conexão fora da camada de dados, como a de outro processo
+        conn = sqlite3.connect(self.temp_db.name)
+        conn.execute("UPDATE projects SET status = 'Testes' WHERE id = ?", (project_id,))
+        conn.commit()
+        conn.close()
+        self.assertEqual(cache.get_project_by_id(project_id).status, "Planejamento")
+
+        original_ttl = cache.GENERATION_TTL
+        cache.GENERATION_TTL = 0
+        try:
+            self.assertEqual(cache.get_project_by_id(project_id).status, "Testes")
+        finally:
+            cache.GENERATION_TTL = original_ttl
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Testes para a interface de linha de comando (python -m devflow)
+"""
+import unittest
+import tempfile
+import subprocess
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestCommandLine(unittest.TestCase):
+    """Testes executando a CLI em um processo separado, como um job agendado"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'devflow.db')
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        self.temp_dir.cleanup()
+
+    def run_cli(self, *args, input_text=None):
+        return subprocess.run(
+            [sys.executable, '-m', 'devflow', '--db', self.db_path, *args],
+            cwd=ROOT_DIR, input=input_text, capture_output=True, text=True, encoding='utf-8'
+        )
+
+    def test_import_export_roundtrip_via_stdin_stdout(self):
+        """Testa a importação por stdin e a exportação para stdout"""
+        csv_content = (
+            "ID,Nome,Descrição,Tipo de Projeto,Data Início,Data Término,Status\n"
+            "1,Projeto CLI 1,Descrição,Landing Page,2026-01-04,,Planejamento\n"
+            "2,Projeto CLI 2,Descrição,Chatbot,2026-01-05,2026-02-01,Concluído\n"
+        )
+        result = self.run_cli('import', '-', input_text=csv_content)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Importação: 2 projetos", result.stderr)
+
+        result = self.run_cli('export')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        lines = result.stdout.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("ID,Nome"))
+        self.assertIn("projetos/s", result.stderr)
+
+        # Com --upsert, reimportar o mesmo arquivo não cria nem altera projetos
+        result = self.run_cli('import', '--upsert', input_text=csv_content)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("0 inserido(s), 0 atualizado(s), 2 sem alteração", result.stderr)
+
+    def test_import_reports_errors(self):
+        """Testa o código de saída quando há linhas inválidas"""
+        csv_content = (
+            "ID,Nome,Descrição,Tipo de Projeto,Data Início,Data Término,Status\n"
+            "1,Projeto CLI,Descrição,Tipo Inexistente,2026-01-04,,Planejamento\n"
+        )
+        result = self.run_cli('import', input_text=csv_content)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Tipo Inexistente", result.stderr)
+
+    def test_import_rejects_incompatible_options(self):
+        """Testa que opções que seriam ignoradas encerram a importação com erro de uso"""
+        csv_path = os.path.join(self.temp_dir.name, 'projetos.csv')
+        with open(csv_path, 'w', encoding='utf-8') as csv_file:
+            csv_file.write("ID,Nome,Descrição,Tipo de Projeto,Data Início,Data Término,Status\n")
+        for options in (['--upsert'], ['--workers', '2']):
+            result = self.run_cli('import', '--notification-details', *options, csv_path)
+            self.assertEqual(result.returncode, 2)
+            self.assertIn("--notification-details", result.stderr)
+
+    def test_backup_restore_and_maintenance(self):
+        """Testa backup, restauração e manutenção sem carregar o Streamlit"""
+        backup_path = os.path.join(self.temp_dir.name, 'backup.db')
+        self.assertEqual(self.run_cli('backup', '-o', backup_path).returncode, 0)
+        self.assertTrue(os.path.exists(backup_path))
+        self.assertEqual(self.run_cli('restore', backup_path).returncode, 0)
+
+        result = self.run_cli('maintenance', '--compact-orphans')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("página(s) recuperada(s)", result.stderr)
+
+    def test_does_not_import_ui_libraries(self):
+        """Testa que a CLI não importa streamlit, plotly nem pandas"""
+        code = (
+            "import sys; from devflow import cli; from database.connection import init_db, validate_project_data; "
+            "init_db(); validate_project_data('Projeto', '', 1, '2026-01-04'); "
+            "print(sorted(m for m in ('streamlit', 'plotly', 'pandas') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR, capture_output=True, text=True,
+                                env=dict(os.environ, DB_NAME=self.db_path))
+        self.assertEqual(result.stdout.strip(), "[]", result.stderr)
+
+    def test_profile_startup(self):
+        """Testa o relatório de tempo de inicialização por módulo"""
+        result = self.run_cli('profile-startup', '--budget-ms', '100000')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("import database.connection:", result.stdout)
+        self.assertIn("init_db (banco existente):", result.stdout)
+
+        result = self.run_cli('profile-startup', '--budget-ms', '0')
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("ACIMA do", result.stdout)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,13 @@ from database.connection import (
     add_platform_to_project, get_project_platforms_history,
     validate_project_data, validate_project_type_data, validate_platform_data,
     delete_project, update_project, add_notification, get_recent_notifications,
-    add_collaborator_to_project, get_project_collaborators
+    add_collaborator_to_project, get_project_collaborators, lookup_projects_by_name,
+    bulk_update_project_status, bulk_reassign_project_type, bulk_extend_project_deadlines,
+    bulk_delete_projects, get_project_type_usage_counts, get_platform_usage_counts,
+    merge_project_types, merge_platforms, ensure_db_initialized, backup_database, restore_database,
+    validate_projects_batch, validate_platforms_batch, get_db_call_count,
+    notification_batch, get_notification_events, mark_notification_as_read, get_notifications_page,
+    get_db_connection, delete_platform, DEFAULT_PLATFORM_NAME, count_notification_events
 )
 
 class TestDatabaseFunctions(unittest.TestCase):
@@ -237,5 +243,246 @@ class TestDatabaseFunctions(unittest.TestCase):
         self.assertEqual(len(collaborators), 1)
         self.assertEqual(collaborators[0]['user_name'], "João Silva")
 
+    def test_lookup_projects_by_name(self):
+        """Testa a busca incremental de projetos pelo início do nome"""
+        project_type_id = create_project_type("Tipo de Teste Lookup", "Descrição")
+        for name in ["Alpha Site", "alpha_api", "Alphabet", "Beta Site"]:
+            create_project(name, "Descrição", project_type_id, "2026-01-04")
+
+        names = [p['name'] for p in lookup_projects_by_name("alpha")]
+        self.assertEqual(names, ["Alpha Site", "alpha_api", "Alphabet"])
+
+        # Curingas do LIKE são tratados como texto
+        names = [p['name'] for p in lookup_projects_by_name("alpha_")]
+        self.assertEqual(names, ["alpha_api"])
+
+        self.assertEqual(len(lookup_projects_by_name(None, limit=2)), 2)
+
+    def test_bulk_project_operations(self):
+        """Testa as operações em massa por conjunto de IDs e por filtro"""
+        project_type_id = create_project_type("Tipo de Teste Massa", "Descrição")
+        new_project_type_id = create_project_type("Tipo Novo Massa", "Descrição")
+        ids = [
+            create_project(f"Projeto Massa {i}", "Descrição", project_type_id, "2026-01-04", "2026-02-01")
+            for i in range(3)
+        ]
+        no_deadline_id = create_project("Projeto Massa Sem Prazo", "Descrição", project_type_id, "2026-01-04")
+
+        self.assertEqual(bulk_update_project_status("Testes", project_ids=ids[:2]), 2)
+        self.assertEqual(get_project_by_id(ids[0]).status, "Testes")
+        self.assertEqual(get_project_by_id(ids[2]).status, "Planejamento")
+
+        # Projetos que já estão no status de destino não são contados
+        self.assertEqual(bulk_update_project_status("Testes", filters={'query': "Massa"}), 2)
+
+        self.assertEqual(bulk_extend_project_deadlines(10, filters={'project_type_id': project_type_id}), 3)
+        self.assertEqual(get_project_by_id(ids[0]).end_date, "2026-02-11")
+        self.assertIsNone(get_project_by_id(no_deadline_id).end_date)
+
+        self.assertEqual(bulk_reassign_project_type(new_project_type_id, project_ids=ids), 3)
+        self.assertEqual(get_project_by_id(ids[1]).project_type_id, new_project_type_id)
+
+        self.assertEqual(bulk_delete_projects(filters={'project_type_id': new_project_type_id}), 3)
+        self.assertIsNone(get_project_by_id(ids[0]))
+        self.assertIsNotNone(get_project_by_id(no_deadline_id))
+
+        # Uma única notificação de resumo por operação
+        titles = [n['title'] for n in get_recent_notifications(20)]
+        self.assertEqual(titles.count("Exclusão em Massa: 3 projeto(s)"), 1)
+
+        # Sem IDs nem filtros nenhuma operação é aplicada a todos os projetos
+        with self.assertRaises(ValueError):
+            bulk_delete_projects()
+        self.assertEqual(bulk_delete_projects(project_ids=[]), 0)
+
+    def test_usage_counts_and_merge(self):
+        """Testa a contagem de uso e a mesclagem de tipos de projeto e plataformas"""
+        source_type_id = create_project_type("Tipo Duplicado Merge", "Descrição")
+        target_type_id = create_project_type("Tipo Destino Merge", "Descrição")
+        source_platform_id = create_platform("Plataforma Duplicada Merge", "Descrição")
+        target_platform_id = create_platform("Plataforma Destino Merge", "Descrição")
+        project_ids = [
+            create_project(f"Projeto Merge {i}", "Descrição", source_type_id, "2026-01-04")
+            for i in range(2)
+        ]
+        for project_id in project_ids:
+            add_platform_to_project(project_id, source_platform_id, "2026-01-05")
+
+        type_counts = get_project_type_usage_counts()
+        self.assertEqual(type_counts[source_type_id], 2)
+        self.assertEqual(type_counts[target_type_id], 0)
+        self.assertEqual(get_platform_usage_counts()[source_platform_id], 2)
+
+        self.assertEqual(merge_project_types(source_type_id, target_type_id), 2)
+        self.assertIsNone(get_project_type_by_id(source_type_id))
+        self.assertEqual(get_project_by_id(project_ids[0]).project_type_id, target_type_id)
+        self.assertEqual(get_project_type_usage_counts()[target_type_id], 2)
+
+        self.assertEqual(merge_platforms(source_platform_id, target_platform_id), 2)
+        self.assertIsNone(get_platform_by_id(source_platform_id))
+        self.assertEqual(get_project_platforms_history(project_ids[1])[-1]['platform_id'], target_platform_id)
+
+        with self.assertRaises(ValueError):
+            merge_project_types(target_type_id, target_type_id)
+        with self.assertRaises(ValueError):
+            merge_platforms(source_platform_id, target_platform_id)
+
+    def test_default_platform_is_protected_and_resolved_by_name(self):
+        """Testa que a plataforma padrão não é excluída nem mesclada e é buscada pelo nome"""
+        default_id = next(p.id for p in get_all_platforms() if p.name == DEFAULT_PLATFORM_NAME)
+        other_id = create_platform("Plataforma Destino Padrão", "Descrição")
+        with self.assertRaises(ValueError):
+            delete_platform(default_id)
+        with self.assertRaises(ValueError):
+            merge_platforms(default_id, other_id)
+        self.assertIsNotNone(get_platform_by_id(default_id))
+
+        # Bancos antigos podem ter renomeado a plataforma: ela é recriada na criação do projeto
+        with get_db_connection() as conn:
+            conn.execute("UPDATE platforms SET name = 'Sob Medida' WHERE id = ?", (default_id,))
+            conn.commit()
+        project_id = create_project("Projeto Plataforma Padrão", "Descrição", 1, "2026-01-04")
+        history = get_project_platforms_history(project_id)
+        self.assertEqual([h['platform_name'] for h in history], [DEFAULT_PLATFORM_NAME])
+        self.assertNotEqual(history[0]['platform_id'], default_id)
+
+    def test_create_project_is_atomic(self):
+        """Testa que uma falha na criação não deixa projeto sem plataforma inicial"""
+        with self.assertRaises(Exception):
+            create_project("Projeto Tipo Inválido", "Descrição", 9999, "2026-01-04")
+        self.assertEqual(lookup_projects_by_name("Projeto Tipo Inválido"), [])
+
+    def test_ensure_db_initialized_runs_once(self):
+        """Testa que a inicialização do banco roda uma vez por processo para cada banco"""
+        self.assertTrue(ensure_db_initialized())
+        self.assertFalse(ensure_db_initialized())
+        self.assertIsNotNone(get_project_type_by_id(1))
+
+        # Restaurar um backup troca o arquivo: a próxima execução reaplica init_db()
+        backup_path = backup_database(self.temp_db.name + '.bak')
+        try:
+            restore_database(backup_path)
+            self.assertTrue(ensure_db_initialized())
+            self.assertFalse(ensure_db_initialized())
+        finally:
+            os.unlink(backup_path)
+
+    def test_validate_projects_batch(self):
+        """Testa a validação em lote: uma consulta de unicidade, duplicatas no lote e exclude_id"""
+        project_type_id = create_project_type("Tipo Lote", "Descrição")
+        existing_id = create_project("Projeto Existente", "Descrição", project_type_id, "2026-01-04")
+        records = [
+            {'name': "Projeto Novo", 'project_type_id': project_type_id, 'start_date': "2026-01-04"},
+            {'name': "Projeto Existente", 'project_type_id': project_type_id, 'start_date': "2026-01-04"},
+            {'name': "Projeto Novo", 'project_type_id': project_type_id, 'start_date': "2026-01-04"},
+            {'name': "Projeto Datas", 'project_type_id': project_type_id, 'start_date': "2026-1-4",
+             'end_date': "2026-02-30"},
+            {'name': "Projeto Fim", 'project_type_id': project_type_id, 'start_date': "2026-01-04",
+             'end_date': "2026-01-01"},
+        ]
+
+        calls_before = get_db_call_count()
+        errors = validate_projects_batch(records)
+        self.assertEqual(get_db_call_count() - calls_before, 1)
+
+        self.assertEqual(errors[0], [])
+        self.assertEqual(errors[1], ["Já existe um projeto com este nome"])
+        self.assertEqual(errors[2], ["Nome de projeto repetido no lote"])
+        self.assertEqual(errors[3], [
+            "Formato de data de início inválido (deve ser YYYY-MM-DD)",
+            "Formato de data de término inválido (deve ser YYYY-MM-DD)"
+        ])
+        self.assertEqual(errors[4], ["Data de término deve ser posterior à data de início"])
+
+        # O próprio projeto não conta como nome duplicado
+        self.assertEqual(validate_project_data(
+            "Projeto Existente", "Descrição", project_type_id, "2026-01-04", exclude_id=existing_id
+        ), [])
+
+        platform_id = create_platform("Plataforma Lote", "Descrição")
+        self.assertEqual(validate_platforms_batch([
+            {'name': "Plataforma Lote"}, {'name': "Plataforma Nova"}, {'name': ""}
+        ]), [["Já existe uma plataforma com este nome"], [], ["Nome da plataforma é obrigatório"]])
+        self.assertEqual(validate_platforms_batch([{'name': "Plataforma Lote", 'exclude_id': platform_id}]), [[]])
+
+    def test_notification_digests(self):
+        """Testa o agrupamento de eventos de notificação em resumos"""
+        project_type_id = create_project_type("Tipo Resumo", "Descrição")
+        with notification_batch(keep_details=True):
+            ids = [create_project(f"Projeto Resumo {i}", "Descrição", project_type_id, "2026-01-04")
+                   for i in range(152)]
+        digest = get_recent_notifications(1)[0]
+        self.assertEqual(digest['title'], "152 projetos criados")
+        self.assertEqual(digest['event_count'], 152)
+        self.assertIn("'Projeto Resumo 151'", digest['message'])
+        self.assertIn("e mais 147", digest['message'])
+        events = get_notification_events(digest['id'])
+        self.assertEqual(len(events), 152)
+        self.assertEqual(events[0]['subject'], "Projeto Resumo 0")
+        first_events = get_notification_events(digest['id'], limit=100)
+        self.assertEqual(first_events, events[:100])
+        self.assertEqual(count_notification_events(digest['id']), 152)
+        # Cada evento guarda o próprio horário, em UTC como o CURRENT_TIMESTAMP
+        with get_db_connection() as conn:
+            now = datetime.fromisoformat(conn.execute("SELECT CURRENT_TIMESTAMP").fetchone()[0])
+        self.assertLess(abs((now - datetime.fromisoformat(events[0]['created_at'])).total_seconds()), 60)
+
+        # Fora de um bloco, eventos seguidos somam-se ao resumo não lido mais recente
+        delete_project(ids[0])
+        self.assertEqual(get_recent_notifications(1)[0]['title'], f"Projeto Excluído: Projeto Resumo 0")
+        delete_project(ids[1])
+        delete_project(ids[2])
+        latest = get_recent_notifications(2)
+        self.assertEqual(latest[0]['title'], "3 projetos excluídos")
+        self.assertEqual(latest[1]['title'], "152 projetos criados")
+        self.assertEqual(get_notification_events(latest[0]['id']), [])
+
+        # Depois de lida, a notificação não recebe novos eventos
+        mark_notification_as_read(latest[0]['id'])
+        delete_project(ids[3])
+        self.assertEqual(get_recent_notifications(1)[0]['title'], "Projeto Excluído: Projeto Resumo 3")
+
+    def test_notifications_feed_pagination_and_filters(self):
+        """Testa a paginação por (created_at, id) e os filtros do feed de notificações"""
+        with get_db_connection() as conn:
+            conn.execute("DELETE FROM notifications")
+            conn.executemany(
+                "INSERT INTO notifications (title, message, type, is_read, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(f"Notificação {i}", "Mensagem", "warning" if i % 3 == 0 else "info", i % 2,
+                  f"2026-01-{i % 5 + 1:02d} 10:00:00") for i in range(25)]
+            )
+            conn.commit()
+
+        seen = []
+        before = None
+        while True:
+            page = get_notifications_page(before=before, limit=4)
+            seen.extend(page['notifications'])
+            before = page['next_before']
+            if before is None:
+                break
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len({n['id'] for n in seen}), 25)
+        keys = [(n['created_at'], n['id']) for n in seen]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+        with self.assertRaises(ValueError):
+            get_notifications_page(before="não-é-um-cursor")
+
+        warnings = get_notifications_page(limit=50, notification_type="warning")['notifications']
+        self.assertEqual(len(warnings), 9)
+        unread = get_notifications_page(limit=50, is_read=False)['notifications']
+        self.assertTrue(unread and all(not n['is_read'] for n in unread))
+        self.assertEqual(len(unread), 13)
+        first_days = get_notifications_page(limit=50, start_date="2026-01-02", end_date="2026-01-03")['notifications']
+        self.assertEqual(len(first_days), 10)
+
+        # O cursor guarda a posição: excluir a última notificação carregada não interrompe o feed
+        first_page = get_notifications_page(limit=4)
+        with get_db_connection() as conn:
+            conn.execute("DELETE FROM notifications WHERE id = ?", (first_page['notifications'][-1]['id'],))
+            conn.commit()
+        second_page = get_notifications_page(before=first_page['next_before'], limit=4)
+        self.assertEqual([n['id'] for n in second_page['notifications']], [n['id'] for n in seen[4:8]])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,96 @@
+# tests/test_dump.py
+"""
+Testes do dump NDJSON e da restauração
+"""
+import unittest
+import tempfile
+import io
+import os
+import sys
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, get_db_connection, create_project_type, create_platform, create_project,
+    update_project, add_platform_to_project, add_collaborator_to_project, add_notification
+)
+from database.dump import DUMP_TABLES, dump_database, restore_dump, open_dump
+
+class TestDump(unittest.TestCase):
+    """Testes de ida e volta do dump lógico"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.environ['DB_NAME'] = os.path.join(self.temp_dir.name, 'origem.db')
+        init_db()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        self.temp_dir.cleanup()
+
+    def snapshot(self):
+        """Conteúdo de todas as tabelas exportadas e das estatísticas mensais"""
+        with get_db_connection() as conn:
+            data = {
+                table: [tuple(row) for row in conn.execute(f"SELECT * FROM {table} ORDER BY id")]
+                for table in DUMP_TABLES
+            }
+            data['project_monthly_stats'] = [
+                tuple(row) for row in conn.execute("SELECT * FROM project_monthly_stats ORDER BY month, project_type_id")
+            ]
+        return data
+
+    def test_roundtrip_preserves_ids_and_history(self):
+        """Testa que o dump restaurado em outro banco reproduz todas as tabelas"""
+        type_id = create_project_type("Tipo Dump", "Descrição")
+        platform_id = create_platform("Plataforma Dump", "Descrição")
+        project_id = create_project("Projeto Dump", "Descrição \"com aspas\"\ne quebra", type_id, "2026-01-04")
+        update_project(project_id, "Projeto Dump", "Descrição", type_id, "2026-01-04", "2026-03-01", "Concluído")
+        add_platform_to_project(project_id, platform_id, "2026-02-01")
+        add_collaborator_to_project(project_id, "Ana Souza", "ana@example.com", "manager")
+        add_notification("Aviso", "Mensagem com acentuação", "info")
+        with get_db_connection() as conn:
+            # Órfão deixado por uma versão sem chaves estrangeiras: não entra no dump
+            conn.execute("PRAGMA foreign_keys = OFF")
+            conn.execute("INSERT INTO project_platforms (project_id, platform_id, assigned_date) VALUES (9999, ?, '2026-01-01')",
+                         (platform_id,))
+            conn.commit()
+        dump_path = os.path.join(self.temp_dir.name, 'devflow.ndjson.gz')
+        with open_dump(dump_path, 'w') as output:
+            counts = dump_database(output)
+        self.assertEqual(counts['projects'], 1)
+        with get_db_connection() as conn:
+            conn.execute("DELETE FROM project_platforms WHERE project_id = 9999")
+            conn.commit()
+        expected = self.snapshot()
+
+        os.environ['DB_NAME'] = os.path.join(self.temp_dir.name, 'destino.db')
+        init_db()
+        create_project("Projeto Descartado", "Descrição", 1, "2026-01-04")
+        with open_dump(dump_path, 'r') as dump_file:
+            restored = restore_dump(dump_file, batch_size=2)
+        self.assertEqual(restored, counts)
+        self.assertEqual(self.snapshot(), expected)
+
+        # Novos registros continuam a partir dos IDs restaurados
+        new_id = create_project("Projeto Após Carga", "Descrição", type_id, "2026-04-01")
+        self.assertGreater(new_id, project_id)
+
+    def test_rejects_files_that_are_not_dumps(self):
+        """Testa que um arquivo qualquer não apaga os dados atuais"""
+        create_project("Projeto Mantido", "Descrição", 1, "2026-01-04")
+        with self.assertRaises(ValueError):
+            restore_dump(io.StringIO("ID,Nome\n1,Projeto\n"))
+        with get_db_connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0], 1)
+
+        header = '{"format": "devflow-dump", "version": 1}\n'
+        for body in ('5\n', '"x"\n', '{"table": "projects"}\n'):
+            with self.assertRaises(ValueError):
+                restore_dump(io.StringIO(header + body))
+
+if __name__ == '__main__':
+    unittest.main()
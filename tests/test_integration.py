@@ -15,7 +15,8 @@ from database.connection import (
     init_db, create_project_type, create_platform, create_project,
     add_platform_to_project, get_project_by_id, get_project_platforms_history,
     get_all_projects, search_projects, add_collaborator_to_project,
-    get_project_collaborators, export_projects_to_csv, import_projects_from_csv
+    get_project_collaborators, export_projects_to_csv, import_projects_from_csv,
+    upsert_projects_from_csv, get_recent_notifications, get_notification_events, get_db_connection
 )
 
 class TestIntegration(unittest.TestCase):
@@ -126,5 +127,81 @@ class TestIntegration(unittest.TestCase):
         self.assertEqual(len(projects), 1)
         self.assertEqual(projects[0].name, "Projeto Exportação")
 
+    def test_import_keeps_notification_details_when_requested(self):
+        """Testa que a importação guarda os projetos no resumo só quando pedido"""
+        web_type_id = create_project_type("Tipo Detalhes", "Descrição")
+        for i in range(3):
+            create_project(f"Projeto Detalhe {i}", "Descrição", web_type_id, "2026-01-04")
+        csv_data = export_projects_to_csv()
+        with get_db_connection() as conn:
+            conn.execute("DELETE FROM projects")
+            conn.execute("UPDATE notifications SET is_read = 1")
+            conn.commit()
+
+        imported_count, errors = import_projects_from_csv(csv_data, keep_notification_details=True)
+        self.assertEqual((imported_count, errors), (3, []))
+        digest = get_recent_notifications(1)[0]
+        self.assertEqual(digest['title'], "3 projetos criados")
+        self.assertEqual(
+            [event['subject'] for event in get_notification_events(digest['id'])],
+            [f"Projeto Detalhe {i}" for i in range(3)]
+        )
+
+        with get_db_connection() as conn:
+            conn.execute("DELETE FROM projects")
+            conn.execute("UPDATE notifications SET is_read = 1")
+            conn.commit()
+        import_projects_from_csv(csv_data)
+        self.assertEqual(get_notification_events(get_recent_notifications(1)[0]['id']), [])
+
+    def test_upsert_import_is_idempotent(self):
+        """Testa que reimportar o mesmo CSV com upsert não duplica nem reescreve projetos"""
+        web_type_id = create_project_type("Tipo Sincronização", "Descrição")
+        create_project("Projeto Sincronizado", "Antigo", web_type_id, "2026-01-04")
+        header = "ID,Nome,Descrição,Tipo de Projeto,Data Início,Data Término,Status,Criado em,Atualizado em\n"
+        csv_data = header + (
+            ",Projeto Sincronizado,Nova descrição,Tipo Sincronização,2026-01-04,,Testes,,\n"
+            ",Projeto Novo,,Tipo Sincronização,2026-02-01,2026-03-01,Planejamento,,\n"
+            ",Projeto Inválido,,Tipo Sincronização,2026-02-01,2026-01-01,Planejamento,,\n"
+        )
+
+        result = upsert_projects_from_csv(csv_data)
+        self.assertEqual((result['inserted'], result['updated'], result['unchanged']), (1, 1, 0))
+        self.assertEqual(len(result['errors']), 1)
+        projects = {p.name: p for p in get_all_projects()}
+        self.assertEqual(len(projects), 2)
+        self.assertEqual(projects["Projeto Sincronizado"].status, "Testes")
+        self.assertEqual(len(get_project_platforms_history(projects["Projeto Novo"].id)), 1)
+
+        # Segunda execução: nada muda, nenhuma escrita e nenhuma notificação
+        with get_db_connection() as conn:
+            changes_before = conn.execute("SELECT generation FROM write_generations WHERE table_name = 'projects'").fetchone()[0]
+        notifications_before = len(get_recent_notifications(100))
+        result = upsert_projects_from_csv(csv_data)
+        self.assertEqual((result['inserted'], result['updated'], result['unchanged']), (0, 0, 2))
+        with get_db_connection() as conn:
+            changes_after = conn.execute("SELECT generation FROM write_generations WHERE table_name = 'projects'").fetchone()[0]
+        self.assertEqual(changes_before, changes_after)
+        self.assertEqual(len(get_recent_notifications(100)), notifications_before)
+        self.assertEqual(len(get_all_projects()), 2)
+
+    def test_duplicate_project_names_are_renamed_before_unique_index(self):
+        """Testa a migração de bancos antigos com nomes de projeto repetidos"""
+        web_type_id = create_project_type("Tipo Migração", "Descrição")
+        with get_db_connection() as conn:
+            conn.execute("DROP INDEX idx_projects_name_unique")
+            conn.commit()
+        first_id = create_project("Projeto Repetido", "Descrição", web_type_id, "2026-01-04")
+        second_id = create_project("Projeto Repetido", "Descrição", web_type_id, "2026-01-04")
+        # Já existe um projeto com o nome que o sufixo produziria
+        third_id = create_project("Projeto Repetido", "Descrição", web_type_id, "2026-01-04")
+        taken_id = create_project(f"Projeto Repetido (#{third_id})", "Descrição", web_type_id, "2026-01-04")
+
+        init_db()
+        self.assertEqual(get_project_by_id(first_id).name, "Projeto Repetido")
+        self.assertEqual(get_project_by_id(second_id).name, f"Projeto Repetido (#{second_id})")
+        self.assertEqual(get_project_by_id(third_id).name, f"Projeto Repetido (#{third_id}-2)")
+        self.assertEqual(get_project_by_id(taken_id).name, f"Projeto Repetido (#{third_id})")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Testes para as rotinas de manutenção do DevFlow Manager
+"""
+import unittest
+import tempfile
+import sqlite3
+import os
+import sys
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, get_db_path, get_db_connection, create_project_type, create_platform, create_project,
+    delete_project, add_platform_to_project, add_collaborator_to_project, get_project_collaborators
+)
+from database.maintenance import (
+    count_orphans, compact_orphans, check_foreign_keys, run_compaction_if_due, get_last_run,
+    get_file_sizes, enable_incremental_vacuum, is_incremental_vacuum_enabled, reclaim_free_pages,
+    checkpoint_wal, run_maintenance, run_maintenance_if_due, is_wal_enabled, start_due_maintenance
+)
+
+class TestOrphanCompaction(unittest.TestCase):
+    """Testes para a aplicação de chaves estrangeiras e a compactação de órfãos"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Configurar variáveis de ambiente para usar o banco temporário
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+        self.project_type_id = create_project_type("Tipo de Teste Manutenção", "Descrição")
+        self.platform_id = create_platform("Plataforma Teste Manutenção", "Descrição")
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def _create_project_with_children(self, name):
+        project_id = create_project(name, "Descrição", self.project_type_id, "2026-01-04")
+        add_platform_to_project(project_id, self.platform_id, "2026-01-05")
+        add_collaborator_to_project(project_id, "Maria", "maria@email.com")
+        return project_id
+
+    def test_delete_project_cascades(self):
+        """Testa que a exclusão de um projeto remove histórico e colaboradores"""
+        project_id = self._create_project_with_children("Projeto Cascata")
+        delete_project(project_id)
+
+        self.assertEqual(get_project_collaborators(project_id), [])
+        self.assertEqual(count_orphans(), {
+            'project_platforms': 0, 'project_collaborators': 0, 'project_status_history': 0
+        })
+
+    def test_compact_orphans_in_batches(self):
+        """Testa a exclusão em lotes de linhas órfãs criadas sem chaves estrangeiras"""
+        project_ids = [self._create_project_with_children(f"Projeto Órfão {i}") for i in range(3)]
+        kept_id = self._create_project_with_children("Projeto Mantido")
+
+        # Simula exclusões feitas antes da ativação das chaves estrangeiras
+        conn = sqlite3.connect(get_db_path())
+        conn.executemany("DELETE FROM projects WHERE id = ?", [(i,) for i in project_ids])
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(count_orphans()['project_collaborators'], 3)
+        self.assertGreater(len(check_foreign_keys()), 0)
+
+        result = compact_orphans(batch_size=2)
+        self.assertEqual(result['deleted']['project_collaborators'], 3)
+        # Cada projeto tem a plataforma inicial e a adicionada, e o status inicial
+        self.assertEqual(result['deleted']['project_platforms'], 6)
+        self.assertEqual(result['deleted']['project_status_history'], 3)
+        self.assertEqual(result['violations'], [])
+        self.assertEqual(len(get_project_collaborators(kept_id)), 1)
+
+    def test_run_compaction_if_due(self):
+        """Testa que a compactação automática roda uma vez por intervalo"""
+        self.assertIsNotNone(run_compaction_if_due())
+        self.assertIsNone(run_compaction_if_due())
+        self.assertEqual(get_last_run('compact_orphans')['details']['violations'], 0)
+
+class TestDatabaseMaintenance(unittest.TestCase):
+    """Testes para optimize, vacuum incremental e checkpoint do WAL"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Configurar variáveis de ambiente para usar o banco temporário
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def _fill_and_delete_notifications(self, count=2000):
+        with get_db_connection() as conn:
+            conn.executemany(
+                "INSERT INTO notifications (title, message) VALUES (?, ?)",
+                [(f"Notificação {i}", "x" * 200) for i in range(count)]
+            )
+            conn.execute("DELETE FROM notifications")
+            conn.commit()
+
+    def _free_pages(self):
+        with get_db_connection() as conn:
+            return conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def test_new_database_uses_incremental_vacuum(self):
+        """Testa que bancos novos já são criados com auto_vacuum incremental"""
+        self.assertFalse(enable_incremental_vacuum())
+
+        self._fill_and_delete_notifications()
+        size_before = get_file_sizes()['database']
+        self.assertGreater(self._free_pages(), 0)
+
+        reclaimed = reclaim_free_pages(step_pages=16, time_budget=5)
+        self.assertGreater(reclaimed, 0)
+        self.assertEqual(self._free_pages(), 0)
+        self.assertLess(get_file_sizes()['database'], size_before)
+
+    def test_existing_database_is_migrated(self):
+        """Testa a migração de um banco criado sem auto_vacuum"""
+        conn = sqlite3.connect(get_db_path())
+        conn.execute("PRAGMA auto_vacuum = NONE")
+        conn.execute("VACUUM")
+        conn.close()
+        self._fill_and_delete_notifications()
+        self.assertEqual(reclaim_free_pages(), 0)
+
+        # A manutenção automática não executa o VACUUM completo da migração
+        self.assertFalse(run_maintenance()['migrated'])
+        self.assertFalse(is_incremental_vacuum_enabled())
+
+        self.assertTrue(run_maintenance(migrate_auto_vacuum=True)['migrated'])
+        self.assertTrue(is_incremental_vacuum_enabled())
+        with get_db_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+        self.assertFalse(enable_incremental_vacuum())
+
+    def test_wal_checkpoint_above_threshold(self):
+        """Testa o checkpoint com truncamento quando o WAL passa do limite"""
+        conn = sqlite3.connect(get_db_path())
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA wal_autocheckpoint = 0")
+        conn.executemany(
+            "INSERT INTO notifications (title, message) VALUES (?, ?)",
+            [(f"Notificação {i}", "x" * 200) for i in range(500)]
+        )
+        conn.commit()
+
+        self.assertTrue(is_wal_enabled())
+        self.assertGreater(get_file_sizes()['wal'], 0)
+        self.assertFalse(checkpoint_wal(threshold_bytes=10 ** 9))
+        self.assertTrue(checkpoint_wal(threshold_bytes=0))
+        self.assertEqual(get_file_sizes()['wal'], 0)
+        conn.close()
+
+    def test_run_maintenance_reports_and_records(self):
+        """Testa o relatório da manutenção e a execução no máximo uma vez por intervalo"""
+        self._fill_and_delete_notifications()
+        report = run_maintenance_if_due()
+
+        self.assertIsNotNone(report)
+        self.assertGreater(report['reclaimed_pages'], 0)
+        self.assertLess(report['size_after']['database'], report['size_before']['database'])
+        self.assertEqual(get_last_run('maintenance')['details']['reclaimed_pages'], report['reclaimed_pages'])
+        with get_db_connection() as conn:
+            self.assertIsNotNone(conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone())
+
+        self.assertIsNone(run_maintenance_if_due())
+
+    def test_rollback_journal_skips_wal_checkpoint(self):
+        """Testa que bancos sem WAL não fazem checkpoint"""
+        self.assertFalse(is_wal_enabled())
+        self.assertFalse(checkpoint_wal(threshold_bytes=0))
+        self.assertFalse(run_maintenance(wal_threshold_bytes=0)['wal_checkpointed'])
+
+    def test_start_due_maintenance_checks_once_per_interval(self):
+        """Testa que as rotinas devidas rodam em uma thread e a verificação não se repete a cada execução"""
+        thread = start_due_maintenance()
+        self.assertIsNotNone(thread)
+        thread.join(timeout=30)
+        self.assertIsNotNone(get_last_run('maintenance'))
+        self.assertIsNotNone(get_last_run('compact_orphans'))
+        self.assertIsNone(start_due_maintenance())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# tests/test_parallel_import.py
+"""
+Testes da importação paralela de CSV
+"""
+import unittest
+import tempfile
+import csv
+import os
+import sys
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, create_project_type, create_project, get_all_projects, get_project_platforms_history,
+    EXPORT_CSV_HEADER
+)
+from database.parallel_import import split_csv_ranges, import_projects_parallel
+
+class TestParallelImport(unittest.TestCase):
+    """Testes da divisão em faixas e do pipeline de importação"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.environ['DB_NAME'] = os.path.join(self.temp_dir.name, 'devflow.db')
+        self.csv_path = os.path.join(self.temp_dir.name, 'projetos.csv')
+        init_db()
+        self.type_id = create_project_type("Tipo Paralelo", "Descrição")
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        self.temp_dir.cleanup()
+
+    def write_csv(self, rows):
+        with open(self.csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_CSV_HEADER)
+            writer.writerows(rows)
+
+    def test_ranges_end_on_record_boundaries(self):
+        """Testa que quebras de linha e aspas dentro de campos não cortam registros"""
+        self.write_csv([
+            ['', f"Projeto {i}", f'Linha 1\nLinha 2 com "aspas"\n', "Tipo Paralelo", "2026-01-04", '', "Planejamento", '', '']
+            for i in range(200)
+        ])
+        with open(self.csv_path, 'rb') as f:
+            data_start = len(f.readline())
+            f.seek(0)
+            content = f.read()
+
+        ranges = split_csv_ranges(self.csv_path, data_start, chunk_bytes=100)
+        self.assertGreater(len(ranges), 10)
+        self.assertEqual(ranges[0][0], data_start)
+        self.assertEqual(ranges[-1][1], len(content))
+        for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, next_start)
+        total_rows = 0
+        for start, end in ranges:
+            rows = list(csv.reader(content[start:end].decode('utf-8').splitlines(keepends=True)))
+            self.assertTrue(all(len(row) == len(EXPORT_CSV_HEADER) for row in rows))
+            total_rows += len(rows)
+        self.assertEqual(total_rows, 200)
+
+    def test_import_validates_and_writes_in_order(self):
+        """Testa a importação com erros de validação, nomes repetidos e nomes já cadastrados"""
+        create_project("Projeto Existente", "Descrição", self.type_id, "2026-01-04")
+        rows = [['', f"Projeto {i}", "Descrição", "Tipo Paralelo", "2026-01-04", '', "Planejamento", '', '']
+                for i in range(300)]
+        rows.append(['', "Projeto 5", "Repetido", "Tipo Paralelo", "2026-01-04", '', "Planejamento", '', ''])
+        rows.append(['', "Projeto Existente", "", "Tipo Paralelo", "2026-01-04", '', "Planejamento", '', ''])
+        rows.append(['', "Projeto Datas", "", "Tipo Paralelo", "2026-02-01", "2026-01-01", "Planejamento", '', ''])
+        rows.append(['', "Projeto Sem Tipo", "", "Tipo Inexistente", "2026-01-04", '', "Planejamento", '', ''])
+        self.write_csv(rows)
+
+        imported_count, errors = import_projects_parallel(self.csv_path, workers=2, chunk_bytes=2048)
+        self.assertEqual(imported_count, 300)
+        self.assertEqual(len(errors), 4)
+        # Faixas anteriores já foram gravadas quando a repetição chega ao escritor
+        self.assertIn("Projeto 'Projeto 5' ignorado: Já existe um projeto com este nome", errors)
+        self.assertIn("Projeto 'Projeto Existente' ignorado: Já existe um projeto com este nome", errors)
+
+        projects = {p.name: p for p in get_all_projects()}
+        self.assertEqual(len(projects), 301)
+        self.assertEqual(projects["Projeto 5"].description, "Descrição")
+        self.assertEqual(len(get_project_platforms_history(projects["Projeto 299"].id)), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Testes para o diretório de pessoas e a carga de trabalho dos colaboradores
+"""
+import unittest
+import tempfile
+import sqlite3
+import os
+import sys
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, get_db_path, create_project_type, create_project, update_project,
+    add_collaborator_to_project, get_project_collaborators, get_all_people,
+    get_person_projects, get_people_workload
+)
+
+class TestPeopleDirectory(unittest.TestCase):
+    """Testes para a tabela people e as consultas por pessoa"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Configurar variáveis de ambiente para usar o banco temporário
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+        self.project_type_id = create_project_type("Tipo de Teste Pessoas", "Descrição")
+        self.project_ids = [
+            create_project(f"Projeto Pessoas {i}", "Descrição", self.project_type_id, f"2026-01-0{i + 1}")
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def test_collaborators_share_person_by_email(self):
+        """Testa que o mesmo e-mail em projetos diferentes aponta para a mesma pessoa"""
+        first_id = add_collaborator_to_project(self.project_ids[0], "Ana Souza", "ana@email.com")
+        add_collaborator_to_project(self.project_ids[1], "Ana", " ANA@email.com ", "administrador")
+        # Repetir a pessoa no mesmo projeto apenas atualiza a função
+        again_id = add_collaborator_to_project(self.project_ids[0], "Ana Souza", "ana@email.com", "observador")
+
+        self.assertEqual(first_id, again_id)
+        self.assertEqual(len(get_all_people()), 1)
+        collaborators = get_project_collaborators(self.project_ids[0])
+        self.assertEqual(len(collaborators), 1)
+        self.assertEqual(collaborators[0]['role'], "observador")
+
+        person_id = collaborators[0]['person_id']
+        self.assertEqual({p['id'] for p in get_person_projects(person_id)}, set(self.project_ids[:2]))
+
+    def test_people_workload(self):
+        """Testa a contagem de projetos ativos e totais por pessoa"""
+        for project_id in self.project_ids:
+            add_collaborator_to_project(project_id, "Ana", "ana@email.com")
+        add_collaborator_to_project(self.project_ids[0], "Bruno")
+        project_id = self.project_ids[2]
+        update_project(project_id, "Projeto Pessoas 2", "Descrição", self.project_type_id,
+                       "2026-01-03", None, "Concluído")
+
+        workload = {w['name']: w for w in get_people_workload()}
+        self.assertEqual(workload['Ana']['active_projects'], 2)
+        self.assertEqual(workload['Ana']['total_projects'], 3)
+        self.assertEqual(workload['Bruno']['active_projects'], 1)
+        self.assertEqual(get_people_workload()[0]['name'], "Ana")
+
+    def test_migration_deduplicates_legacy_rows(self):
+        """Testa a migração de colaboradores em texto livre para o diretório de pessoas"""
+        conn = sqlite3.connect(get_db_path())
+        conn.executemany(
+            "INSERT INTO project_collaborators (project_id, user_name, user_email, role) VALUES (?, ?, ?, ?)",
+            [
+                (self.project_ids[0], "Ana", "ana@email.com", "member"),
+                (self.project_ids[1], "Ana Souza", "Ana@Email.com", "member"),
+                (self.project_ids[0], "Carlos", None, "member"),
+                (self.project_ids[1], "carlos ", "", "member"),
+            ]
+        )
+        conn.commit()
+        conn.close()
+
+        # Linhas duplicadas no mesmo projeto violariam o índice único: são removidas.
+        # O nome da pessoa vem da linha mais recente do e-mail
+        conn = sqlite3.connect(get_db_path())
+        conn.execute("DROP INDEX idx_project_collaborators_project_person")
+        conn.execute(
+            "INSERT INTO project_collaborators (project_id, user_name, user_email) VALUES (?, ?, ?)",
+            (self.project_ids[0], "Ana Souza", "ana@email.com")
+        )
+        conn.commit()
+        conn.close()
+
+        init_db()
+
+        people = {p['name']: p for p in get_all_people()}
+        self.assertEqual(set(people), {"Ana Souza", "Carlos"})
+        self.assertEqual(people["Ana Souza"]['email'], "ana@email.com")
+        self.assertEqual(len(get_person_projects(people["Ana Souza"]['id'])), 2)
+        self.assertEqual(len(get_person_projects(people["Carlos"]['id'])), 2)
+        self.assertEqual(len(get_project_collaborators(self.project_ids[0])), 2)
+
+    def test_migration_skipped_once_index_exists(self):
+        """Testa que init_db() não reprocessa colaboradores depois da migração"""
+        conn = sqlite3.connect(get_db_path())
+        conn.execute(
+            "INSERT INTO project_collaborators (project_id, user_name, user_email) VALUES (?, ?, ?)",
+            (self.project_ids[0], "Externo", "externo@email.com")
+        )
+        conn.commit()
+        conn.close()
+
+        init_db()
+
+        conn = sqlite3.connect(get_db_path())
+        self.assertEqual(
+            conn.execute("SELECT COUNT(*) FROM project_collaborators WHERE person_id IS NULL").fetchone()[0], 1
+        )
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM people").fetchone()[0], 0)
+        conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
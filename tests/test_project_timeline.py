@@ -0,0 +1,100 @@
+# tests/test_project_timeline.py
+"""
+Testes da montagem do HTML da linha do tempo de plataformas
+"""
+import unittest
+import tempfile
+import os
+import sys
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, get_db_call_count, create_project_type, create_project, create_platform, add_platform_to_project
+)
+from components.project_timeline import build_timeline_html, get_timeline_html, HEAD_ENTRIES
+
+def make_history(count):
+    """Histórico de plataformas ordenado por data"""
+    return [
+        {'id': i, 'platform_name': f"Plataforma {i}", 'assigned_date': f"2026-01-{i:02d}", 'description': None}
+        for i in range(1, count + 1)
+    ]
+
+class TestProjectTimeline(unittest.TestCase):
+    """Testes de build_timeline_html"""
+
+    def test_short_history_is_not_collapsed(self):
+        """Testa que históricos até max_visible exibem todas as entradas sem <details>"""
+        history = make_history(3)
+        history[0]['description'] = "<script>alert(1)</script>"
+        timeline_html = build_timeline_html(history, max_visible=3)
+        self.assertNotIn('<details', timeline_html)
+        self.assertEqual(timeline_html.count('class="timeline-event"'), 3)
+        self.assertIn('1. Plataforma 1', timeline_html)
+        self.assertIn('3. Plataforma 3', timeline_html)
+        self.assertIn('&lt;script&gt;', timeline_html)
+        self.assertIn('<strong>Descrição:</strong> -', timeline_html)
+
+    def test_long_history_collapses_middle_entries(self):
+        """Testa que as entradas intermediárias ficam dentro de um único <details>"""
+        timeline_html = build_timeline_html(make_history(20), max_visible=6)
+        self.assertEqual(timeline_html.count('class="timeline-event"'), 20)
+        self.assertEqual(timeline_html.count('<details'), 1)
+        head, rest = timeline_html.split('<details', 1)
+        hidden, tail = rest.split('</details>', 1)
+
+        # Primeiras HEAD_ENTRIES entradas e últimas max_visible - HEAD_ENTRIES visíveis
+        self.assertEqual(head.count('class="timeline-event"'), HEAD_ENTRIES)
+        self.assertEqual(tail.count('class="timeline-event"'), 6 - HEAD_ENTRIES)
+        self.assertIn('14 mudanças anteriores ocultas', hidden)
+        self.assertIn('3. Plataforma 3', hidden)
+        self.assertIn('16. Plataforma 16', hidden)
+        self.assertIn('17. Plataforma 17', tail)
+        self.assertTrue(timeline_html.endswith('</div>'))
+
+    def test_small_max_visible_is_clamped(self):
+        """Testa que max_visible menor que HEAD_ENTRIES + 1 ainda fecha o <details>"""
+        for max_visible in range(0, HEAD_ENTRIES + 2):
+            timeline_html = build_timeline_html(make_history(10), max_visible=max_visible)
+            self.assertEqual(timeline_html.count('<details'), 1)
+            self.assertEqual(timeline_html.count('</details>'), 1)
+            tail = timeline_html.split('</details>', 1)[1]
+            self.assertEqual(tail.count('class="timeline-event"'), 1)
+
+class TestTimelineCache(unittest.TestCase):
+    """Testes do cache de renderização por geração de escrita"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def test_render_is_reused_until_the_history_changes(self):
+        """Testa que a linha do tempo em cache custa só a leitura das gerações"""
+        type_id = create_project_type("Tipo Linha do Tempo", "Descrição")
+        project_id = create_project("Projeto Linha do Tempo", "Descrição", type_id, "2026-01-04")
+        first = get_timeline_html(project_id)
+        self.assertEqual(first.count('class="timeline-event"'), 1)
+
+        before = get_db_call_count()
+        self.assertIs(get_timeline_html(project_id), first)
+        self.assertEqual(get_db_call_count() - before, 1)
+
+        platform_id = create_platform("Plataforma Linha do Tempo", "Descrição")
+        add_platform_to_project(project_id, platform_id, "2026-02-01", "Migração")
+        updated = get_timeline_html(project_id)
+        self.assertEqual(updated.count('class="timeline-event"'), 2)
+        self.assertIn('Plataforma Linha do Tempo', updated)
+
+if __name__ == '__main__':
+    unittest.main()
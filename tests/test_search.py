@@ -0,0 +1,128 @@
+"""
+Testes para a busca incremental de projetos do DevFlow Manager
+"""
+import unittest
+import tempfile
+import os
+import sys
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, create_project_type, create_project, create_platform, add_platform_to_project,
+    search_projects, search_projects_faceted, get_db_call_count
+)
+from database.search import ProjectSearchSession
+
+class TestProjectSearchSession(unittest.TestCase):
+    """Testes para o cache de busca por sessão"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Configurar variáveis de ambiente para usar o banco temporário
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+
+        self.project_type_id = create_project_type("Tipo Busca", "Descrição")
+        create_project("Landing Page Verão", "Campanha", self.project_type_id, "2026-01-04")
+        create_project("Lançamento App", "Aplicativo de vendas", self.project_type_id, "2026-01-05")
+        create_project("Portal", "Site com landing integrada", self.project_type_id, "2026-01-06", None, "Testes")
+        self.session = ProjectSearchSession()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def assertSameProjects(self, first, second):
+        self.assertEqual([p.id for p in first], [p.id for p in second])
+
+    def test_extended_query_is_narrowed_in_memory(self):
+        """Testa que termos que estendem o anterior não consultam o banco"""
+        for query in ["la", "lan", "LAND", "landing"]:
+            result = self.session.search(query=query)
+            self.assertSameProjects(result, search_projects(query=query))
+
+        self.assertEqual(self.session.stats['database'], 1)
+        self.assertEqual(self.session.stats['narrowed'], 3)
+
+    def test_broader_query_and_filters_hit_database(self):
+        """Testa que ampliar o termo ou mudar filtros consulta o banco"""
+        self.session.search(query="landing")
+        self.session.search(query="lan")
+        self.session.search(query="lan", status="Testes")
+        self.assertEqual(self.session.stats['database'], 3)
+
+        # Voltar a um termo já buscado usa o resultado em cache
+        self.session.search(query="landing")
+        self.assertEqual(self.session.stats['cached'], 1)
+
+    def test_write_invalidates_cached_results(self):
+        """Testa que uma escrita em projetos descarta os resultados em cache"""
+        self.assertEqual(len(self.session.search(query="land")), 2)
+        create_project("Landing Black Friday", "Campanha", self.project_type_id, "2026-01-07")
+        self.assertEqual(len(self.session.search(query="landi")), 3)
+        self.assertEqual(self.session.stats['database'], 2)
+
+    def test_repeated_search_opens_no_connection(self):
+        """Testa que um acerto usa o instantâneo de gerações do cache, sem abrir conexão"""
+        first = self.session.search(query="portal")
+        before = get_db_call_count()
+        self.assertIs(self.session.search(query="portal"), first)
+        self.assertEqual(len(self.session.search(query="portal integrado")), 0)
+        self.assertEqual(get_db_call_count() - before, 0)
+        self.assertEqual(self.session.stats['cached'], 1)
+
+class TestFacetedSearch(unittest.TestCase):
+    """Testes para a busca com contagens por faceta"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+
+        self.web_type_id = create_project_type("Tipo Faceta Web", "Descrição")
+        self.api_type_id = create_project_type("Tipo Faceta API", "Descrição")
+        self.react_id = create_platform("React Faceta", "Descrição")
+        first = create_project("Site Faceta 1", "Descrição", self.web_type_id, "2026-01-04")
+        create_project("Site Faceta 2", "Descrição", self.web_type_id, "2026-01-05", None, "Testes")
+        create_project("API Faceta", "Descrição", self.api_type_id, "2026-01-06", None, "Testes")
+        add_platform_to_project(first, self.react_id, "2026-02-01")
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def test_facet_counts_exclude_own_filter(self):
+        """Testa que cada faceta ignora apenas o próprio filtro"""
+        result = search_projects_faceted(status="Testes")
+        self.assertEqual(result['total'], 2)
+        self.assertEqual(len(result['projects']), 2)
+        # Contagem por status ignora o filtro de status
+        self.assertEqual(result['facets']['status'], {"Planejamento": 1, "Testes": 2})
+        # Contagem por tipo aplica o filtro de status
+        self.assertEqual(result['facets']['project_type'], {self.web_type_id: 1, self.api_type_id: 1})
+
+        result = search_projects_faceted(query="Site", project_type_id=self.web_type_id, limit=0)
+        self.assertEqual(result['projects'], [])
+        self.assertEqual(result['total'], 2)
+        self.assertEqual(result['facets']['platform'][self.react_id], 1)
+
+    def test_pagination_covers_all_results(self):
+        """Testa que as páginas cobrem os mesmos projetos de search_projects(), sem repetição"""
+        first_page = search_projects_faceted(limit=2)
+        second_page = search_projects_faceted(limit=2, offset=2)
+        ids = [p.id for p in first_page['projects'] + second_page['projects']]
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(set(ids), {p.id for p in search_projects()})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# tests/test_xlsx_export.py
+"""
+Testes da exportação para Excel (.xlsx) em fluxo contínuo
+"""
+import unittest
+import tempfile
+import io
+import os
+import sys
+import tracemalloc
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date
+
+# Adicionar o diretório raiz ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import (
+    init_db, create_project_type, create_project, add_collaborator_to_project, export_projects_to_xlsx
+)
+from utils.xlsx import XlsxWriter, column_letter
+
+NS = {'m': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+def read_sheet(workbook_bytes, number):
+    """Retorna as linhas da planilha como listas de elementos <c>"""
+    with zipfile.ZipFile(io.BytesIO(workbook_bytes)) as archive:
+        root = ET.fromstring(archive.read(f'xl/worksheets/sheet{number}.xml'))
+    return [row.findall('m:c', NS) for row in root.find('m:sheetData', NS)]
+
+class TestXlsxExport(unittest.TestCase):
+    """Testes do gravador .xlsx e da pasta de trabalho exportada"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        # Criar um banco de dados temporário para testes
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        os.environ['DB_NAME'] = self.temp_db.name
+        init_db()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+
+    def test_export_workbook_sheets_and_typed_dates(self):
+        """Testa as planilhas exportadas e as células de data"""
+        type_id = create_project_type("Tipo Excel", "Descrição")
+        project_id = create_project("Projeto <Excel> & Cia", "Descrição", type_id, "2026-01-04", "2026-02-01")
+        add_collaborator_to_project(project_id, "Ana Souza", "ana@example.com", "manager")
+
+        workbook = export_projects_to_xlsx()
+        with zipfile.ZipFile(io.BytesIO(workbook)) as archive:
+            sheets = ET.fromstring(archive.read('xl/workbook.xml')).find('m:sheets', NS)
+            self.assertEqual(
+                [sheet.get('name') for sheet in sheets],
+                ["Projetos", "Histórico de Plataformas", "Colaboradores", "Estatísticas Mensais"]
+            )
+
+        projects = read_sheet(workbook, 1)
+        self.assertEqual(len(projects), 2)
+        name_cell, start_cell = projects[1][1], projects[1][4]
+        self.assertEqual(name_cell.find('m:is/m:t', NS).text, "Projeto <Excel> & Cia")
+        self.assertEqual(start_cell.get('s'), '1')
+        self.assertEqual(int(start_cell.find('m:v', NS).text), (date(2026, 1, 4) - date(1899, 12, 30)).days)
+
+        collaborators = read_sheet(workbook, 3)
+        self.assertEqual(collaborators[1][2].find('m:is/m:t', NS).text, "ana@example.com")
+
+    def test_writer_streams_large_sheets(self):
+        """Testa que a memória usada não cresce com o número de linhas"""
+        self.assertEqual(column_letter(0), 'A')
+        self.assertEqual(column_letter(27), 'AB')
+        rows = ([i, f"Linha {i}", date(2026, 1, 1), None] for i in range(50000))
+        with tempfile.TemporaryFile() as output:
+            tracemalloc.start()
+            with XlsxWriter(output) as workbook:
+                count = workbook.write_sheet("Grande", ["N", "Texto", "Data", "Vazio"], rows)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        self.assertEqual(count, 50000)
+        self.assertLess(peak, 2 * 1024 * 1024)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import streamlit as st
 import os
-from database.connection import get_unread_notifications
+from database.cache import get_unread_notifications
 
 def apply_custom_styles():
     """Aplica estilos personalizados CSS"""
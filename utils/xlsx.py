@@ -0,0 +1,193 @@
+# utils/xlsx.py
+"""
+Gravação de planilhas .xlsx em fluxo contínuo (somente biblioteca padrão)
+
+Cada planilha é escrita linha a linha diretamente em uma entrada do arquivo ZIP, com textos
+inline (sem tabela de strings compartilhadas), de modo que a memória usada não depende do
+número de linhas. As planilhas são escritas uma de cada vez, na ordem em que são adicionadas.
+
+Tipos de célula: int/float viram números, date e datetime viram datas do Excel (número de
+série com formato dd/mm/aaaa), bool vira booleano, None fica vazia e o resto vira texto.
+"""
+import re
+import zipfile
+from datetime import date, datetime
+from xml.sax.saxutils import escape, quoteattr
+
+# Caracteres de controle não permitidos em XML 1.0
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+# Data zero do sistema de datas 1900 do Excel (considerando o falso 29/02/1900)
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+# Limite do Excel para nomes de planilha
+MAX_SHEET_TITLE = 31
+# Linhas acumuladas antes de cada escrita no ZIP
+_WRITE_BATCH_ROWS = 500
+
+# Índices de estilo definidos em _STYLES_XML
+_STYLE_DATE = 1
+_STYLE_DATETIME = 2
+_STYLE_HEADER = 3
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}</Types>'
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="2">'
+    '<numFmt numFmtId="164" formatCode="dd/mm/yyyy"/>'
+    '<numFmt numFmtId="165" formatCode="dd/mm/yyyy hh:mm"/>'
+    '</numFmts>'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+def column_letter(index):
+    """Converte um índice de coluna (0 = A) na letra da coluna do Excel"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _cell_xml(reference, value, style=0):
+    """XML de uma célula; retorna '' para valores vazios"""
+    style_attr = f' s="{style}"' if style else ''
+    if value is None or value == '':
+        return ''
+    if isinstance(value, bool):
+        return f'<c r="{reference}" t="b"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{reference}"{style_attr}><v>{value!r}</v></c>'
+    if isinstance(value, datetime):
+        serial = (value - _EXCEL_EPOCH).total_seconds() / 86400
+        return f'<c r="{reference}" s="{_STYLE_DATETIME}"><v>{serial!r}</v></c>'
+    if isinstance(value, date):
+        serial = (value - _EXCEL_EPOCH.date()).days
+        return f'<c r="{reference}" s="{_STYLE_DATE}"><v>{serial}</v></c>'
+    text = escape(_INVALID_XML_CHARS.sub('', str(value)))
+    return f'<c r="{reference}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{text}</t></is></c>'
+
+class XlsxWriter:
+    """
+    Pasta de trabalho .xlsx gravada em fluxo contínuo
+
+    Uso:
+        with XlsxWriter(caminho_ou_arquivo_binário) as workbook:
+            workbook.write_sheet("Projetos", cabeçalho, linhas)
+    """
+
+    def __init__(self, output):
+        self._zip = zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._titles = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_sheet(self, title, header, rows):
+        """
+        Escreve uma planilha com cabeçalho em negrito (fixo ao rolar) e as linhas do iterável
+
+        Returns:
+            Número de linhas de dados escritas
+        """
+        title = re.sub(r'[\[\]:*?/\\]', ' ', title)[:MAX_SHEET_TITLE]
+        if title in self._titles:
+            raise ValueError(f"Planilha repetida: {title}")
+        self._titles.append(title)
+        references = [column_letter(i) for i in range(len(header))]
+
+        count = 0
+        with self._zip.open(f'xl/worksheets/sheet{len(self._titles)}.xml', 'w', force_zip64=True) as sheet:
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                '<sheetViews><sheetView workbookViewId="0">'
+                '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+                '</sheetView></sheetViews><sheetData>'
+                '<row r="1">' + ''.join(
+                    _cell_xml(f'{reference}1', value, _STYLE_HEADER) for reference, value in zip(references, header)
+                ) + '</row>'
+            ).encode('utf-8'))
+            buffer = []
+            for row in rows:
+                count += 1
+                row_number = count + 1
+                buffer.append(f'<row r="{row_number}">' + ''.join(
+                    _cell_xml(f'{reference}{row_number}', value) for reference, value in zip(references, row)
+                ) + '</row>')
+                if len(buffer) >= _WRITE_BATCH_ROWS:
+                    sheet.write(''.join(buffer).encode('utf-8'))
+                    buffer.clear()
+            buffer.append('</sheetData></worksheet>')
+            sheet.write(''.join(buffer).encode('utf-8'))
+        return count
+
+    def close(self):
+        """Escreve o índice da pasta de trabalho e fecha o arquivo"""
+        if self._zip is None:
+            return
+        sheets = range(1, len(self._titles) + 1)
+        self._zip.writestr('[Content_Types].xml', _CONTENT_TYPES_XML.format(sheets=''.join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in sheets
+        )))
+        self._zip.writestr('_rels/.rels', _ROOT_RELS_XML)
+        self._zip.writestr('xl/workbook.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            + ''.join(
+                f'<sheet name={quoteattr(title)} sheetId="{i}" r:id="rId{i}"/>'
+                for i, title in enumerate(self._titles, start=1)
+            ) + '</sheets></workbook>'
+        ))
+        self._zip.writestr('xl/_rels/workbook.xml.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + ''.join(
+                f'<Relationship Id="rId{i}" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                f'Target="worksheets/sheet{i}.xml"/>'
+                for i in sheets
+            ) + f'<Relationship Id="rId{len(self._titles) + 1}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+            'Target="styles.xml"/></Relationships>'
+        ))
+        self._zip.writestr('xl/styles.xml', _STYLES_XML)
+        self._zip.close()
+        self._zip = None